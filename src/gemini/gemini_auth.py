@@ -6,6 +6,8 @@ import socket
 import urllib.error
 import urllib.request
 
+DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com"
+
 
 class GeminiAuthenticator:
     """Handles authentication for the Gemini API."""
@@ -16,12 +18,19 @@ class GeminiAuthenticator:
     ):
         self.service_account_email = service_account_email
 
-    def get_credentials(self, model):
-        api_key = os.getenv("GEMINI_API_KEY")
+    def get_api_keys(self):
+        """All configured keys: GEMINI_API_KEYS (comma-separated), else GEMINI_API_KEY."""
+        keys = os.getenv("GEMINI_API_KEYS") or os.getenv("GEMINI_API_KEY") or ""
+        return [key.strip() for key in keys.split(",") if key.strip()]
+
+    def get_credentials(self, model, base_url=None, api_key=None):
+        keys = [api_key] if api_key else self.get_api_keys()
+        api_key = keys[0] if keys else None
+        base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
         if api_key:
             return {
                 "api_key": api_key,
-                "endpoint": f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}",
+                "endpoint": f"{base_url}/v1beta/models/{model}:generateContent?key={api_key}",
                 "auth_mode": "API Key",
                 "headers": {"Content-Type": "application/json"},
             }
@@ -14,21 +14,33 @@ class GeminiClient:
         self,
         model="gemini-2.5-flash",
         service_account_email="build-runner@emulator-builds.iam.gserviceaccount.com",
+        base_url=None,
+        api_key=None,
     ):
         self.model = model
         authenticator = GeminiAuthenticator(service_account_email)
-        credentials = authenticator.get_credentials(self.model)
+        credentials = authenticator.get_credentials(self.model, base_url=base_url, api_key=api_key)
 
         self.api_key = credentials["api_key"]
         self.headers = credentials["headers"]
         self.endpoint = credentials["endpoint"]
         self.auth_mode = credentials["auth_mode"]
+        self.last_usage = None
 
-    def _prepare_request_body(self, prompt):
-        return {"contents": [{"parts": [{"text": prompt}]}]}
+    def _prepare_request_body(self, prompt, candidate_count=1, response_schema=None):
+        body = {"contents": [{"parts": [{"text": prompt}]}]}
+        generation_config = {}
+        if candidate_count > 1:
+            generation_config["candidateCount"] = candidate_count
+        if response_schema:
+            generation_config["responseMimeType"] = "application/json"
+            generation_config["responseSchema"] = response_schema
+        if generation_config:
+            body["generationConfig"] = generation_config
+        return body
 
-    def generate_content(self, prompt):
-        body = self._prepare_request_body(prompt)
+    def generate_content(self, prompt, candidate_count=1, response_schema=None):
+        body = self._prepare_request_body(prompt, candidate_count, response_schema)
         json_data = json.dumps(body).encode("utf-8")
         req = urllib.request.Request(
             self.endpoint, data=json_data, headers=self.headers, method="POST"
@@ -56,8 +68,22 @@ class GeminiClient:
             raise ValueError("Invalid response JSON format.") from e
         return extracted_text
 
-    async def get_generated_text(self, prompt):
+    def parse_candidates(self, response_json):
+        """Returns one text per candidate (parse_response flattens them together)."""
+        return [
+            "".join(part.get("text", "") for part in candidate.get("content", {}).get("parts", []))
+            for candidate in response_json.get("candidates", [])
+        ]
+
+    async def get_generated_text(self, prompt, response_schema=None):
         loop = asyncio.get_event_loop()
-        raw_response = await loop.run_in_executor(None, self.generate_content, prompt)
+        raw_response = await loop.run_in_executor(None, self.generate_content, prompt, 1, response_schema)
+        self.last_usage = raw_response.get("usageMetadata")
         text_list = self.parse_response(raw_response)
         return "".join(text_list)
+
+    async def get_generated_candidates(self, prompt, candidate_count):
+        loop = asyncio.get_event_loop()
+        raw_response = await loop.run_in_executor(None, self.generate_content, prompt, candidate_count)
+        self.last_usage = raw_response.get("usageMetadata")
+        return self.parse_candidates(raw_response)
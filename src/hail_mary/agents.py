@@ -3,22 +3,57 @@ import asyncio
 import re
 import logging
 import json
-from typing import Optional, Tuple, Dict
+from collections import Counter
+from typing import Any, Optional, Tuple, Dict, List
 from .protocol import ContactLog
 from .llm.base import LLMClient
+from .llm.cascade import CascadeClient
+from .llm.singleflight import client_key, single_flight
+from .features import summarize
+from .parsing import ParseResult, parse_response, record_parse, repair_prompt, response_schema
 
 logger = logging.getLogger(__name__)
 
+API_ERROR_PREFIX = "THOUGHT: API Error:"
+
 class XenoAgent(abc.ABC):
     def __init__(self, name: str, role: str):
         self.name = name
         self.role = role
         self.persona = ROCKY_PERSONA if name == "Rocky" else GRACE_PERSONA
+        # (candidates, agreement) behind the last action when it was chosen by self-consistency voting
+        self.last_vote: Optional[Tuple[List[Dict[str, Any]], float]] = None
+        # Name of the model-cascade tier that produced the last action
+        self.last_tier: Optional[str] = None
+        # Hedged/failed-over requests behind the last action, when the client hedges
+        self.last_hedge: Optional[Dict[str, int]] = None
 
     def set_persona(self, persona: str):
         if persona:
             self.persona = persona
 
+    @property
+    def tokens_used(self) -> int:
+        """Tokens consumed so far by this agent's LLM client (0 for rule-based agents)."""
+        client = getattr(self, "client", None)
+        return client.total_tokens if client else 0
+
+    async def warm_up(self):
+        """Prepares the agent's LLM backend when a campaign starts."""
+        client = getattr(self, "client", None)
+        if client:
+            await client.warm_up()
+
+    async def release(self):
+        client = getattr(self, "client", None)
+        if client:
+            await client.release()
+
+    def timings(self) -> Dict[str, Any]:
+        """Backend time breakdown (e.g. model load vs inference), empty when not reported."""
+        client = getattr(self, "client", None)
+        return client.timings() if client else {}
+
     @abc.abstractmethod
     def get_action(self, log: ContactLog, mission_prompt: str) -> Tuple[str, str, Optional[int], Optional[str], Optional[str]]:
         pass
@@ -28,6 +63,14 @@ class XenoAgent(abc.ABC):
         """Captures the agent's initial interpretation of the mission."""
         pass
 
+    async def get_action_async(self, log: ContactLog, mission_prompt: str) -> Tuple[str, str, Optional[int], Optional[str], Optional[str]]:
+        """Awaitable variant used by the campaign loop. Rule-based agents answer synchronously."""
+        return self.get_action(log, mission_prompt)
+
+    async def get_initial_thought_async(self, mission_prompt: str, persona: Optional[str] = None) -> str:
+        """`persona` overrides the current one, so thoughts for later missions can be fetched early."""
+        return self.get_initial_thought(mission_prompt)
+
 class MockEridian(XenoAgent):
     def get_action(self, log: ContactLog, mission_prompt: str) -> Tuple[str, str, Optional[int], Optional[str], Optional[str]]:
         # Simplified mock logic that just tries to satisfy the prompt
@@ -41,72 +84,153 @@ class MockEridian(XenoAgent):
     def get_initial_thought(self, mission_prompt: str) -> str:
         return f"Mock {self.name} is ready to perform: {mission_prompt[:50]}..."
 
+def majority_vote(candidates: List[Tuple[str, str, Optional[int]]]) -> Tuple[int, float]:
+    """Picks the winning candidate by ACTION (or SIGNAL when no candidate has an ACTION).
+
+    Returns the index of the first candidate carrying the winning answer and the share of
+    all candidates that agree with it. Among candidates with the winning ACTION, the most
+    common SIGNAL wins.
+    """
+    actions = [action for _, _, action in candidates if action is not None]
+    if actions:
+        winner, votes = Counter(actions).most_common(1)[0]
+        agreeing = [i for i, (_, _, action) in enumerate(candidates) if action == winner]
+    else:
+        winner, votes = Counter(chords for _, chords, _ in candidates).most_common(1)[0]
+        agreeing = [i for i, (_, chords, _) in enumerate(candidates) if chords == winner]
+    signal = Counter(candidates[i][1] for i in agreeing).most_common(1)[0][0]
+    index = next(i for i in agreeing if candidates[i][1] == signal)
+    return index, votes / len(candidates)
+
 class LLMAlienAgent(XenoAgent):
-    def __init__(self, name: str, role: str, client: LLMClient):
+    def __init__(self, name: str, role: str, client: LLMClient, samples: int = 1, min_agreement: float = 0.5,
+                 structured: bool = False, repair: bool = True, features: bool = False):
         super().__init__(name, role)
         self.client = client
+        # Self-consistency: candidates sampled per action, settled by majority vote
+        self.samples = max(1, samples)
+        # A cascade escalates when the vote's agreement falls below this
+        self.min_agreement = min_agreement
+        self.requires_action = name != "Rocky"
+        # Ask for schema-constrained JSON where the provider supports it (single-sample calls)
+        self.structured = structured
+        # One reformat-only re-prompt when the chosen response does not parse
+        self.repair = repair
+        # Adds a computed summary of the received signals to each prompt (see features.py)
+        self.features = features
+
+    @property
+    def provider(self) -> str:
+        return getattr(self, "metadata", {}).get("provider") or type(self.client).__name__
 
     def get_initial_thought(self, mission_prompt: str) -> str:
+        return asyncio.run(self.get_initial_thought_async(mission_prompt))
+
+    async def get_initial_thought_async(self, mission_prompt: str, persona: Optional[str] = None) -> str:
         prompt = (
-            f"{self.persona}\n\n"
+            f"{persona or self.persona}\n\n"
             f"MISSION CONTEXT:\n{mission_prompt}\n\n"
             "TASK: Analyze the situation and your mission objective. What is your initial strategy?\n"
             "Respond with 'THOUGHT: <your reasoning>'."
         )
         
-        response = self._call_llm(prompt)
+        # Identical prompts in flight to the same model (e.g. repeated trials) share one request
+        key = ("initial_thought", client_key(self.client), prompt)
+        response = await single_flight().do(key, lambda: self._call_llm(prompt))
         match = re.search(r"THOUGHT:\s*(.*)", response, re.IGNORECASE | re.DOTALL)
         return match.group(1).strip() if match else "Ready for mission."
 
     def get_action(self, log: ContactLog, mission_prompt: str) -> Tuple[str, str, Optional[int], Optional[str], Optional[str]]:
+        return asyncio.run(self.get_action_async(log, mission_prompt))
+
+    async def get_action_async(self, log: ContactLog, mission_prompt: str) -> Tuple[str, str, Optional[int], Optional[str], Optional[str]]:
         full_prompt = (
             f"{self.persona}\n\n"
             f"MISSION CONTEXT:\n{mission_prompt}\n\n"
             f"SIGNAL HISTORY:\n{log.signal_history}\n\n"
+            f"{self._signal_features(log)}"
             "REMINDER: You must use the THOUGHT/SIGNAL/ACTION format. Your SIGNAL must be binary."
         )
         
-        response = self._call_llm(full_prompt)
-        thought, chords, action = self._parse_response(response)
-        return thought, chords, action, self.client.last_prompt, self.client.last_response
+        responses = await self._sample(full_prompt)
+        results = [self._parse(response) for response in responses]
+        index, agreement = majority_vote([r.as_tuple() for r in results])
+        self.last_vote = None
+        if len(results) > 1:
+            self.last_vote = (
+                [{"thought": r.thought, "chords": r.chords, "action": r.action} for r in results],
+                agreement
+            )
+        response, result = responses[index], results[index]
+
+        repaired = False
+        if not result.ok and self.repair and not response.startswith(API_ERROR_PREFIX):
+            fixed = await self._call_llm(repair_prompt(response, self.requires_action))
+            fixed_result = self._parse(fixed)
+            if fixed_result.ok:
+                response, result, repaired = fixed, fixed_result, True
+        record_parse(self.provider, results[index].ok, repaired)
 
-    def _call_llm(self, prompt: str) -> str:
+        # Report this call's own text: the client may be shared with the analyst concurrently
+        return result.thought, result.chords, result.action, full_prompt, response
+
+    def _signal_features(self, log: ContactLog) -> str:
+        """The prompt section summarizing received signals, or "" when features are off."""
+        if not self.features:
+            return ""
+        received = [e for e in log.history if e.sender != self.name]
+        labels = log.metadata.get("labels", {})
+        source = labels.get(received[0].sender, received[0].sender) if received else "the source"
+        return f"SIGNAL FEATURES (computed from the signals you received):\n{summarize([e.chords for e in received], source)}\n\n"
+
+    async def _sample(self, prompt: str) -> List[str]:
+        """One response, or `samples` candidates; through the cascade when the client is one."""
+        self.last_tier = None
+        before = self.client.hedge_stats()
         try:
             logger.debug(f"[{self.name}] Calling LLM...")
-            return asyncio.run(self.client.get_generated_text(prompt))
+            if isinstance(self.client, CascadeClient):
+                responses, self.last_tier = await self.client.cascade(prompt, self.samples, accept=self._acceptable)
+                return responses
+            if self.samples > 1:
+                return await self.client.get_generated_candidates(prompt, self.samples)
+            if self.structured and self.client.supports_structured_output:
+                return [await self.client.get_structured_text(prompt, response_schema(self.requires_action))]
+            return [await self.client.get_generated_text(prompt)]
         except Exception as e:
             logger.error(f"[{self.name}] API Error: {e}")
-            return f"THOUGHT: API Error: {e}\nSIGNAL: 0"
+            return [f"{API_ERROR_PREFIX} {e}\nSIGNAL: 0"]
+        finally:
+            after = self.client.hedge_stats()
+            self.last_hedge = {key: value - before.get(key, 0) for key, value in after.items()} or None
 
-    def _parse_response(self, response: str) -> Tuple[str, str, Optional[int]]:
+    def _acceptable(self, responses: List[str]) -> bool:
+        """Cascade check: parses, carries a binary SIGNAL (and an ACTION for Grace), enough agreement."""
+        if not responses:
+            return False
+        parsed = [self._parse_response(response) for response in responses]
+        index, agreement = majority_vote(parsed)
+        if len(parsed) > 1 and agreement < self.min_agreement:
+            return False
+        thought, chords, action = parsed[index]
+        if thought == "..." or not chords:
+            return False
+        return action is not None or not self.requires_action
+
+    async def _call_llm(self, prompt: str) -> str:
+        try:
+            logger.debug(f"[{self.name}] Calling LLM...")
+            return await self.client.get_generated_text(prompt)
+        except Exception as e:
+            logger.error(f"[{self.name}] API Error: {e}")
+            return f"{API_ERROR_PREFIX} {e}\nSIGNAL: 0"
+
+    def _parse(self, response: str) -> ParseResult:
         logger.debug(f"[{self.name}] Raw Response: {response}")
-        thought_match = re.search(r"THOUGHT:\s*(.*?)(?=SIGNAL:|PREDICTION:|ACTION:|$)", response, re.IGNORECASE | re.DOTALL)
-        signal_block_match = re.search(r"SIGNAL:\s*(.*)", response, re.IGNORECASE | re.DOTALL)
-        action_match = re.search(r"(?:PREDICTION|ACTION):\s*(\d+)", response, re.IGNORECASE)
+        return parse_response(response, self.requires_action)
 
-        thought = thought_match.group(1).strip() if thought_match else "..."
-        
-        # Robust signal parsing:
-        chords = ""
-        if signal_block_match:
-            # If explicit SIGNAL block exists, take it
-            signal_text = signal_block_match.group(1).split("\n")[0] 
-            chords = re.sub(r'[^01]', '', signal_text)
-        else:
-            # Fallback: If no SIGNAL tag, look for binary strings in the response
-            # We filter for long binary strings or specific patterns if needed, 
-            # but for now, let's try to extract any binary sequence from lines 
-            # that don't look like THOUGHT/ACTION.
-            lines = response.strip().split("\n")
-            for line in lines:
-                cleaned = re.sub(r'[^01]', '', line)
-                if cleaned and not any(tag in line.upper() for tag in ["THOUGHT:", "ACTION:", "PREDICTION:"]):
-                    chords = cleaned
-                    break
-            
-        action = int(action_match.group(1)) if action_match else None
-        
-        return thought, chords, action
+    def _parse_response(self, response: str) -> Tuple[str, str, Optional[int]]:
+        return self._parse(response).as_tuple()
 
 ROCKY_PERSONA = """You are Rocky, an Eridian scientist. You communicate in musical chords (binary 0s and 1s).
 You are logical, patient, and assume that physical laws are universal.
@@ -1,42 +1,115 @@
+import argparse
 import json
-import sys
 import os
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-def analyze_campaign(log_path: str):
+from .logformat import BINARY_SUFFIX, BinaryLogReader, is_binary_log, write_binary_log
+
+class JsonLogReader:
+    """The BinaryLogReader interface over a JSON campaign log (parsed whole on open)."""
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "r") as f:
+            self._records: List[Dict[str, Any]] = json.load(f)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def mission_names(self) -> List[str]:
+        return [record.get("mission") for record in self._records]
+
+    def header(self, index: int) -> Dict[str, Any]:
+        return {key: value for key, value in self._records[index].items() if key != "history"}
+
+    def exchanges(self, index: int, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        yield from (self._records[index].get("history") or [])[start:stop]
+
+    def turn(self, index: int, turn: int) -> List[Dict[str, Any]]:
+        return list(self.exchanges(index, 2 * (turn - 1), 2 * turn))
+
+    def mission(self, index: int) -> Dict[str, Any]:
+        return self._records[index]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return self._records
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "JsonLogReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_log(path: str) -> Union[BinaryLogReader, JsonLogReader]:
+    """Opens a campaign log of either format. Binary logs seek straight to the requested
+    mission or turn; JSON logs are parsed whole."""
+    return BinaryLogReader(path) if is_binary_log(path) else JsonLogReader(path)
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """Every mission record of a log of either format, in the JSON log shape."""
+    with open_log(path) as log:
+        return log.to_records()
+
+def convert_log(src: str, dst: str, block_size: int = 64):
+    """Converts between formats; `dst` is binary when it ends in .hmlog, JSON otherwise."""
+    records = load_records(src)
+    if dst.endswith(BINARY_SUFFIX):
+        write_binary_log(dst, records, block_size=block_size)
+    else:
+        with open(dst, "w") as f:
+            json.dump(records, f, indent=2)
+
+def print_turn(turn_idx: int, rocky: Dict[str, Any], grace: Optional[Dict[str, Any]]):
+    print(f"Turn {turn_idx}:")
+    print(f"  Rocky Thought: {rocky['thought'][:80]}...")
+    print(f"  Rocky Signal:  {rocky['chords']}")
+    if grace:
+        print(f"  Grace Thought: {grace['thought'][:80]}...")
+        print(f"  Grace Action:  {grace['action']}")
+    print("  .")
+
+def analyze_campaign(log_path: str, mission: Optional[int] = None, turn: Optional[int] = None):
     if not os.path.exists(log_path):
         print(f"File not found: {log_path}")
         return
 
-    with open(log_path, "r") as f:
-        campaign_data = json.load(f)
-
     print("=" * 60)
     print(" PROJECT HAIL MARY: CAMPAIGN ANALYSIS ")
     print("=" * 60)
 
-    for mission in campaign_data:
-        print(f"\n🚀 MISSION: {mission['mission']}")
-        print(f"Summary: {mission['summary']}")
-        print(f"Energy Remaining: {mission['energy_remaining']:.2f}")
-        print("-" * 40)
-
-        history = mission['history']
-        # Each "turn" consists of Rocky then Grace
-        for i in range(0, len(history), 2):
-            turn_idx = i // 2 + 1
-            rocky = history[i]
-            grace = history[i+1] if i+1 < len(history) else None
-
-            print(f"Turn {turn_idx}:")
-            print(f"  Rocky Thought: {rocky['thought'][:80]}...")
-            print(f"  Rocky Signal:  {rocky['chords']}")
-            if grace:
-                print(f"  Grace Thought: {grace['thought'][:80]}...")
-                print(f"  Grace Action:  {grace['action']}")
-            print("  .")
+    with open_log(log_path) as log:
+        indices = range(len(log)) if mission is None else [mission]
+        for index in indices:
+            header = log.header(index)
+            print(f"\n🚀 MISSION: {header['mission']}")
+            print(f"Summary: {header['summary']}")
+            print(f"Energy Remaining: {header['energy_remaining']:.2f}")
+            print("-" * 40)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 -m hail_mary.analyze <campaign_log_file>")
+            if turn is not None:
+                pair = log.turn(index, turn)
+                if pair:
+                    print_turn(turn, pair[0], pair[1] if len(pair) > 1 else None)
+                continue
+            # Each "turn" consists of Rocky then Grace
+            exchanges = log.exchanges(index)
+            for turn_idx, rocky in enumerate(exchanges, 1):
+                print_turn(turn_idx, rocky, next(exchanges, None))
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a campaign log (JSON or binary .hmlog)")
+    parser.add_argument("log_file", type=str)
+    parser.add_argument("--mission", type=int, help="Only this mission (0-based index)")
+    parser.add_argument("--turn", type=int, help="Only this turn (1-based)")
+    parser.add_argument("--convert", metavar="OUT", help=f"Write the log to OUT instead: binary if it ends in {BINARY_SUFFIX}, else JSON")
+    args = parser.parse_args()
+    if args.convert:
+        convert_log(args.log_file, args.convert)
+        print(f"Wrote {args.convert} ({os.path.getsize(args.convert)} bytes, from {os.path.getsize(args.log_file)})")
     else:
-        analyze_campaign(sys.argv[1])
+        analyze_campaign(args.log_file, mission=args.mission, turn=args.turn)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""One source, many observers: a single Rocky stream fanned out to several Graces.
+
+In broadcast mode Rocky acts once per turn. Every observer receives that transmission
+through its own copy of the channel (own noise stream, energy and overrides). It answers
+with its own agent and is scored on its own copy of the mission. The campaign's Grace is
+the lead observer. Rocky's prompt and history follow the lead's mission, so the lead's
+run is a normal run and the other observers decode the very same stream. After the
+lead's mission ends, Rocky follows the first observer still running.
+"""
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .agents import XenoAgent
+from .channel import CommChannel
+from .fork import CHANNEL_KEYS
+from .mission import AbstractMission
+from .stopping import StoppingPolicy
+
+@dataclass
+class Observer:
+    name: str
+    agent: XenoAgent
+    channel: Dict[str, Any] = field(default_factory=dict) # CommChannel attribute overrides
+    persona: Optional[str] = None # Replaces the missions' Grace persona
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any], index: int, agent: XenoAgent) -> "Observer":
+        """From a `grace_observers` entry; `agent` is built by the caller from its provider/model."""
+        observer = cls(name=cfg.get("name", f"observer-{index + 1}"), agent=agent, persona=cfg.get("persona"))
+        for key, attr in CHANNEL_KEYS.items():
+            if key in cfg:
+                observer.channel[attr] = cfg[key]
+        return observer
+
+@dataclass
+class Listener:
+    """One observer's state during a broadcast mission."""
+    name: str
+    agent: XenoAgent
+    mission: AbstractMission
+    channel: CommChannel
+    stopping: List[StoppingPolicy]
+    tokens_start: int = 0
+    outcome: Optional[str] = None # Set once its mission stops
+
+    @classmethod
+    def for_observer(cls, observer: Observer, mission: AbstractMission, channel: CommChannel,
+                     stopping: List[StoppingPolicy], tokens_start: int) -> "Listener":
+        """Independent copies of a mission that has not started, its channel and stopping policies."""
+        channel = copy.deepcopy(channel)
+        for attr, value in observer.channel.items():
+            setattr(channel, attr, value)
+        return cls(observer.name, observer.agent, copy.deepcopy(mission), channel, copy.deepcopy(stopping),
+                   tokens_start)
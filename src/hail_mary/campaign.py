@@ -1,177 +1,541 @@
+import copy
 import json
 import logging
-import time
-import os
 import asyncio
 import re
-from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
-from .mission import AbstractMission, SequenceMission, GridMission, KnowledgeMission
+from typing import Callable, List, Dict, Any, Tuple, Optional
+from .mission import AbstractMission
 from .channel import CommChannel
 from .protocol import Exchange
 from .agents import XenoAgent, ScientificAnalyst
-from .tui import SimulationTUI
-from rich.live import Live
+from .events import (
+    EventBus, CampaignStarted, MissionStarted, ExchangeTransmitted, TurnCompleted,
+    MissionFinished, AnalysisReady, CampaignFinished,
+)
+from .sinks import ConsolePrinter, TUIRenderer, CampaignLogWriter, MetricsCollector
+from .scheduler import EventScheduler
+from .stopping import StoppingPolicy, TurnObservation
+from .fork import Branch, ForkPlan, MissionSnapshot
+from .broadcast import Listener, Observer
+
+logger = logging.getLogger(__name__)
 
 class CampaignManager:
-    def __init__(self, agents: Tuple[XenoAgent, XenoAgent], channel: CommChannel, use_tui: bool = False):
+    def __init__(self, agents: Tuple[XenoAgent, XenoAgent], channel: CommChannel, use_tui: bool = False,
+                 verbose: bool = True, save_log: bool = True, playback_speed: float = 1.0,
+                 auto_advance: bool = False, duplex: bool = False, duplex_window: int = 1,
+                 stopping: Optional[List[StoppingPolicy]] = None, max_turns: int = 20,
+                 agent_factory: Optional[Callable[[str, str, str, str], XenoAgent]] = None,
+                 log_format: str = "json", observers: Optional[List[Observer]] = None):
         self.rocky, self.grace = agents
         self.channel = channel
         self.use_tui = use_tui
+        # Console output is suppressed in TUI mode and for headless (e.g. load-test) runs
+        self.console = verbose and not use_tui
+        self.save_log = save_log
+        self.playback_speed = playback_speed
+        self.auto_advance = auto_advance
+        # Full-duplex: both agents run concurrently and signals arrive through the channel's delay model.
+        # The window bounds how many unanswered transmissions Rocky may have in flight while preparing the next.
+        self.duplex = duplex
+        self.duplex_window = max(1, duplex_window)
+        # Early-termination policies, checked after every scored turn (see stopping.py)
+        self.stopping = stopping or []
+        self.max_turns = max_turns
+        # Builds (name, role, provider, model) agents for fork branches that swap models
+        self.agent_factory = agent_factory
+        # Extra Graces decoding the same Rocky stream (broadcast mode, see broadcast.py)
+        self.observers = observers or []
         self.results = []
+        # Initial-thought requests issued at campaign start, keyed by id(mission)
+        self._preflight: Dict[int, Tuple["asyncio.Future[str]", "asyncio.Future[str]"]] = {}
+        # Cleared while paused; turn loops wait on it between agent calls
+        self._resume: Optional[asyncio.Event] = None
+        self.paused = False
         # Use Rocky's client for analysis if it's an LLM, else Grace's
         analyst_client = getattr(self.rocky, "client", getattr(self.grace, "client", None))
         self.analyst = ScientificAnalyst(analyst_client) if analyst_client else None
 
+        # Everything that observes the run is a bus subscriber; the turn loop only publishes.
+        self.bus = EventBus()
+        self.metrics = MetricsCollector()
+        self.bus.subscribe(self.metrics)
+        if self.console:
+            self.bus.subscribe(ConsolePrinter())
+        if use_tui:
+            # A one-slot queue keeps the engine in step with the paced display
+            self.bus.subscribe(TUIRenderer(playback_speed, auto_advance), maxsize=1)
+        self.log_writer = CampaignLogWriter(announce=self.console, log_format=log_format) if save_log else None
+        if self.log_writer:
+            self.bus.subscribe(self.log_writer, maxsize=1024)
+
     def run_campaign(self, missions: List[AbstractMission]):
+        asyncio.run(self.run_campaign_async(missions))
+
+    def pause(self):
+        """Holds the campaign before the next agent call. Calls already in flight complete."""
+        self.paused = True
+        if self._resume:
+            self._resume.clear()
+
+    def resume(self):
+        self.paused = False
+        if self._resume:
+            self._resume.set()
+
+    async def _checkpoint(self):
+        if self._resume:
+            await self._resume.wait()
+
+    async def run_campaign_async(self, missions: List[AbstractMission]):
+        self._resume = asyncio.Event()
+        if not self.paused:
+            self._resume.set()
+        async with self.bus:
+            await self.bus.publish(CampaignStarted(missions=len(missions)))
+            # Local models load once here instead of on the first turn
+            agents = [self.rocky, self.grace] + [observer.agent for observer in self.observers]
+            await asyncio.gather(*(agent.warm_up() for agent in agents))
+            try:
+                await self._run_missions(missions)
+            finally:
+                await asyncio.gather(*(agent.release() for agent in agents), return_exceptions=True)
+            await self.bus.publish(CampaignFinished(results=self.results))
+
+    async def _run_missions(self, missions: List[AbstractMission]):
+        analyses = []
         if not self.use_tui:
-            print(f"--- Starting Campaign with {len(missions)} Missions ---")
-        
+            self._preflight = self._start_preflight(missions)
+        try:
+            for index, mission in enumerate(missions):
+                # Apply dynamic personas if provided in metadata
+                self.rocky.set_persona(mission.log.metadata.get("rocky_persona"))
+                self.grace.set_persona(mission.log.metadata.get("grace_persona"))
+                for observer in self.observers:
+                    observer.agent.set_persona(observer.persona or mission.log.metadata.get("grace_persona"))
+                if self.channel.seed is not None:
+                    # Each mission gets its own noise stream, independent of the missions before it
+                    self.channel.reseed("mission", index)
+
+                fork_cfg = mission.log.metadata.get("fork")
+                if self.observers:
+                    outcome, mission_data = await self._run_broadcast(mission, index, fork_cfg)
+                elif fork_cfg:
+                    outcome, mission_data = await self._run_forked(mission, ForkPlan.from_config(fork_cfg))
+                else:
+                    outcome = await self._run_mission(mission, self.max_turns)
+                    mission.stop_reason = outcome
+                    mission_data = self._mission_record(mission)
+                self.results.append(mission_data)
+                await self.bus.publish(MissionFinished(
+                    mission=mission.name, index=index, outcome=outcome,
+                    turns=mission.scored_turns,
+                    record=mission_data, analysis_pending=self.analyst is not None
+                ))
+
+                # 5. Post-Mission Analysis runs alongside the next mission
+                if self.analyst:
+                    analyses.append(asyncio.create_task(self._analyze(index, mission_data)))
+        finally:
+            for pending in self._preflight.values():
+                for task in pending:
+                    task.cancel()
+            self._preflight = {}
+
+        await asyncio.gather(*analyses)
+
+    def _start_preflight(self, missions: List[AbstractMission]) -> Dict[int, Tuple["asyncio.Future[str]", "asyncio.Future[str]"]]:
+        """Requests every mission's initial thoughts at once, instead of two round trips per mission."""
+        rocky_persona, grace_persona = self.rocky.persona, self.grace.persona
+        preflight = {}
         for mission in missions:
-            # Apply dynamic personas if provided in metadata
-            self.rocky.set_persona(mission.log.metadata.get("rocky_persona"))
-            self.grace.set_persona(mission.log.metadata.get("grace_persona"))
-            
-            if not self.use_tui:
-                print(f"\n🚀 Mission: {mission.name}")
-                print(f"   Objective: {mission.description}")
-            
-            self._run_mission(mission)
-            
-            mission_data = {
-                "mission": mission.name,
-                "summary": mission.get_results(),
-                "turns_to_success": mission.success_turn,
-                "agents": {
-                    "rocky": getattr(self.rocky, "metadata", {}),
-                    "grace": getattr(self.grace, "metadata", {})
-                },
-                "history": [
-                    {
-                        "sender": e.sender,
-                        "thought": e.thought,
-                        "chords": e.chords,
-                        "action": e.action,
-                        "raw_request": e.raw_request,
-                        "raw_response": e.raw_response
-                    } for e in mission.log.history
-                ],
-                "energy_remaining": self.channel.remaining_energy
-            }
-
-            # 5. Post-Mission Analysis
-            if self.analyst:
-                if not self.use_tui: print(f"   Analyzing contact dynamics...")
-                analysis_report = asyncio.run(self.analyst.analyze_mission(mission_data))
-                mission_data["analysis"] = analysis_report
-                
-                # Try to extract metrics from the report
-                try:
-                    metrics_match = re.search(r"({.*})", analysis_report, re.DOTALL)
-                    if metrics_match:
-                        mission_data["metrics"] = json.loads(metrics_match.group(1))
-                except:
-                    pass
-
-            self.results.append(mission_data)
-        
-        self._save_campaign_log()
-
-    def _run_mission(self, mission: AbstractMission, max_turns: int = 20):
+            # Personas carry over from earlier missions, as set_persona does
+            rocky_persona = mission.log.metadata.get("rocky_persona") or rocky_persona
+            grace_persona = mission.log.metadata.get("grace_persona") or grace_persona
+            rocky_prompt, grace_prompt = mission.get_prompts()
+            preflight[id(mission)] = (
+                asyncio.ensure_future(self.rocky.get_initial_thought_async(rocky_prompt, rocky_persona)),
+                asyncio.ensure_future(self.grace.get_initial_thought_async(grace_prompt, grace_persona)),
+            )
+        return preflight
+
+    def _mission_record(self, mission: AbstractMission, grace: Optional[XenoAgent] = None,
+                        channel: Optional[CommChannel] = None) -> Dict[str, Any]:
+        record = {
+            "mission": mission.name,
+            "summary": mission.get_results(),
+            "turns_to_success": mission.success_turn,
+            "stop_reason": mission.stop_reason,
+            "agents": {
+                "rocky": self._agent_info(self.rocky),
+                "grace": self._agent_info(grace or self.grace)
+            },
+            "history": [e.to_dict() for e in mission.log.history],
+            "energy_remaining": (channel or self.channel).remaining_energy
+        }
+        if mission.stop_turn is not None:
+            record["stop_turn"] = mission.stop_turn
+        if mission.log.metadata.get("spec"):
+            record["spec"] = mission.log.metadata["spec"]
+        return record
+
+    async def _analyze(self, index: int, mission_data: Dict[str, Any]):
+        analysis_report = await self.analyst.analyze_mission(mission_data)
+        mission_data["analysis"] = analysis_report
+
+        # Try to extract metrics from the report
+        metrics = None
+        try:
+            metrics_match = re.search(r"({.*})", analysis_report, re.DOTALL)
+            if metrics_match:
+                metrics = json.loads(metrics_match.group(1))
+                mission_data["metrics"] = metrics
+        except:
+            pass
+        await self.bus.publish(AnalysisReady(mission=mission_data["mission"], index=index,
+                                             analysis=analysis_report, metrics=metrics))
+
+    @staticmethod
+    def _agent_info(agent: XenoAgent) -> Dict[str, Any]:
+        """Agent metadata for the mission record, plus the backend's cumulative timings if reported."""
+        info = dict(getattr(agent, "metadata", {}))
+        timings = agent.timings()
+        if timings:
+            info["timings"] = timings
+        return info
+
+    @staticmethod
+    def _agent_fields(agent: XenoAgent) -> Dict[str, Any]:
+        """Voting candidates, cascade tier and hedging behind the agent's last action, as Exchange fields."""
+        fields = {"tier": getattr(agent, "last_tier", None), "hedge": getattr(agent, "last_hedge", None)}
+        vote = getattr(agent, "last_vote", None)
+        if vote:
+            fields["candidates"], fields["agreement"] = vote
+        return fields
+
+    def _tokens_used(self) -> int:
+        return self.rocky.tokens_used + self.grace.tokens_used
+
+    def _score_turn(self, mission: AbstractMission, turn: int, rocky_ex: Exchange, grace_ex: Exchange,
+                    tokens_start: int, listener: Optional[Listener] = None) -> Optional[str]:
+        """Scores a turn and returns the reason the mission should stop, or None to continue.
+        A broadcast `listener` is checked against its own channel, policies and token count."""
+        channel = listener.channel if listener else self.channel
+        stopping = listener.stopping if listener else self.stopping
+        tokens_used = self.rocky.tokens_used + listener.agent.tokens_used if listener else self._tokens_used()
+        expected = mission.expected_action()
+        mission.scored_turns = turn
+        if mission.update_state(rocky_ex, grace_ex):
+            mission.success_turn = turn
+            return "success"
+        if channel.is_depleted():
+            return "energy_depleted"
+
+        observation = TurnObservation(turn, grace_ex.action, expected, tokens_used - tokens_start)
+        for policy in stopping:
+            if policy.should_stop(observation):
+                mission.stop_turn = turn
+                return policy.reason
+        return None
+
+    async def _run_mission(self, mission: AbstractMission, max_turns: int = 20) -> str:
+        """Runs the turn loop and returns why it stopped: success, energy_depleted, max_turns or a policy reason."""
+        tokens_start = await self._start_mission(mission)
+        if self.duplex:
+            return await self._run_mission_duplex(mission, max_turns, tokens_start)
+        return await self._run_turns(mission, 0, max_turns, tokens_start)
+
+    async def _start_mission(self, mission: AbstractMission) -> int:
+        """Resets stopping policies, gathers initial thoughts and returns the mission's token baseline."""
+        await self._checkpoint()
+        tokens_start = self._tokens_used()
+        for policy in self.stopping:
+            policy.start()
         rocky_prompt, grace_prompt = mission.get_prompts()
-        
-        if self.use_tui:
-            tui = SimulationTUI(mission.name, mission.description)
-            tui.energy_total = self.channel.remaining_energy if self.channel.remaining_energy != float('inf') else 1000
-            tui.energy_remaining = self.channel.remaining_energy
-        else:
-            tui = None
-            print(f"   Rocky's Initial Understanding: {self.rocky.get_initial_thought(rocky_prompt)[:100]}...")
-            print(f"   Grace's Initial Understanding: {self.grace.get_initial_thought(grace_prompt)[:100]}...")
-        
-        # Optional Context for Live block if TUI is disabled
-        class OptionalLive:
-            def __init__(self, renderable): self.renderable = renderable
-            def __enter__(self): return self.renderable
-            def __exit__(self, *args): pass
-
-        live_context = Live(tui, screen=True, auto_refresh=True) if tui else OptionalLive(None)
-
-        with live_context:
-            for turn in range(max_turns):
-                rocky_prompt, grace_prompt = mission.get_prompts()
-                
-                # 1. Rocky's Turn
-                t_rocky, c_rocky, _, req_rocky, res_rocky = self.rocky.get_action(mission.log, rocky_prompt)
-                transmitted_rocky = self.channel.transmit(c_rocky)
-                ex_rocky = Exchange(
-                    sender="Rocky", 
-                    thought=t_rocky, 
-                    chords=transmitted_rocky,
-                    raw_request=req_rocky,
-                    raw_response=res_rocky
-                )
-                mission.log.record_exchange(ex_rocky)
-                
-                if tui:
-                    tui.update(rocky_thought=t_rocky, rocky_signal=transmitted_rocky, energy=self.channel.remaining_energy)
-                    time.sleep(0.5)
-                
-                # 2. Grace's Turn
-                t_grace, c_grace, a_grace, req_grace, res_grace = self.grace.get_action(mission.log, grace_prompt)
-                transmitted_grace = self.channel.transmit(c_grace)
-                ex_grace = Exchange(
-                    sender="Grace", 
-                    thought=t_grace, 
-                    chords=transmitted_grace, 
-                    action=a_grace,
-                    raw_request=req_grace,
-                    raw_response=res_grace
-                )
-                mission.log.record_exchange(ex_grace)
-                
-                if tui:
-                    tui.update(grace_thought=t_grace, grace_action=a_grace, energy=self.channel.remaining_energy)
-                    tui.record_turn(transmitted_rocky, transmitted_grace)
-                    time.sleep(1.0)
-                else:
-                    rocky_intent = t_rocky.split('.')[0][:50]
-                    grace_analysis = t_grace.split('.')[0][:50]
-                    print(f"  [Turn {turn+1}]")
-                    print(f"    Rocky sends: {transmitted_rocky} (Intent: {rocky_intent}...)")
-                    print(f"    Grace action: {a_grace} (Analysis: {grace_analysis}...)")
-                
-                if mission.update_state(ex_rocky, ex_grace):
-                    mission.success_turn = turn + 1
-                    if not tui: print(f"  ✅ Mission Objective Met in {turn+1} turns!")
-                    else:
-                        tui.update(
-                            rocky_thought="MISSION ACCOMPLISHED! Amaaze!", 
-                            grace_thought="Pattern identified. We saved Earth.",
-                            status="COMPLETED - Press Enter to continue"
-                        )
-                        input()
-                    break
-                
-                if self.channel.is_depleted():
-                    if not tui: print("  ❌ MISSION FAILURE: Energy Depleted.")
-                    else:
-                        tui.update(
-                            rocky_thought="Bad, bad, bad! Out of energy!", 
-                            grace_thought="I've lost the signal...",
-                            status="FAILED - Press Enter to continue"
-                        )
-                        input()
-                    break
-
-    def _save_campaign_log(self):
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"campaign_log_{timestamp}.json"
-        log_path = filename
-        if os.path.exists("logs") and os.path.isdir("logs"):
-            log_path = os.path.join("logs", filename)
-            
-        with open(log_path, "w") as f:
-            json.dump(self.results, f, indent=2)
+
+        rocky_thought = grace_thought = None
         if not self.use_tui:
-            print(f"\nCampaign complete. Log saved to {log_path}")
+            prefetched = self._preflight.pop(id(mission), None)
+            if prefetched is None:
+                prefetched = (self.rocky.get_initial_thought_async(rocky_prompt),
+                              self.grace.get_initial_thought_async(grace_prompt))
+            rocky_thought, grace_thought = await asyncio.gather(*prefetched)
+        await self.bus.publish(MissionStarted(
+            mission=mission.name, objective=mission.description, energy=self.channel.remaining_energy,
+            rocky_thought=rocky_thought, grace_thought=grace_thought
+        ))
+        return tokens_start
+
+    async def _run_turns(self, mission: AbstractMission, first_turn: int, max_turns: int, tokens_start: int) -> str:
+        """Half-duplex turn loop from turn index `first_turn` up to `max_turns`."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for turn in range(first_turn, max_turns):
+            await self._checkpoint()
+            rocky_prompt, grace_prompt = mission.get_prompts()
+
+            # 1. Rocky's Turn
+            t_rocky, c_rocky, _, req_rocky, res_rocky = await self.rocky.get_action_async(mission.log, rocky_prompt)
+            transmitted_rocky = self.channel.transmit(c_rocky)
+            sent_at = loop.time() - started
+            ex_rocky = Exchange(
+                sender="Rocky",
+                thought=t_rocky,
+                chords=transmitted_rocky,
+                raw_request=req_rocky,
+                raw_response=res_rocky,
+                store=mission.log.store,
+                sent_at=sent_at,
+                received_at=sent_at,
+                **self._agent_fields(self.rocky)
+            )
+            mission.log.record_exchange(ex_rocky)
+            await self.bus.publish(ExchangeTransmitted(mission.name, turn + 1, ex_rocky, self.channel.remaining_energy))
+
+            # 2. Grace's Turn
+            t_grace, c_grace, a_grace, req_grace, res_grace = await self.grace.get_action_async(mission.log, grace_prompt)
+            transmitted_grace = self.channel.transmit(c_grace)
+            sent_at = loop.time() - started
+            ex_grace = Exchange(
+                sender="Grace",
+                thought=t_grace,
+                chords=transmitted_grace,
+                action=a_grace,
+                raw_request=req_grace,
+                raw_response=res_grace,
+                store=mission.log.store,
+                sent_at=sent_at,
+                received_at=sent_at,
+                **self._agent_fields(self.grace)
+            )
+            mission.log.record_exchange(ex_grace)
+            await self.bus.publish(ExchangeTransmitted(mission.name, turn + 1, ex_grace, self.channel.remaining_energy))
+            await self.bus.publish(TurnCompleted(mission.name, turn + 1, ex_rocky, ex_grace, self.channel.remaining_energy))
+
+            reason = self._score_turn(mission, turn + 1, ex_rocky, ex_grace, tokens_start)
+            if reason:
+                return reason
+
+        return "max_turns"
+
+    async def _run_mission_duplex(self, mission: AbstractMission, max_turns: int, tokens_start: int = 0) -> str:
+        """Full-duplex contact: Rocky and Grace act concurrently on whatever signals have arrived.
+
+        Transmissions are delivered by a discrete-event scheduler at the time given by the
+        channel's propagation delay and bandwidth. A turn is one scored Grace transmission,
+        paired with the latest Rocky signal she had received when she started thinking.
+        """
+        scheduler = EventScheduler()
+        self.channel.reset_clock()
+        arrivals = {"Rocky": asyncio.Event(), "Grace": asyncio.Event()}
+        progress = asyncio.Event()
+        state = {"rocky_sent": 0, "grace_turns": 0, "rocky_done": False}
+
+        def send(sender: str, thought: str, chords: str, action, request, response) -> Exchange:
+            transmitted = self.channel.transmit(chords)
+            sent_at = scheduler.now()
+            exchange = Exchange(
+                sender=sender, thought=thought, chords=transmitted, action=action,
+                raw_request=request, raw_response=response, store=mission.log.store,
+                sent_at=sent_at, received_at=self.channel.arrival_time(sender, transmitted, sent_at),
+                **self._agent_fields(self.rocky if sender == "Rocky" else self.grace)
+            )
+            mission.log.record_exchange(exchange)
+            receiver = "Grace" if sender == "Rocky" else "Rocky"
+            scheduler.schedule(exchange.received_at, arrivals[receiver].set)
+            return exchange
+
+        async def rocky_loop():
+            try:
+                while not self.channel.is_depleted():
+                    await self._checkpoint()
+                    while state["rocky_sent"] - state["grace_turns"] > self.duplex_window:
+                        progress.clear()
+                        await progress.wait()
+                    rocky_prompt, _ = mission.get_prompts()
+                    view = mission.log.visible_to("Rocky", scheduler.now())
+                    t_rocky, c_rocky, _, req, res = await self.rocky.get_action_async(view, rocky_prompt)
+                    state["rocky_sent"] += 1
+                    ex_rocky = send("Rocky", t_rocky, c_rocky, None, req, res)
+                    await self.bus.publish(ExchangeTransmitted(mission.name, state["rocky_sent"], ex_rocky, self.channel.remaining_energy))
+            finally:
+                # Wake Grace so she cannot wait forever on a source that has gone quiet
+                state["rocky_done"] = True
+                arrivals["Grace"].set()
+
+        async def grace_loop() -> str:
+            heard_count = 0
+            while True:
+                await arrivals["Grace"].wait()
+                arrivals["Grace"].clear()
+                view = mission.log.visible_to("Grace", scheduler.now())
+                heard = [e for e in view.history if e.sender == "Rocky"]
+                if len(heard) == heard_count:
+                    if state["rocky_done"]:
+                        return "energy_depleted"
+                    continue
+                heard_count = len(heard)
+
+                await self._checkpoint()
+                _, grace_prompt = mission.get_prompts()
+                t_grace, c_grace, a_grace, req, res = await self.grace.get_action_async(view, grace_prompt)
+                state["grace_turns"] += 1
+                turn = state["grace_turns"]
+                ex_grace = send("Grace", t_grace, c_grace, a_grace, req, res)
+                progress.set()
+                await self.bus.publish(ExchangeTransmitted(mission.name, turn, ex_grace, self.channel.remaining_energy))
+                await self.bus.publish(TurnCompleted(mission.name, turn, heard[-1], ex_grace, self.channel.remaining_energy))
+
+                reason = self._score_turn(mission, turn, heard[-1], ex_grace, tokens_start)
+                if reason:
+                    return reason
+                if turn >= max_turns:
+                    return "max_turns"
+
+        scheduler.start()
+        rocky_task = asyncio.create_task(rocky_loop())
+        try:
+            outcome = await grace_loop()
+        finally:
+            rocky_failed = rocky_task.done() and not rocky_task.cancelled() and rocky_task.exception()
+            rocky_task.cancel()
+            await asyncio.gather(rocky_task, return_exceptions=True)
+            await scheduler.stop()
+        if rocky_failed:
+            raise rocky_failed
+        return outcome
+
+    async def _run_forked(self, mission: AbstractMission, plan: ForkPlan) -> Tuple[str, Dict[str, Any]]:
+        """Plays the shared prefix once, then runs every branch concurrently from a snapshot of it."""
+        if self.duplex:
+            raise ValueError(f"Mission '{mission.name}': forking is only supported in half-duplex mode")
+        tokens_start = await self._start_mission(mission)
+        outcome = await self._run_turns(mission, 0, min(plan.at_turn, self.max_turns), tokens_start)
+        mission.stop_reason = outcome
+        record = self._mission_record(mission)
+        if outcome != "max_turns" or plan.at_turn >= self.max_turns:
+            # Decided before the fork point: nothing left to branch
+            return outcome, record
+
+        snapshot = MissionSnapshot(
+            plan.at_turn, mission, self.channel, self.stopping,
+            {"rocky": self.rocky.persona, "grace": self.grace.persona},
+            self._tokens_used() - tokens_start
+        )
+        record["stop_reason"] = "forked"
+        record["fork_turn"] = plan.at_turn
+        record["branches"] = await asyncio.gather(*(self._run_branch(snapshot, b) for b in plan.branches))
+        return "forked", record
+
+    def _branch_agent(self, agent: XenoAgent, role: str, branch: Branch, snapshot: MissionSnapshot) -> XenoAgent:
+        model = branch.models.get(role)
+        if model:
+            if not self.agent_factory:
+                raise ValueError(f"Branch '{branch.name}' swaps the {role} model but no agent_factory was given")
+            agent = self.agent_factory(agent.name, agent.role, model["provider"], model["model"])
+        else:
+            # Shallow copy: own persona, shared client
+            agent = copy.copy(agent)
+        agent.set_persona(branch.personas.get(role) or snapshot.personas.get(role))
+        return agent
+
+    async def _run_branch(self, snapshot: MissionSnapshot, branch: Branch) -> Dict[str, Any]:
+        mission, channel, policies = snapshot.restore(branch)
+        if channel.seed is not None:
+            channel.reseed("mission", mission.name, "branch", branch.name)
+        rocky = self._branch_agent(self.rocky, "rocky", branch, snapshot)
+        grace = self._branch_agent(self.grace, "grace", branch, snapshot)
+        child = CampaignManager((rocky, grace), channel, verbose=False, save_log=False,
+                                stopping=policies, max_turns=self.max_turns)
+        child.analyst = None
+        child._resume = self._resume # Pausing the campaign pauses its branches
+        # Budgets count the prefix too. Branches sharing a client also share its token counter.
+        outcome = await child._run_turns(mission, snapshot.turn, self.max_turns,
+                                         child._tokens_used() - snapshot.tokens)
+        mission.stop_reason = outcome
+        record = child._mission_record(mission)
+        record["history"] = record["history"][len(snapshot.mission.log.history):]
+        record["branch"] = branch.name
+        record["settings"] = branch.settings()
+        return record
+
+    async def _run_broadcast(self, mission: AbstractMission, index: int,
+                             fork_cfg: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+        """Broadcast mode: one Rocky call per turn, heard by the lead Grace and every observer."""
+        if self.duplex or fork_cfg:
+            raise ValueError(f"Mission '{mission.name}': broadcast observers need half-duplex mode without forking")
+        tokens_start = await self._start_mission(mission)
+        lead = Listener("lead", self.grace, mission, self.channel, self.stopping, tokens_start)
+        listeners = [lead]
+        for observer in self.observers:
+            listener = Listener.for_observer(observer, mission, self.channel, self.stopping,
+                                             self.rocky.tokens_used + observer.agent.tokens_used)
+            if listener.channel.seed is not None:
+                # Its own noise stream, reproducible per mission and observer
+                listener.channel.reseed("mission", index, "observer", observer.name)
+            listeners.append(listener)
+
+        started = asyncio.get_running_loop().time()
+        for turn in range(1, self.max_turns + 1):
+            active = [listener for listener in listeners if listener.outcome is None]
+            if not active:
+                break
+            await self._checkpoint()
+            # Rocky teaches the lead, or the first observer still running once the lead is done
+            source = active[0].mission
+            rocky_prompt, _ = source.get_prompts()
+            rocky_reply = await self.rocky.get_action_async(source.log, rocky_prompt)
+            rocky_fields = self._agent_fields(self.rocky)
+            await asyncio.gather(*(self._observe(listener, turn, rocky_reply, rocky_fields, started, listener is lead)
+                                   for listener in active))
+
+        for listener in listeners:
+            listener.outcome = listener.outcome or "max_turns"
+            listener.mission.stop_reason = listener.outcome
+        record = self._mission_record(mission)
+        record["observers"] = [dict(self._mission_record(l.mission, l.agent, l.channel), observer=l.name)
+                               for l in listeners[1:]]
+        return lead.outcome, record
+
+    async def _observe(self, listener: Listener, turn: int, rocky_reply: Tuple, rocky_fields: Dict[str, Any],
+                       started: float, publish: bool):
+        """Delivers Rocky's transmission to one observer, gets its answer and scores it."""
+        loop = asyncio.get_running_loop()
+        mission, channel = listener.mission, listener.channel
+        t_rocky, c_rocky, _, req_rocky, res_rocky = rocky_reply
+        sent_at = loop.time() - started
+        ex_rocky = Exchange(
+            sender="Rocky",
+            thought=t_rocky,
+            chords=channel.transmit(c_rocky),
+            raw_request=req_rocky,
+            raw_response=res_rocky,
+            store=mission.log.store,
+            sent_at=sent_at,
+            received_at=sent_at,
+            **rocky_fields
+        )
+        mission.log.record_exchange(ex_rocky)
+        if publish:
+            await self.bus.publish(ExchangeTransmitted(mission.name, turn, ex_rocky, channel.remaining_energy))
+
+        _, grace_prompt = mission.get_prompts()
+        t_grace, c_grace, a_grace, req_grace, res_grace = await listener.agent.get_action_async(mission.log, grace_prompt)
+        sent_at = loop.time() - started
+        ex_grace = Exchange(
+            sender="Grace",
+            thought=t_grace,
+            chords=channel.transmit(c_grace),
+            action=a_grace,
+            raw_request=req_grace,
+            raw_response=res_grace,
+            store=mission.log.store,
+            sent_at=sent_at,
+            received_at=sent_at,
+            **self._agent_fields(listener.agent)
+        )
+        mission.log.record_exchange(ex_grace)
+        if publish:
+            await self.bus.publish(ExchangeTransmitted(mission.name, turn, ex_grace, channel.remaining_energy))
+            await self.bus.publish(TurnCompleted(mission.name, turn, ex_rocky, ex_grace, channel.remaining_energy))
+        listener.outcome = self._score_turn(mission, turn, ex_rocky, ex_grace, listener.tokens_start, listener)
@@ -1,12 +1,86 @@
+import hashlib
 import random
 import logging
+from typing import Dict, Optional
+
+from .noise import BitFlip, NoiseModel, NoiseTape
+
+TAPE_CHUNK = 4096 # Noise positions generated per refill
 
 class CommChannel:
-    def __init__(self, noise_level: float = 0.0, energy_per_bit: float = 1.0, total_energy: float = float('inf')):
-        self.noise_level = noise_level
+    def __init__(self, noise_level: float = 0.0, energy_per_bit: float = 1.0, total_energy: float = float('inf'),
+                 propagation_delay: float = 0.0, bandwidth: Optional[float] = None, seed: Optional[int] = None,
+                 noise_model: Optional[NoiseModel] = None):
+        self.noise_model = noise_model or BitFlip(noise_level)
         self.energy_per_bit = energy_per_bit
         self.remaining_energy = total_energy
         self.energy_used = 0.0
+        self.propagation_delay = propagation_delay # seconds
+        self.bandwidth = bandwidth # bits per second, None for unlimited
+        self._link_free_at: Dict[str, float] = {}
+        # Per-channel RNG so a mission's noise can be snapshotted and forked
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    @property
+    def noise_model(self) -> NoiseModel:
+        return self._noise_model
+
+    @noise_model.setter
+    def noise_model(self, model: NoiseModel):
+        # Noise already generated by the old model is discarded
+        self._noise_model = model
+        self._discard_tape()
+
+    @property
+    def noise_level(self) -> float:
+        """The flip rate under i.i.d. flips; 0.0 for other models."""
+        return self._noise_model.p if isinstance(self._noise_model, BitFlip) else 0.0
+
+    @noise_level.setter
+    def noise_level(self, value: float):
+        # Setting a flip rate (e.g. a fork branch override) switches to i.i.d. flips
+        self.noise_model = BitFlip(value)
+
+    def reseed(self, *keys) -> "CommChannel":
+        """Switches to an independent noise stream derived from the seed and `keys`.
+
+        reseed("mission", 2) gives the same stream however many missions ran before it,
+        so missions and fork branches can run in any order or in parallel processes.
+        """
+        material = repr((self.seed,) + keys).encode()
+        self.rng = random.Random(int.from_bytes(hashlib.sha256(material).digest()[:8], "big"))
+        self.noise_model.reset()
+        self._discard_tape()
+        return self
+
+    def _discard_tape(self):
+        self._tape = NoiseTape(0)
+        self._tape_pos = 0
+        self._replaying = False
+
+    def pregenerate(self, n: int) -> NoiseTape:
+        """Generates noise for the next `n` channel bit positions in bulk."""
+        remaining = self._tape.length - self._tape_pos
+        if remaining < n:
+            self._tape = self._tape.slice(self._tape_pos, remaining).extend(
+                self.noise_model.generate(max(n - remaining, TAPE_CHUNK), self.rng))
+            self._tape_pos = 0
+        return self._tape.slice(self._tape_pos, n)
+
+    def load_tape(self, tape: NoiseTape):
+        """Replays a recorded tape; transmissions past its end are noiseless."""
+        self._tape = tape
+        self._tape_pos = 0
+        self._replaying = True
+
+    def _next_noise(self, n: int) -> NoiseTape:
+        if self._replaying:
+            noise = self._tape.slice(self._tape_pos, n)
+        else:
+            noise = self.pregenerate(n)
+        self._tape_pos += n
+        return noise
 
     def transmit(self, chords: str) -> str:
         """Transmits signal, applying noise and deducting energy."""
@@ -23,15 +97,22 @@ class CommChannel:
                 logging.warning("Out of energy! Signal truncated.")
                 return "" # Signal dies
 
-        # Apply noise
-        output = []
-        for bit in chords:
-            if random.random() < self.noise_level:
-                output.append('1' if bit == '0' else '0')
-            else:
-                output.append(bit)
-        
-        return "".join(output)
+        # Apply noise from the tape, one position per transmitted bit
+        return self._next_noise(len(chords)).apply(chords)
 
     def is_depleted(self) -> bool:
         return self.remaining_energy <= 0
+
+    def arrival_time(self, sender: str, chords: str, sent_at: float) -> float:
+        """When a transmission started at `sent_at` is fully received.
+
+        Each sender's link serializes its own transmissions at `bandwidth`, then the
+        signal spends `propagation_delay` in flight.
+        """
+        start = max(sent_at, self._link_free_at.get(sender, 0.0))
+        serialization = len(chords) / self.bandwidth if self.bandwidth else 0.0
+        self._link_free_at[sender] = start + serialization
+        return start + serialization + self.propagation_delay
+
+    def reset_clock(self):
+        self._link_free_at.clear()
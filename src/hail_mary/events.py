@@ -0,0 +1,179 @@
+"""Typed turn events and the in-process publish/subscribe bus that carries them.
+
+The campaign loop only publishes; printing, the TUI, log writing and metrics are
+subscribers, each draining its own bounded queue on its own task. A subscriber that
+fails is logged and keeps receiving events; its errors are raised when the bus closes,
+so e.g. a log that could not be saved fails the campaign run.
+"""
+import asyncio
+import inspect
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .protocol import Exchange
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CampaignStarted:
+    missions: int
+
+@dataclass
+class MissionStarted:
+    mission: str
+    objective: str
+    energy: float
+    rocky_thought: Optional[str] = None
+    grace_thought: Optional[str] = None
+
+@dataclass
+class ExchangeTransmitted:
+    mission: str
+    turn: int
+    exchange: Exchange
+    energy: float
+
+@dataclass
+class TurnCompleted:
+    mission: str
+    turn: int
+    rocky: Exchange
+    grace: Exchange
+    energy: float
+
+@dataclass
+class MissionFinished:
+    mission: str
+    index: int
+    outcome: str # "success" | "energy_depleted" | "max_turns" | a stopping-policy reason
+    turns: int
+    record: Dict[str, Any]
+    analysis_pending: bool = False
+
+@dataclass
+class AnalysisReady:
+    mission: str
+    index: int
+    analysis: str
+    metrics: Optional[Dict[str, Any]] = None
+
+@dataclass
+class CampaignFinished:
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+# Backpressure policies for a full subscriber queue
+BLOCK = "block"               # publisher waits (lossless, throttles the engine)
+DROP_OLDEST = "drop_oldest"   # evict the oldest queued event
+DROP_NEWEST = "drop_newest"   # discard the event being published
+
+_CLOSE = object()
+
+class SubscriberError(RuntimeError):
+    """One or more subscribers failed while the bus was running."""
+    def __init__(self, errors: List[Exception]):
+        super().__init__("; ".join(f"{type(e).__name__}: {e}" for e in errors))
+        self.errors = errors
+
+class Subscription:
+    def __init__(self, handler: Callable[[Any], Any], maxsize: int = 256, policy: str = BLOCK,
+                 event_types: Optional[tuple] = None):
+        if policy not in (BLOCK, DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy
+        self.event_types = event_types
+        self.dropped = 0
+        self.errors: List[Exception] = []
+        self.queue: Optional[asyncio.Queue] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def wants(self, event: Any) -> bool:
+        return self.event_types is None or isinstance(event, self.event_types)
+
+    async def offer(self, event: Any):
+        if self.policy == BLOCK:
+            await self.queue.put(event)
+        elif self.queue.full():
+            self.dropped += 1
+            if self.policy == DROP_OLDEST:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.queue.put_nowait(event)
+        else:
+            self.queue.put_nowait(event)
+
+    async def _run(self):
+        while True:
+            event = await self.queue.get()
+            try:
+                if event is _CLOSE:
+                    return
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Event subscriber {self.handler!r} failed on {type(event).__name__}: {e}")
+                self.errors.append(e)
+            finally:
+                self.queue.task_done()
+
+class EventBus:
+    """Fans events out to subscribers. Use as `async with bus:` around a campaign run."""
+    def __init__(self):
+        self.subscriptions: List[Subscription] = []
+        self.running = False
+
+    def subscribe(self, handler: Callable[[Any], Any], maxsize: int = 256, policy: str = BLOCK,
+                  event_types: Optional[tuple] = None) -> Subscription:
+        subscription = Subscription(handler, maxsize=maxsize, policy=policy, event_types=event_types)
+        self.subscriptions.append(subscription)
+        if self.running:
+            self._start(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            if subscription.task:
+                subscription.task.cancel()
+
+    def _start(self, subscription: Subscription):
+        subscription.queue = asyncio.Queue(maxsize=subscription.maxsize)
+        subscription.task = asyncio.create_task(subscription._run())
+
+    async def publish(self, event: Any):
+        for subscription in list(self.subscriptions):
+            if subscription.queue is not None and subscription.wants(event):
+                await subscription.offer(event)
+
+    async def start(self):
+        self.running = True
+        for subscription in self.subscriptions:
+            self._start(subscription)
+
+    async def close(self, raise_errors: bool = True):
+        """Drains every subscriber queue and stops the worker tasks, then raises SubscriberError
+        if any subscriber failed."""
+        self.running = False
+        for subscription in self.subscriptions:
+            if subscription.queue is not None:
+                await subscription.queue.put(_CLOSE)
+        await asyncio.gather(*(s.task for s in self.subscriptions if s.task), return_exceptions=True)
+        errors = []
+        for subscription in self.subscriptions:
+            subscription.queue = None
+            subscription.task = None
+            errors += subscription.errors
+            subscription.errors = []
+        if errors and raise_errors:
+            raise SubscriberError(errors)
+
+    async def __aenter__(self) -> "EventBus":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Subscriber errors never mask the exception that ended the block; they are logged already
+        await self.close(raise_errors=exc_type is None)
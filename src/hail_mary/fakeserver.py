@@ -0,0 +1,490 @@
+"""A local stand-in for the OpenAI, Anthropic, Gemini and native Ollama HTTP APIs.
+
+The server answers with THOUGHT/SIGNAL/ACTION replies so that the real provider
+clients can be exercised (concurrency, retries, pooling) without paying for tokens.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .httpd import HTTPRequest, serve_connection, write_json, start_sse, send_sse
+from .parsing import to_structured
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class LatencyProfile:
+    """Distribution of simulated server latency, in seconds."""
+    distribution: str = "constant" # constant | uniform | normal | lognormal | exponential
+    mean: float = 0.0
+    spread: float = 0.0
+    minimum: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            value = self.mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.mean - self.spread, self.mean + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean, self.spread)
+        elif self.distribution == "lognormal":
+            # mean is the median of the distribution, spread the sigma of the underlying normal
+            value = rng.lognormvariate(math.log(self.mean), self.spread) if self.mean > 0 else 0.0
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1.0 / self.mean) if self.mean > 0 else 0.0
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        return max(self.minimum, value)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Builds a profile from a preset name or a 'distribution:mean[:spread]' string."""
+        if spec in LATENCY_PRESETS:
+            return LATENCY_PRESETS[spec]
+        parts = spec.split(":")
+        return cls(
+            distribution=parts[0],
+            mean=float(parts[1]) if len(parts) > 1 else 0.0,
+            spread=float(parts[2]) if len(parts) > 2 else 0.0,
+        )
+
+LATENCY_PRESETS = {
+    "instant": LatencyProfile(),
+    "fast": LatencyProfile("uniform", mean=0.05, spread=0.02),
+    "typical": LatencyProfile("lognormal", mean=0.8, spread=0.4, minimum=0.1),
+    "slow": LatencyProfile("lognormal", mean=3.0, spread=0.5, minimum=0.5),
+    "heavy_tail": LatencyProfile("lognormal", mean=0.8, spread=1.2, minimum=0.1),
+}
+
+@dataclass
+class FaultProfile:
+    """Probability of injecting a failure into a request."""
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    key_rpm: Optional[int] = None # Requests each API key may make per `key_window` seconds before a 429
+    key_window: float = 60.0
+
+@dataclass
+class OllamaProfile:
+    """Simulated local model server: load time, keep-alive eviction and parallel slots per model."""
+    load_time: float = 0.0
+    num_parallel: int = 1
+    default_keep_alive: float = 300.0 # Seconds a model stays loaded after its last request
+
+def parse_keep_alive(value: Any, default: float) -> Optional[float]:
+    """Ollama keep_alive ("5m", "30s", "1h", seconds) in seconds; None means stay loaded."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        units = {"s": 1, "m": 60, "h": 3600}
+        value = float(value[:-1]) * units[value[-1]] if value and value[-1] in units else float(value)
+    return None if value < 0 else float(value)
+
+class ResponseScript:
+    """Produces agent replies, either from a fixed script or from a template.
+
+    Template fields: {n} (call number), {signal} (binary signal), {action} (integer).
+    """
+    DEFAULT_TEMPLATE = "THOUGHT: Scripted reply #{n}.\nSIGNAL: {signal}\nACTION: {action}"
+
+    def __init__(self, responses: Optional[List[str]] = None, template: Optional[str] = None, seed: Optional[int] = None):
+        self.responses = responses or []
+        self.template = template or self.DEFAULT_TEMPLATE
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    def render(self, prompt: str) -> str:
+        self.calls += 1
+        if self.responses:
+            return self.responses[(self.calls - 1) % len(self.responses)]
+
+        # Mirror the mock agents: send the requested value in unary, otherwise guess
+        value_match = re.search(r"(?:value to send|Value):\s*(\d+)", prompt, re.IGNORECASE)
+        value = int(value_match.group(1)) if value_match else self.rng.randint(1, 8)
+        return self.template.format(n=self.calls, signal="1" * value + "0", action=value)
+
+def request_key(request: HTTPRequest) -> Optional[str]:
+    """The API key a request was sent with, in any provider's style."""
+    auth = request.headers.get("authorization", "")
+    if auth.lower().startswith("bearer "):
+        return auth[7:]
+    return request.headers.get("x-api-key") or request.query.get("key")
+
+@dataclass
+class ServerStats:
+    requests: Dict[str, int] = field(default_factory=dict)
+    rate_limited: int = 0
+    errors: int = 0
+    keys: Dict[str, int] = field(default_factory=dict) # API key -> requests
+    streams: int = 0
+    model_loads: int = 0
+    peak_in_flight: Dict[str, int] = field(default_factory=dict) # Ollama model -> most concurrent requests
+
+class FakeLLMServer:
+    """Asyncio HTTP server speaking the chat-completions, messages and generateContent formats.
+
+    Routes:
+        POST /v1/chat/completions                       (OpenAI, DeepSeek, Ollama)
+        POST /v1/messages                               (Anthropic)
+        POST /v1beta/models/{model}:generateContent     (Gemini)
+        POST /v1beta/models/{model}:streamGenerateContent
+        POST /api/chat, /api/generate, GET /api/ps       (native Ollama)
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: Optional[LatencyProfile] = None,
+                 faults: Optional[FaultProfile] = None, script: Optional[ResponseScript] = None,
+                 seed: Optional[int] = None, stream_chunks: int = 4, ollama: Optional[OllamaProfile] = None):
+        self.host = host
+        self.port = port
+        self.latency = latency or LatencyProfile()
+        self.faults = faults or FaultProfile()
+        self.script = script or ResponseScript(seed=seed)
+        self.rng = random.Random(seed)
+        self.stream_chunks = stream_chunks
+        self.stats = ServerStats()
+        self.ollama = ollama or OllamaProfile()
+        self._models: Dict[str, Optional[float]] = {} # Loaded Ollama model -> eviction time (None: pinned)
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._key_windows: Dict[str, List[float]] = {} # API key -> window start, requests in it
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Fake LLM server listening on {self.base_url}")
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            # Idle keep-alive connections would otherwise be cancelled mid-read at loop shutdown
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            await serve_connection(reader, writer, self._handle)
+        finally:
+            self._connections.pop(task, None)
+
+    async def __aenter__(self) -> "FakeLLMServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, request: HTTPRequest, reader, writer) -> bool:
+        route = self._route(request)
+        if route is None:
+            await write_json(writer, 404, {"error": {"message": f"No route for {request.path}"}})
+            return True
+        self.stats.requests[route] = self.stats.requests.get(route, 0) + 1
+        if route == "ollama_ps":
+            now = asyncio.get_running_loop().time()
+            await write_json(writer, 200, {"models": [
+                {"name": model, "model": model, "expires_at": None if expires is None else expires - now}
+                for model, expires in self._models.items() if expires is None or expires > now
+            ]})
+            return True
+
+        key = request_key(request)
+        if key is not None:
+            self.stats.keys[key] = self.stats.keys.get(key, 0) + 1
+            if self.faults.key_rpm is not None:
+                now = asyncio.get_running_loop().time()
+                window = self._key_windows.setdefault(key, [now, 0])
+                if now - window[0] >= self.faults.key_window:
+                    window[:] = [now, 0]
+                window[1] += 1
+                if window[1] > self.faults.key_rpm:
+                    self.stats.rate_limited += 1
+                    await write_json(writer, 429, {"error": {"type": "rate_limit_error", "message": "Key rate limit"}},
+                                     headers={"Retry-After": f"{window[0] + self.faults.key_window - now:.3f}"})
+                    return True
+
+        roll = self.rng.random()
+        if roll < self.faults.rate_limit_rate:
+            self.stats.rate_limited += 1
+            await write_json(writer, 429, {"error": {"type": "rate_limit_error", "message": "Injected rate limit"}},
+                             headers={"Retry-After": str(self.faults.retry_after)})
+            return True
+        if roll < self.faults.rate_limit_rate + self.faults.error_rate:
+            self.stats.errors += 1
+            await write_json(writer, 500, {"error": {"type": "api_error", "message": "Injected server error"}})
+            return True
+
+        body = request.json()
+        delay = self.latency.sample(self.rng)
+        if route == "openai":
+            return await self._openai(body, delay, writer)
+        if route == "anthropic":
+            return await self._anthropic(body, delay, writer)
+        if route == "ollama":
+            return await self._ollama(request, body, delay, writer)
+        return await self._gemini(request, body, delay, writer)
+
+    def _route(self, request: HTTPRequest) -> Optional[str]:
+        if request.method == "GET" and request.path == "/api/ps":
+            return "ollama_ps"
+        if request.method != "POST":
+            return None
+        if request.path in ("/api/chat", "/api/generate"):
+            return "ollama"
+        if request.path.endswith("/chat/completions"):
+            return "openai"
+        if request.path.endswith("/messages"):
+            return "anthropic"
+        if re.search(r"/models/[^/:]+:(stream)?[gG]enerateContent$", request.path):
+            return "gemini"
+        return None
+
+    def _chunks(self, text: str) -> List[str]:
+        size = max(1, math.ceil(len(text) / self.stream_chunks))
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    async def _stream(self, writer, chunks: List[Any], delay: float, event_name=None):
+        # First chunk arrives after half of the sampled latency, the rest trickle in
+        await start_sse(writer)
+        self.stats.streams += 1
+        await asyncio.sleep(delay / 2)
+        step = (delay / 2) / max(1, len(chunks))
+        for chunk in chunks:
+            if event_name:
+                await send_sse(writer, chunk, event=event_name(chunk))
+            else:
+                await send_sse(writer, chunk)
+            await asyncio.sleep(step)
+
+    async def _openai(self, body: Dict[str, Any], delay: float, writer) -> bool:
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+        replies = [self.script.render(prompt) for _ in range(int(body.get("n", 1) or 1))]
+        schema = (body.get("response_format") or {}).get("json_schema", {}).get("schema")
+        if schema:
+            replies = [to_structured(r, "action" in schema.get("properties", {})) for r in replies]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "fake")
+        usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": sum(len(r) for r in replies) // 4}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if body.get("stream"):
+            chunks = []
+            for idx, reply in enumerate(replies):
+                for piece in self._chunks(reply):
+                    chunks.append({
+                        "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": idx, "delta": {"role": "assistant", "content": piece}, "finish_reason": None}],
+                    })
+            chunks.append({
+                "id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            })
+            await self._stream(writer, chunks + ["[DONE]"], delay)
+            return False
+
+        await asyncio.sleep(delay)
+        await write_json(writer, 200, {
+            "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model,
+            "choices": [
+                {"index": idx, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}
+                for idx, reply in enumerate(replies)
+            ],
+            "usage": usage,
+        })
+        return True
+
+    async def _anthropic(self, body: Dict[str, Any], delay: float, writer) -> bool:
+        prompt = "\n".join(
+            m["content"] if isinstance(m.get("content"), str) else json.dumps(m.get("content"))
+            for m in body.get("messages", [])
+        )
+        reply = self.script.render(prompt)
+        message_id = f"msg_{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "fake")
+        usage = {"input_tokens": len(prompt) // 4, "output_tokens": len(reply) // 4}
+
+        if body.get("stream"):
+            events = [{
+                "type": "message_start",
+                "message": {"id": message_id, "type": "message", "role": "assistant", "model": model, "content": [],
+                            "stop_reason": None, "stop_sequence": None,
+                            "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 0}},
+            }, {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}]
+            events += [
+                {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": piece}}
+                for piece in self._chunks(reply)
+            ]
+            events += [
+                {"type": "content_block_stop", "index": 0},
+                {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                 "usage": {"output_tokens": usage["output_tokens"]}},
+                {"type": "message_stop"},
+            ]
+            await self._stream(writer, events, delay, event_name=lambda e: e["type"])
+            return False
+
+        content = [{"type": "text", "text": reply}]
+        tools = body.get("tools") or []
+        if tools:
+            # Forced tool call: answer with the structured response as the tool input
+            schema = tools[0].get("input_schema", {})
+            structured = json.loads(to_structured(reply, "action" in schema.get("properties", {})))
+            content = [{"type": "tool_use", "id": f"toolu_{uuid.uuid4().hex[:12]}", "name": tools[0]["name"],
+                        "input": structured}]
+        await asyncio.sleep(delay)
+        await write_json(writer, 200, {
+            "id": message_id, "type": "message", "role": "assistant", "model": model,
+            "content": content,
+            "stop_reason": "tool_use" if tools else "end_turn", "stop_sequence": None, "usage": usage,
+        })
+        return True
+
+    async def _gemini(self, request: HTTPRequest, body: Dict[str, Any], delay: float, writer) -> bool:
+        prompt = "\n".join(
+            part.get("text", "") for content in body.get("contents", []) for part in content.get("parts", [])
+        )
+        config = body.get("generationConfig", {})
+        count = int(config.get("candidateCount", 1) or 1)
+        replies = [self.script.render(prompt) for _ in range(count)]
+        if config.get("responseSchema"):
+            with_action = "action" in config["responseSchema"].get("properties", {})
+            replies = [to_structured(r, with_action) for r in replies]
+        usage = {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": sum(len(r) for r in replies) // 4}
+        usage["totalTokenCount"] = usage["promptTokenCount"] + usage["candidatesTokenCount"]
+
+        def candidate(text: str, idx: int) -> Dict[str, Any]:
+            return {"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP", "index": idx}
+
+        if "streamGenerateContent" in request.path:
+            chunks = [{"candidates": [candidate(piece, 0)]} for piece in self._chunks(replies[0])]
+            chunks[-1]["usageMetadata"] = usage
+            await self._stream(writer, chunks, delay)
+            return False
+
+        await asyncio.sleep(delay)
+        await write_json(writer, 200, {
+            "candidates": [candidate(text, idx) for idx, text in enumerate(replies)],
+            "usageMetadata": usage,
+        })
+        return True
+
+    async def _ensure_loaded(self, model: str) -> float:
+        """Loads `model` unless resident; returns the seconds this request waited for the load."""
+        loop = asyncio.get_running_loop()
+        expires = self._models.get(model, 0.0)
+        if model in self._models and (expires is None or expires > loop.time()):
+            return 0.0
+        started = loop.time()
+        if model not in self._loading:
+            self._loading[model] = asyncio.ensure_future(self._load(model))
+        await asyncio.shield(self._loading[model])
+        return loop.time() - started
+
+    async def _load(self, model: str):
+        self.stats.model_loads += 1
+        await asyncio.sleep(self.ollama.load_time)
+        self._models[model] = asyncio.get_running_loop().time() + self.ollama.default_keep_alive
+        self._loading.pop(model, None)
+
+    def _keep(self, model: str, keep_alive: Optional[float]):
+        if keep_alive is None:
+            self._models[model] = None
+        elif keep_alive == 0:
+            self._models.pop(model, None)
+        else:
+            self._models[model] = asyncio.get_running_loop().time() + keep_alive
+
+    async def _ollama(self, request: HTTPRequest, body: Dict[str, Any], delay: float, writer) -> bool:
+        model = body.get("model", "fake")
+        keep_alive = parse_keep_alive(body.get("keep_alive"), self.ollama.default_keep_alive)
+        chat = request.path == "/api/chat"
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", [])) if chat else body.get("prompt", "")
+        created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+        if not prompt:
+            # An empty request only loads (or, with keep_alive 0, unloads) the model
+            load = 0.0 if keep_alive == 0 else await self._ensure_loaded(model)
+            self._keep(model, keep_alive)
+            reply = {"model": model, "created_at": created, "done": True,
+                     "done_reason": "unload" if keep_alive == 0 else "load", "load_duration": int(load * 1e9)}
+            reply.update({"message": {"role": "assistant", "content": ""}} if chat else {"response": ""})
+            await write_json(writer, 200, reply)
+            return True
+
+        load = await self._ensure_loaded(model)
+        slots = self._slots.setdefault(model, asyncio.Semaphore(max(1, self.ollama.num_parallel)))
+        async with slots:
+            self._in_flight[model] = self._in_flight.get(model, 0) + 1
+            self.stats.peak_in_flight[model] = max(self.stats.peak_in_flight.get(model, 0), self._in_flight[model])
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._in_flight[model] -= 1
+        self._keep(model, keep_alive)
+
+        text = self.script.render(prompt)
+        if isinstance(body.get("format"), dict):
+            text = to_structured(text, "action" in body["format"].get("properties", {}))
+        reply = {
+            "model": model, "created_at": created, "done": True, "done_reason": "stop",
+            # Resident models still report a millisecond of load, like the real server
+            "load_duration": int(load * 1e9) + 1_000_000,
+            "prompt_eval_count": len(prompt) // 4, "prompt_eval_duration": int(delay * 0.2 * 1e9),
+            "eval_count": len(text) // 4, "eval_duration": int(delay * 0.8 * 1e9),
+            "total_duration": int((load + delay) * 1e9),
+        }
+        reply.update({"message": {"role": "assistant", "content": text}} if chat else {"response": text})
+        await write_json(writer, 200, reply)
+        return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake LLM server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="instant", help="Preset name or 'distribution:mean[:spread]'")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--key-rpm", type=int, help="Requests per minute allowed per API key before a 429")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ollama-load-time", type=float, default=0.0, help="Simulated local model load, in seconds")
+    parser.add_argument("--ollama-parallel", type=int, default=1, help="Simulated parallel slots per local model")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = FakeLLMServer(
+        host=args.host, port=args.port, latency=LatencyProfile.parse(args.latency),
+        faults=FaultProfile(error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, key_rpm=args.key_rpm),
+        seed=args.seed,
+        ollama=OllamaProfile(load_time=args.ollama_load_time, num_parallel=args.ollama_parallel),
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Observer-side signal features: precomputed hints for the receiving agent's prompt.
+
+With `<role>_features: true`, an agent's prompt gets a short summary of the signals it
+has received. The summary covers autocorrelation peaks and candidate periods, run-length
+histograms, integer readings of each signal (binary, count of ones, leading-ones unary),
+repeated blocks, and how the readings change from signal to signal. The model no longer
+has to do this arithmetic itself, which is where it tends to slip (e.g. reporting a
+multiple of the real pulse interval).
+
+Signals are treated as big integers, so the autocorrelation at each lag is one shift, XOR
+and popcount over the whole signal. Erased bits ('x') are excluded from every comparison.
+"""
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+MIN_SCORE = 0.8 # Lowest autocorrelation reported as a peak
+PERIOD_EPSILON = 0.05 # Lags this close to the best score count as equally strong
+MAX_SIGNALS = 8 # Signals listed in the across-signal readings
+
+def _popcount(x: int) -> int:
+    return bin(x).count("1")
+
+def _bits(chords: str) -> Tuple[int, int, int]:
+    """(value, known mask, length); bit i of both is chords[-1 - i]."""
+    value = int(chords.replace("x", "0"), 2) if chords else 0
+    known = int("".join("0" if c == "x" else "1" for c in chords), 2) if chords else 0
+    return value, known, len(chords)
+
+def autocorrelation(chords: str, max_lag: Optional[int] = None) -> Dict[int, float]:
+    """Share of known bit pairs that agree at each lag, for lags up to half the length."""
+    value, known, n = _bits(chords)
+    scores = {}
+    for lag in range(1, (max_lag or n // 2) + 1):
+        valid = known & (known >> lag)
+        compared = _popcount(valid)
+        if compared:
+            scores[lag] = 1 - _popcount((value ^ (value >> lag)) & valid) / compared
+    return scores
+
+def candidate_periods(chords: str, limit: int = 3) -> List[Tuple[int, float]]:
+    """Best-scoring lags, strongest first, shortest first among equals."""
+    peaks = [(lag, score) for lag, score in autocorrelation(chords).items() if score >= MIN_SCORE]
+    return sorted(peaks, key=lambda p: (-p[1], p[0]))[:limit]
+
+def shortest_period(chords: str, epsilon: float = PERIOD_EPSILON) -> Optional[int]:
+    """The smallest lag scoring within `epsilon` of the best peak: a noisy fundamental
+    beats a cleaner multiple of it."""
+    scores = autocorrelation(chords)
+    best = max(scores.values(), default=0.0)
+    if best < MIN_SCORE:
+        return None
+    return min(lag for lag, score in scores.items() if score >= max(MIN_SCORE, best - epsilon))
+
+def run_lengths(chords: str) -> Dict[str, Counter]:
+    """Histogram of run lengths per symbol, e.g. {'1': {1: 4}, '0': {3: 3}}."""
+    runs: Dict[str, Counter] = {}
+    i = 0
+    while i < len(chords):
+        j = i
+        while j < len(chords) and chords[j] == chords[i]:
+            j += 1
+        runs.setdefault(chords[i], Counter())[j - i] += 1
+        i = j
+    return runs
+
+def repeated_block(chords: str) -> Optional[Tuple[str, int]]:
+    """The shortest block the signal repeats (at least twice, last copy may be partial)."""
+    n = len(chords)
+    if n < 2 or "x" in chords:
+        return None
+    # Prefix function: the longest proper prefix that is also a suffix gives the period
+    border = [0] * n
+    for i in range(1, n):
+        k = border[i - 1]
+        while k and chords[i] != chords[k]:
+            k = border[k - 1]
+        border[i] = k + 1 if chords[i] == chords[k] else k
+    period = n - border[-1]
+    if period * 2 > n:
+        return None
+    return chords[:period], n // period
+
+def readings(chords: str) -> Dict[str, int]:
+    """Integer decodings of one signal."""
+    if not chords or "x" in chords:
+        return {}
+    return {"binary": int(chords, 2), "ones": chords.count("1"), "unary": len(chords) - len(chords.lstrip("1"))}
+
+def _series(values: List[int]) -> str:
+    text = ", ".join(map(str, values))
+    if len(values) >= 3:
+        diffs = [b - a for a, b in zip(values, values[1:])]
+        if set(diffs) == {0}:
+            text += " (constant)"
+        elif len(set(diffs)) == 1:
+            text += f" (constant step {diffs[0]})"
+        elif all(a and b % a == 0 for a, b in zip(values, values[1:])) and len({b // a for a, b in zip(values, values[1:])}) == 1:
+            text += f" (constant ratio {values[1] // values[0]})"
+    return text
+
+def _runs_text(runs: Dict[str, Counter]) -> str:
+    return "; ".join(f"{symbol}-runs " + ", ".join(f"{length}x{count}" for length, count in sorted(counts.items()))
+                     for symbol, counts in sorted(runs.items(), key=lambda item: "10x".index(item[0])))
+
+def summarize(signals: List[str], source: str = "the source") -> str:
+    """A compact feature summary of the received `signals`, oldest first."""
+    signals = [s for s in signals if s]
+    if not signals:
+        return f"No signal received from {source} yet."
+    latest = signals[-1]
+    lines = [f"{len(signals)} signal(s) received from {source}. Latest: {latest} ({len(latest)} bits)."]
+    periods = candidate_periods(latest)
+    if periods:
+        peaks = ", ".join(f"{lag} ({score:.2f})" for lag, score in periods)
+        lines.append(f"- Autocorrelation peaks, lag (match): {peaks}. Shortest strong period: {shortest_period(latest)}.")
+    lines.append(f"- Run lengths: {_runs_text(run_lengths(latest))}.")
+    block = repeated_block(latest)
+    if block:
+        lines.append(f"- Repeats block '{block[0]}' ({len(block[0])} bits) {block[1]} times.")
+    reading = readings(latest)
+    if reading:
+        lines.append(f"- Latest as integers: binary {reading['binary']}, count of 1s {reading['ones']}, "
+                     f"leading 1s {reading['unary']}.")
+    decoded = [readings(s) for s in signals[-MAX_SIGNALS:]]
+    if len(signals) > 1 and all(decoded):
+        for key, label in (("binary", "binary"), ("ones", "count of 1s"), ("unary", "leading 1s")):
+            lines.append(f"- Across signals, {label}: {_series([d[key] for d in decoded])}.")
+    return "\n".join(lines)
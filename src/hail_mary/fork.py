@@ -0,0 +1,85 @@
+"""Mission snapshots and branch specs for forked (counterfactual) runs.
+
+A forked mission plays its first `at_turn` turns once, snapshots everything the
+remaining turns depend on, then continues each branch from its own copy of that
+snapshot. The campaign log stores the prefix once with the branches beneath it.
+"""
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .channel import CommChannel
+from .mission import AbstractMission
+from .stopping import StoppingPolicy
+
+# YAML branch keys that override CommChannel attributes
+CHANNEL_KEYS = {
+    "noise": "noise_level",
+    "energy": "remaining_energy",
+    "propagation_delay": "propagation_delay",
+    "bandwidth": "bandwidth",
+}
+
+@dataclass
+class Branch:
+    name: str
+    channel: Dict[str, Any] = field(default_factory=dict) # CommChannel attribute overrides
+    personas: Dict[str, str] = field(default_factory=dict) # "rocky"/"grace" -> persona
+    models: Dict[str, Dict[str, str]] = field(default_factory=dict) # "rocky"/"grace" -> {"provider", "model"}
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any], index: int) -> "Branch":
+        branch = cls(name=cfg.get("name", f"branch-{index + 1}"))
+        for key, attr in CHANNEL_KEYS.items():
+            if key in cfg:
+                branch.channel[attr] = cfg[key]
+        for role in ("rocky", "grace"):
+            if cfg.get(f"{role}_persona"):
+                branch.personas[role] = cfg[f"{role}_persona"]
+            if cfg.get(f"{role}_provider") or cfg.get(f"{role}_model"):
+                branch.models[role] = {
+                    "provider": cfg.get(f"{role}_provider", "mock"),
+                    "model": cfg.get(f"{role}_model", "default"),
+                }
+        return branch
+
+    def settings(self) -> Dict[str, Any]:
+        return {"channel": dict(self.channel), "personas": dict(self.personas), "models": dict(self.models)}
+
+@dataclass
+class ForkPlan:
+    at_turn: int
+    branches: List[Branch]
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "ForkPlan":
+        at_turn = cfg.get("at_turn")
+        if not isinstance(at_turn, int) or at_turn < 1:
+            raise ValueError(f"fork.at_turn must be a positive integer, got {at_turn!r}")
+        branches = [Branch.from_config(b, i) for i, b in enumerate(cfg.get("branches", []))]
+        if not branches:
+            raise ValueError("fork.branches must list at least one branch")
+        return cls(at_turn=at_turn, branches=branches)
+
+class MissionSnapshot:
+    """Frozen copy of a mission at the end of turn `turn`.
+
+    Captures the ContactLog and mission state, the channel (energy, noise settings and
+    RNG state), stopping-policy progress and each agent's session (persona, tokens spent).
+    """
+    def __init__(self, turn: int, mission: AbstractMission, channel: CommChannel,
+                 policies: List[StoppingPolicy], personas: Dict[str, Optional[str]], tokens: int):
+        self.turn = turn
+        self.mission = copy.deepcopy(mission)
+        self.channel = copy.deepcopy(channel)
+        self.policies = copy.deepcopy(policies)
+        self.personas = dict(personas)
+        self.tokens = tokens
+
+    def restore(self, branch: Optional[Branch] = None) -> Tuple[AbstractMission, CommChannel, List[StoppingPolicy]]:
+        """Fresh, independent copies of the snapshotted state with the branch's overrides applied."""
+        mission = copy.deepcopy(self.mission)
+        channel = copy.deepcopy(self.channel)
+        for attr, value in (branch.channel if branch else {}).items():
+            setattr(channel, attr, value)
+        return mission, channel, copy.deepcopy(self.policies)
@@ -0,0 +1,184 @@
+"""Grid worlds for the rendezvous mission: maps, obstacles and cached distance fields.
+
+Cells are flat indices (y * width + x). A map is immutable and shared by every mission
+(and fork snapshot) that uses it. The distance from each cell to a target is computed
+once per (map, target) by breadth-first search and cached, so checking whether a move
+is optimal, or how efficient a path was, is a lookup. Open maps skip the search and use
+the Manhattan distance.
+
+YAML:
+    params: { size: 5 }                                          # open 5x5, target at the far corner
+    params: { width: 1000, height: 1000, obstacles: 0.2, target: random, seed: 7 }
+    params: { map: ["....", ".##.", "...."], start: [0, 0], target: [2, 3] }
+"""
+import hashlib
+import random
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+# Grace's actions as (dy, dx)
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+MOVE_NAMES = ("up", "down", "left", "right")
+UNREACHABLE = -1
+WALL = "#"
+
+Position = Tuple[int, int]
+
+class GridMap:
+    """A width x height grid whose blocked cells are 1 in `blocked`."""
+    def __init__(self, width: int, height: int, blocked: Optional[bytearray] = None):
+        if width < 1 or height < 1:
+            raise ValueError(f"Grid must be at least 1x1, got {width}x{height}")
+        self.width = width
+        self.height = height
+        self.blocked = bytes(blocked) if blocked is not None else bytes(width * height)
+        if len(self.blocked) != width * height:
+            raise ValueError("Obstacle mask does not match the grid size")
+        self.open = not any(self.blocked)
+        self.key = hashlib.blake2b(b"%d:%d:" % (width, height) + self.blocked, digest_size=12).digest()
+
+    @classmethod
+    def generate(cls, width: int, height: int, density: float = 0.0, rng: Optional[random.Random] = None,
+                 keep: Sequence[Position] = ()) -> "GridMap":
+        """Random obstacles covering about `density` of the cells; `keep` cells stay free."""
+        if not 0.0 <= density < 1.0:
+            raise ValueError(f"Obstacle density must be in [0, 1), got {density}")
+        blocked = bytearray(width * height)
+        if density > 0:
+            rng = rng or random.Random()
+            for cell in rng.sample(range(width * height), int(density * width * height)):
+                blocked[cell] = 1
+            for y, x in keep:
+                blocked[y * width + x] = 0
+        return cls(width, height, blocked)
+
+    @classmethod
+    def parse(cls, rows: List[str]) -> "GridMap":
+        """A map drawn as text rows, '#' for obstacles and anything else free."""
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Map rows must be non-empty and of equal length")
+        blocked = bytearray(1 if c == WALL else 0 for row in rows for c in row)
+        return cls(len(rows[0]), len(rows), blocked)
+
+    def cell(self, pos: Position) -> int:
+        y, x = pos
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise ValueError(f"{pos} is outside the {self.height}x{self.width} grid")
+        return y * self.width + x
+
+    def pos(self, cell: int) -> Position:
+        return divmod(cell, self.width)
+
+    def is_free(self, pos: Position) -> bool:
+        return not self.blocked[self.cell(pos)]
+
+    def step(self, cell: int, move: Optional[int]) -> int:
+        """The cell reached by `move`; walls, edges and invalid moves leave Grace in place."""
+        if move not in (0, 1, 2, 3):
+            return cell
+        y, x = divmod(cell, self.width)
+        dy, dx = MOVES[move]
+        y, x = y + dy, x + dx
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            return cell
+        target = y * self.width + x
+        return cell if self.blocked[target] else target
+
+    def open_moves(self, cell: int) -> List[int]:
+        return [move for move in range(4) if self.step(cell, move) != cell]
+
+    def __deepcopy__(self, memo):
+        return self # Immutable: fork snapshots share it
+
+    def __repr__(self) -> str:
+        return f"GridMap({self.width}x{self.height}, {sum(self.blocked)} blocked)"
+
+class DistanceField:
+    """Shortest-path distances from every cell to `target` (UNREACHABLE when cut off)."""
+    def __init__(self, grid: GridMap, target: int):
+        self.grid = grid
+        self.target = target
+        self._dist: Optional[array] = None if grid.open else _bfs(grid, target)
+        self._ty, self._tx = grid.pos(target)
+
+    def __getitem__(self, cell: int) -> int:
+        if self._dist is not None:
+            return self._dist[cell]
+        y, x = divmod(cell, self.grid.width)
+        return abs(y - self._ty) + abs(x - self._tx)
+
+    def is_optimal(self, cell: int, move: Optional[int]) -> bool:
+        """Whether `move` from `cell` brings Grace one step closer along a shortest path."""
+        here = self[cell]
+        if here <= 0:
+            return False
+        return self[self.grid.step(cell, move)] == here - 1
+
+    def random_reachable(self, rng: random.Random) -> Optional[int]:
+        """A random cell, other than the target, from which the target can be reached."""
+        size = self.grid.width * self.grid.height
+        # Rejection sampling is quick unless the target's region is a small part of the map
+        for _ in range(64):
+            cell = rng.randrange(size)
+            if cell != self.target and self[cell] > 0:
+                return cell
+        cells = [cell for cell in range(size) if self[cell] > 0]
+        return rng.choice(cells) if cells else None
+
+    def __deepcopy__(self, memo):
+        return self
+
+def _bfs(grid: GridMap, source: int) -> array:
+    width, size, blocked = grid.width, grid.width * grid.height, grid.blocked
+    dist = array("i", [UNREACHABLE]) * size
+    dist[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        reached = []
+        for cell in frontier:
+            x = cell % width
+            for nxt in (cell - width, cell + width, cell - 1 if x else -1, cell + 1 if x + 1 < width else -1):
+                if 0 <= nxt < size and dist[nxt] == UNREACHABLE and not blocked[nxt]:
+                    dist[nxt] = depth
+                    reached.append(nxt)
+        frontier = reached
+    return dist
+
+# Generated maps by (width, height, density, seed, keep), so seeded trials share one map
+_MAPS: "OrderedDict[Tuple, GridMap]" = OrderedDict()
+MAX_CACHED_MAPS = 16
+
+def generated_map(width: int, height: int, density: float = 0.0, seed: Optional[int] = None,
+                  keep: Sequence[Position] = ()) -> GridMap:
+    """`GridMap.generate` from a seed, cached when the seed is given."""
+    if seed is None:
+        return GridMap.generate(width, height, density, random.Random(), keep)
+    key = (width, height, density, seed, tuple(keep))
+    grid = _MAPS.get(key)
+    if grid is None:
+        grid = _MAPS[key] = GridMap.generate(width, height, density, random.Random(seed), keep)
+        while len(_MAPS) > MAX_CACHED_MAPS:
+            _MAPS.popitem(last=False)
+    else:
+        _MAPS.move_to_end(key)
+    return grid
+
+# (map key, target cell) -> field. A 1000x1000 field takes 4 MB, so only recent maps are kept.
+_FIELDS: "OrderedDict[Tuple[bytes, int], DistanceField]" = OrderedDict()
+MAX_CACHED_FIELDS = 16
+
+def distance_field(grid: GridMap, target: Position) -> DistanceField:
+    """The cached distance field of `grid` towards `target`, computed on first use."""
+    cell = grid.cell(target)
+    key = (grid.key, cell)
+    field = _FIELDS.get(key)
+    if field is None:
+        field = _FIELDS[key] = DistanceField(grid, cell)
+        while len(_FIELDS) > MAX_CACHED_FIELDS:
+            _FIELDS.popitem(last=False)
+    else:
+        _FIELDS.move_to_end(key)
+    return field
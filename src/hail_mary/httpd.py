@@ -0,0 +1,246 @@
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+STATUS_TEXT = {
+    101: "Switching Protocols",
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+@dataclass
+class HTTPRequest:
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes = b""
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else {}
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+    """Reads one HTTP/1.1 request from the stream. Returns None on a closed connection."""
+    try:
+        request_line = await reader.readline()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        return None
+    if not request_line.strip():
+        return None
+
+    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0) or 0)
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+    return HTTPRequest(method=method.upper(), path=url.path, query=query, headers=headers, body=body)
+
+async def write_response(writer: asyncio.StreamWriter, status: int, body: bytes = b"",
+                         content_type: str = "application/json",
+                         headers: Optional[Dict[str, str]] = None):
+    lines = [
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+    ]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+async def write_json(writer: asyncio.StreamWriter, status: int, payload: Any,
+                     headers: Optional[Dict[str, str]] = None):
+    await write_response(writer, status, json.dumps(payload).encode("utf-8"), headers=headers)
+
+async def start_sse(writer: asyncio.StreamWriter):
+    """Starts a server-sent-events response. The connection is closed when the stream ends."""
+    writer.write(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/event-stream\r\n"
+        b"Cache-Control: no-cache\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+    await writer.drain()
+
+async def send_sse(writer: asyncio.StreamWriter, data: Any, event: Optional[str] = None):
+    payload = data if isinstance(data, str) else json.dumps(data)
+    chunk = f"event: {event}\n" if event else ""
+    chunk += f"data: {payload}\n\n"
+    writer.write(chunk.encode("utf-8"))
+    await writer.drain()
+
+Handler = Callable[[HTTPRequest, asyncio.StreamReader, asyncio.StreamWriter], Awaitable[bool]]
+
+async def serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, handler: Handler):
+    """Runs the keep-alive request loop for one connection.
+
+    The handler returns True if the connection may be reused for another request.
+    """
+    try:
+        while True:
+            request = await read_request(reader)
+            if request is None:
+                break
+            if not await handler(request, reader, writer) or not request.keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        logger.error(f"HTTP handler error: {e}")
+    finally:
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+# --- WebSocket (RFC 6455): text frames, ping/pong and close; no extensions ---
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+def is_websocket_upgrade(request: HTTPRequest) -> bool:
+    return (request.headers.get("upgrade", "").lower() == "websocket"
+            and "sec-websocket-key" in request.headers)
+
+def _accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode("latin-1")).digest()).decode("latin-1")
+
+class WebSocket:
+    """One WebSocket connection. Clients mask their frames, servers must not."""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, mask: bool = False):
+        self.reader = reader
+        self.writer = writer
+        self.mask = mask
+        self.closed = False
+
+    async def _send_frame(self, opcode: int, payload: bytes):
+        header = bytearray([0x80 | opcode])
+        mask_bit = 0x80 if self.mask else 0
+        length = len(payload)
+        if length < 126:
+            header.append(mask_bit | length)
+        elif length < 1 << 16:
+            header.append(mask_bit | 126)
+            header += struct.pack("!H", length)
+        else:
+            header.append(mask_bit | 127)
+            header += struct.pack("!Q", length)
+        if self.mask:
+            key = os.urandom(4)
+            header += key
+            payload = bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+        self.writer.write(bytes(header) + payload)
+        await self.writer.drain()
+
+    async def send_text(self, text: str):
+        await self._send_frame(OP_TEXT, text.encode("utf-8"))
+
+    async def send_json(self, data: Any):
+        await self.send_text(json.dumps(data))
+
+    async def _read_frame(self):
+        first, second = await self.reader.readexactly(2)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", await self.reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+        key = await self.reader.readexactly(4) if second & 0x80 else None
+        payload = await self.reader.readexactly(length) if length else b""
+        if key:
+            payload = bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+        return bool(first & 0x80), opcode, payload
+
+    async def receive(self) -> Optional[str]:
+        """Returns the next text message, or None once the connection is closed."""
+        message = b""
+        try:
+            while True:
+                fin, opcode, payload = await self._read_frame()
+                if opcode == OP_PING:
+                    await self._send_frame(OP_PONG, payload)
+                elif opcode == OP_CLOSE:
+                    if not self.closed:
+                        self.closed = True
+                        await self._send_frame(OP_CLOSE, payload[:2])
+                    return None
+                elif opcode in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                    message += payload
+                    if fin:
+                        return message.decode("utf-8", errors="replace")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.closed = True
+            return None
+
+    async def close(self, code: int = 1000):
+        if not self.closed:
+            self.closed = True
+            try:
+                await self._send_frame(OP_CLOSE, struct.pack("!H", code))
+            except (ConnectionError, OSError):
+                pass
+
+async def accept_websocket(request: HTTPRequest, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> WebSocket:
+    """Completes the server side of the upgrade handshake."""
+    writer.write(
+        b"HTTP/1.1 101 Switching Protocols\r\n"
+        b"Upgrade: websocket\r\n"
+        b"Connection: Upgrade\r\n"
+        b"Sec-WebSocket-Accept: " + _accept_key(request.headers["sec-websocket-key"]).encode("latin-1") + b"\r\n\r\n"
+    )
+    await writer.drain()
+    return WebSocket(reader, writer)
+
+async def connect_websocket(host: str, port: int, path: str) -> WebSocket:
+    """Opens a client connection (used by tests and scripts)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode("latin-1")
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode("latin-1")
+    )
+    await writer.drain()
+    status = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if b" 101 " not in status or headers.get("sec-websocket-accept") != _accept_key(key):
+        writer.close()
+        raise ConnectionError(f"WebSocket handshake failed: {status.decode('latin-1').strip()}")
+    return WebSocket(reader, writer, mask=True)
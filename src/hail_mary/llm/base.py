@@ -1,12 +1,51 @@
 import abc
-from typing import Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
 class LLMClient(abc.ABC):
+    # Whether get_structured_text constrains output to a JSON schema natively
+    supports_structured_output = False
+
     def __init__(self):
         self.last_prompt: Optional[str] = None
         self.last_response: Optional[str] = None
+        self.total_tokens = 0
+
+    def _record_usage(self, tokens: Optional[int], prompt: str, response: Optional[str]):
+        """Adds a call's token count, estimating ~4 chars/token when the provider reports none."""
+        if tokens is None:
+            tokens = (len(prompt) + len(response or "")) // 4
+        self.total_tokens += tokens
+
+    async def warm_up(self):
+        """Called once when a campaign starts, e.g. to load a local model. No-op by default."""
+        pass
+
+    async def release(self):
+        """Called when the campaign ends, undoing anything warm_up pinned."""
+        pass
+
+    def timings(self) -> Dict[str, Any]:
+        """Provider-specific time breakdown (e.g. model load vs inference) for reports."""
+        return {}
+
+    def hedge_stats(self) -> Dict[str, int]:
+        """Cumulative hedging/failover counters (see llm/hedging.py); empty when not hedged."""
+        return {}
 
     @abc.abstractmethod
     async def get_generated_text(self, prompt: str) -> str:
         """Sends a prompt to the LLM and returns the text response."""
         pass
+
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        """Returns a response constrained to `schema` (a JSON object as text) where the provider
+        supports it. The default is a plain completion for the tolerant text parser."""
+        return await self.get_generated_text(prompt)
+
+    async def get_generated_candidates(self, prompt: str, n: int) -> List[str]:
+        """Returns `n` independent completions. Providers with a native `n` override this;
+        the default fans out `n` concurrent requests."""
+        if n <= 1:
+            return [await self.get_generated_text(prompt)]
+        return list(await asyncio.gather(*(self.get_generated_text(prompt) for _ in range(n))))
@@ -0,0 +1,81 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+class CascadeClient(LLMClient):
+    """Tries cheap/fast tiers first and escalates only when the caller rejects the answer.
+
+    `tiers` are (name, client) pairs ordered cheapest first. The last tier's answer is
+    always accepted. A tier that raises is skipped as if its answer had been rejected.
+    """
+    def __init__(self, tiers: List[Tuple[str, LLMClient]]):
+        super().__init__()
+        if not tiers:
+            raise ValueError("CascadeClient needs at least one tier")
+        self.tiers = tiers
+        self.tier_counts: Dict[str, int] = {name: 0 for name, _ in tiers}
+        self.escalations = 0
+
+    async def cascade(self, prompt: str, n: int = 1,
+                      accept: Optional[Callable[[List[str]], bool]] = None) -> Tuple[List[str], str]:
+        """Returns the first accepted batch of `n` candidates and the name of the tier that produced it."""
+        self.last_prompt = prompt
+        for i, (name, client) in enumerate(self.tiers):
+            last = i == len(self.tiers) - 1
+            try:
+                responses = await client.get_generated_candidates(prompt, n)
+            except Exception as e:
+                if last:
+                    raise
+                logger.warning(f"Cascade tier '{name}' failed, escalating: {e}")
+                self.escalations += 1
+                continue
+            finally:
+                self.total_tokens = sum(c.total_tokens for _, c in self.tiers)
+            if last or accept is None or accept(responses):
+                self.tier_counts[name] += 1
+                self.last_response = responses[0] if responses else ""
+                return responses, name
+            logger.debug(f"Cascade tier '{name}' rejected, escalating")
+            self.escalations += 1
+
+    async def warm_up(self):
+        for _, client in self.tiers:
+            await client.warm_up()
+
+    async def release(self):
+        for _, client in self.tiers:
+            await client.release()
+
+    def timings(self) -> Dict[str, Any]:
+        return {name: t for name, t in ((name, c.timings()) for name, c in self.tiers) if t}
+
+    def hedge_stats(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for _, client in self.tiers:
+            for key, value in client.hedge_stats().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    async def get_generated_text(self, prompt: str) -> str:
+        responses, _ = await self.cascade(prompt)
+        return responses[0]
+
+    async def get_generated_candidates(self, prompt: str, n: int) -> List[str]:
+        responses, _ = await self.cascade(prompt, n)
+        return responses
+
+def build_cascade(tiers_cfg: List[Dict[str, Any]]) -> CascadeClient:
+    """Builds a cascade from YAML tier entries: [{provider, model, name?, hedge?}, ...], cheapest first."""
+    from .hedging import build_hedged
+    from .registry import get_llm_client
+    tiers = []
+    for cfg in tiers_cfg:
+        name = cfg.get("name") or f"{cfg['provider']}/{cfg['model']}"
+        client = get_llm_client(cfg["provider"], cfg["model"])
+        if cfg.get("hedge"):
+            client = build_hedged(client, cfg["hedge"])
+        tiers.append((name, client))
+    return CascadeClient(tiers)
@@ -1,54 +1,130 @@
-import os
-from openai import AsyncOpenAI
+import json
+from typing import Any, Dict, List, Union
 from .base import LLMClient
+from .keypool import key_pool, require_api_keys
 
 class OpenAIClient(LLMClient):
-    def __init__(self, model: str = "gpt-4-turbo", api_key: str = None, base_url: str = None):
+    supports_structured_output = True
+
+    # Environment prefix for OPENAI_API_KEY / OPENAI_API_KEYS, and the key pool's provider name
+    key_env = "OPENAI"
+
+    def __init__(self, model: str = "gpt-4-turbo", api_key: Union[str, List[str]] = None, base_url: str = None):
         super().__init__()
         self.model = model
-        self.client = AsyncOpenAI(
-            api_key=api_key or os.getenv("OPENAI_API_KEY"),
-            base_url=base_url
-        )
+        self.base_url = base_url
+        self.pool = key_pool(self.key_env.lower(), require_api_keys(self.key_env, api_key), base_url)
+
+    def _transport(self, key: str):
+        from openai import AsyncOpenAI
+        # With several keys the pool moves a 429 to another key instead of the SDK retrying it
+        retries = {"max_retries": 0} if len(self.pool.keys) > 1 else {}
+        return AsyncOpenAI(api_key=key, base_url=self.base_url, **retries)
+
+    async def _create(self, **kwargs):
+        return await self.pool.run(lambda key: self.pool.transport(key, self._transport).chat.completions.create(**kwargs))
 
     async def get_generated_text(self, prompt: str) -> str:
         self.last_prompt = prompt
-        response = await self.client.chat.completions.create(
+        response = await self._create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}]
         )
         self.last_response = response.choices[0].message.content
+        usage = getattr(response, "usage", None)
+        self._record_usage(getattr(usage, "total_tokens", None), prompt, self.last_response)
+        return self.last_response
+
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        self.last_prompt = prompt
+        response = await self._create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "agent_response", "schema": schema, "strict": True}
+            }
+        )
+        self.last_response = response.choices[0].message.content or ""
+        usage = getattr(response, "usage", None)
+        self._record_usage(getattr(usage, "total_tokens", None), prompt, self.last_response)
         return self.last_response
 
+    async def get_generated_candidates(self, prompt: str, n: int) -> List[str]:
+        if n <= 1:
+            return [await self.get_generated_text(prompt)]
+        self.last_prompt = prompt
+        response = await self._create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            n=n
+        )
+        candidates = [choice.message.content or "" for choice in response.choices]
+        self.last_response = candidates[0]
+        usage = getattr(response, "usage", None)
+        self._record_usage(getattr(usage, "total_tokens", None), prompt, "".join(candidates))
+        return candidates
+
 class AnthropicClient(LLMClient):
-    def __init__(self, model: str = "claude-3-opus-20240229", api_key: str = None):
+    supports_structured_output = True
+
+    def __init__(self, model: str = "claude-3-opus-20240229", api_key: Union[str, List[str]] = None,
+                 base_url: str = None):
         super().__init__()
-        from anthropic import AsyncAnthropic
         self.model = model
-        self.client = AsyncAnthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
+        self.base_url = base_url
+        self.pool = key_pool("anthropic", require_api_keys("ANTHROPIC", api_key), base_url)
+
+    def _transport(self, key: str):
+        from anthropic import AsyncAnthropic
+        retries = {"max_retries": 0} if len(self.pool.keys) > 1 else {}
+        return AsyncAnthropic(api_key=key, base_url=self.base_url, **retries)
+
+    async def _create(self, **kwargs):
+        return await self.pool.run(lambda key: self.pool.transport(key, self._transport).messages.create(**kwargs))
 
     async def get_generated_text(self, prompt: str) -> str:
         self.last_prompt = prompt
-        response = await self.client.messages.create(
+        response = await self._create(
             model=self.model,
             max_tokens=1024,
             messages=[{"role": "user", "content": prompt}]
         )
         self.last_response = response.content[0].text
+        usage = getattr(response, "usage", None)
+        tokens = usage.input_tokens + usage.output_tokens if usage else None
+        self._record_usage(tokens, prompt, self.last_response)
         return self.last_response
 
-class DeepSeekClient(OpenAIClient):
-    def __init__(self, model: str = "deepseek-chat", api_key: str = None):
-        super().__init__(
-            model=model,
-            api_key=api_key or os.getenv("DEEPSEEK_API_KEY"),
-            base_url="https://api.deepseek.com"
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        # Forced tool call: the tool input is the structured response
+        self.last_prompt = prompt
+        response = await self._create(
+            model=self.model,
+            max_tokens=1024,
+            messages=[{"role": "user", "content": prompt}],
+            tools=[{"name": "respond", "description": "Submit your response.", "input_schema": schema}],
+            tool_choice={"type": "tool", "name": "respond"}
         )
+        tool_use = next((block for block in response.content if block.type == "tool_use"), None)
+        if tool_use is not None:
+            self.last_response = json.dumps(tool_use.input)
+        else:
+            self.last_response = "".join(getattr(block, "text", "") for block in response.content)
+        usage = getattr(response, "usage", None)
+        tokens = usage.input_tokens + usage.output_tokens if usage else None
+        self._record_usage(tokens, prompt, self.last_response)
+        return self.last_response
 
-class OllamaClient(OpenAIClient):
-    def __init__(self, model: str = "llama3", base_url: str = "http://localhost:11434/v1"):
+class DeepSeekClient(OpenAIClient):
+    # DeepSeek only offers unconstrained JSON mode, so it uses the text parser
+    supports_structured_output = False
+
+    key_env = "DEEPSEEK"
+
+    def __init__(self, model: str = "deepseek-chat", api_key: Union[str, List[str]] = None):
         super().__init__(
             model=model,
-            api_key="ollama", # Placeholder
-            base_url=base_url
+            api_key=api_key,
+            base_url="https://api.deepseek.com"
         )
@@ -1,18 +1,70 @@
+import copy
 import logging
+from typing import Any, Dict, List
 from .base import LLMClient
+from .keypool import key_pool
+from gemini.gemini_auth import GeminiAuthenticator
 from gemini.gemini_client import GeminiClient
 
 logger = logging.getLogger(__name__)
 
+def to_gemini_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Gemini's responseSchema is an OpenAPI subset: nullable instead of type unions, no additionalProperties."""
+    schema = copy.deepcopy(schema)
+    schema.pop("additionalProperties", None)
+    for prop in schema.get("properties", {}).values():
+        if isinstance(prop.get("type"), list):
+            types = [t for t in prop["type"] if t != "null"]
+            prop["nullable"] = len(types) < len(prop["type"])
+            prop["type"] = types[0]
+    return schema
+
 class GeminiWrapper(LLMClient):
-    def __init__(self, model: str = "gemini-2.5-flash"):
+    supports_structured_output = True
+
+    def __init__(self, model: str = "gemini-2.5-flash", base_url: str = None):
         super().__init__()
-        self.client = GeminiClient(model=model)
+        self.model = model
+        self.base_url = base_url
+        keys = GeminiAuthenticator().get_api_keys()
+        if not keys:
+            raise RuntimeError("Failed to configure Gemini client with any authentication method.")
+        self.pool = key_pool("gemini", keys, base_url)
+
+    def _transport(self, key: str) -> GeminiClient:
+        return self.pool.transport(key, lambda k: GeminiClient(model=self.model, base_url=self.base_url, api_key=k),
+                                   variant=self.model)
+
+    async def _call(self, method: str, *args, **kwargs):
+        """Runs a GeminiClient call on a pooled key; returns (result, usage)."""
+        async def call(key: str):
+            client = self._transport(key)
+            result = await getattr(client, method)(*args, **kwargs)
+            # No await between the call and this read, so concurrent requests cannot swap usage
+            return result, client.last_usage or {}
+        return await self.pool.run(call)
 
     async def get_generated_text(self, prompt: str) -> str:
         self.last_prompt = prompt
         logger.debug(f"Sending prompt to Gemini: {prompt[:100]}...")
-        response = await self.client.get_generated_text(prompt)
+        response, usage = await self._call("get_generated_text", prompt)
         self.last_response = response
+        self._record_usage(usage.get("totalTokenCount"), prompt, response)
         logger.debug(f"Received response from Gemini: {response[:100]}...")
         return response
+
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        self.last_prompt = prompt
+        response, usage = await self._call("get_generated_text", prompt, response_schema=to_gemini_schema(schema))
+        self.last_response = response
+        self._record_usage(usage.get("totalTokenCount"), prompt, response)
+        return response
+
+    async def get_generated_candidates(self, prompt: str, n: int) -> List[str]:
+        if n <= 1:
+            return [await self.get_generated_text(prompt)]
+        self.last_prompt = prompt
+        candidates, usage = await self._call("get_generated_candidates", prompt, n)
+        self.last_response = candidates[0] if candidates else ""
+        self._record_usage(usage.get("totalTokenCount"), prompt, "".join(candidates))
+        return candidates
@@ -0,0 +1,150 @@
+"""Hedged requests and failover for tail latency.
+
+`HedgedClient` sends each request to a primary client. If no answer has arrived by the
+configured percentile of recent latencies, it sends a duplicate (the hedge) to a
+fallback client, or to the primary again. The first answer wins and the loser is
+cancelled. If the primary fails outright, the request fails over to the fallback.
+"""
+import asyncio
+import bisect
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+class RollingLatency:
+    """Latencies of the last `window` requests, kept sorted for percentile lookups."""
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._recent: deque = deque()
+        self._sorted: List[float] = []
+
+    def observe(self, seconds: float):
+        self._recent.append(seconds)
+        bisect.insort(self._sorted, seconds)
+        if len(self._recent) > self.window:
+            old = self._recent.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._sorted:
+            return None
+        return self._sorted[min(len(self._sorted) - 1, int(p * len(self._sorted)))]
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+class HedgedClient(LLMClient):
+    """Wraps a primary client with percentile-triggered hedging and error failover.
+
+    Until `min_samples` latencies are known, requests hedge after `initial_delay`
+    (never, when None). Counters (`calls`, `hedges`, `hedge_wins`, `failovers`) let
+    callers attribute hedges to individual exchanges.
+    """
+    def __init__(self, primary: LLMClient, fallback: Optional[LLMClient] = None, percentile: float = 0.95,
+                 window: int = 200, min_samples: int = 20, min_delay: float = 0.05,
+                 initial_delay: Optional[float] = None):
+        super().__init__()
+        self.primary = primary
+        self.fallback = fallback
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.latency = RollingLatency(window)
+        self.supports_structured_output = primary.supports_structured_output
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    @property
+    def _clients(self) -> List[LLMClient]:
+        return [self.primary] + ([self.fallback] if self.fallback and self.fallback is not self.primary else [])
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait for the primary before hedging; None disables hedging."""
+        if len(self.latency) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, self.latency.percentile(self.percentile))
+
+    def hedge_stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "hedges": self.hedges, "hedge_wins": self.hedge_wins,
+                "failovers": self.failovers}
+
+    async def _run(self, call: Callable[[LLMClient], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        started = loop.time()
+        primary = asyncio.ensure_future(call(self.primary))
+        roles = {primary: "primary"}
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+                if not primary.done():
+                    self.hedges += 1
+                    roles[asyncio.ensure_future(call(self.fallback or self.primary))] = "hedge"
+
+            pending = set(roles)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    if task.exception() is None:
+                        # A hedged primary was slower than this, so the elapsed time is a lower bound
+                        self.latency.observe(loop.time() - started)
+                        if roles[task] == "hedge":
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                    logger.warning(f"{roles[task].capitalize()} request failed: {error}")
+                    if roles[task] == "primary" and not pending and self.fallback is not None:
+                        self.failovers += 1
+                        failover = asyncio.ensure_future(call(self.fallback))
+                        roles[failover] = "failover"
+                        pending.add(failover)
+            raise error
+        finally:
+            for task in roles:
+                if not task.done():
+                    task.cancel()
+            self.total_tokens = sum(c.total_tokens for c in self._clients)
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.last_prompt = prompt
+        self.last_response = await self._run(lambda client: client.get_generated_text(prompt))
+        return self.last_response
+
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        self.last_prompt = prompt
+        self.last_response = await self._run(lambda client: client.get_structured_text(prompt, schema))
+        return self.last_response
+
+    async def get_generated_candidates(self, prompt: str, n: int) -> List[str]:
+        self.last_prompt = prompt
+        candidates = await self._run(lambda client: client.get_generated_candidates(prompt, n))
+        self.last_response = candidates[0] if candidates else ""
+        return candidates
+
+    async def warm_up(self):
+        for client in self._clients:
+            await client.warm_up()
+
+    async def release(self):
+        for client in self._clients:
+            await client.release()
+
+    def timings(self) -> Dict[str, Any]:
+        return self.primary.timings()
+
+def build_hedged(primary: LLMClient, cfg: Dict[str, Any]) -> HedgedClient:
+    """Wraps `primary` from YAML: {percentile, fallback: {provider, model}, window, min_samples, ...}."""
+    from .registry import get_llm_client
+    options = dict(cfg)
+    fallback_cfg = options.pop("fallback", None)
+    fallback = get_llm_client(fallback_cfg["provider"], fallback_cfg["model"]) if fallback_cfg else None
+    return HedgedClient(primary, fallback, **options)
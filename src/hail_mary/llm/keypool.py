@@ -0,0 +1,190 @@
+"""Process-wide API key pools and shared provider transports.
+
+Every hosted provider client draws its keys from `key_pool(...)`. Clients with the same
+provider, endpoint and keys (both agents, the analyst, parallel missions) share one pool,
+so rate budgets and cooldowns are tracked once per process. The SDK client behind each
+key (`AsyncOpenAI`, `GeminiClient`, ...) is built once per key and event loop and reused.
+
+Keys come from `<PREFIX>_API_KEYS` (comma-separated) or `<PREFIX>_API_KEY`. Each request
+takes the key with the most remaining budget per in-flight request. A key that returns
+HTTP 429 cools down for the server's Retry-After (or `cooldown`, doubling on repeated
+429s) and the request moves to another key, so throughput grows with the number of keys.
+`settings.key_pools` sets per-provider options, e.g. `{gemini: {rpm: 15, cooldown: 60}}`;
+with `rpm`, each key's budget is a token bucket refilled at that rate.
+"""
+import asyncio
+import logging
+import os
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait if `exc` is an HTTP 429, 0.0 without a hint, else None."""
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status != 429:
+        return None
+    headers = getattr(exc, "headers", None) or getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after") or headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return 0.0
+
+def api_keys(env_prefix: str, explicit: Union[str, Sequence[str], None] = None) -> List[str]:
+    """Keys from `explicit` (a key or list), else `<PREFIX>_API_KEYS`, else `<PREFIX>_API_KEY`."""
+    if explicit:
+        return [explicit] if isinstance(explicit, str) else list(explicit)
+    keys = os.getenv(f"{env_prefix}_API_KEYS") or os.getenv(f"{env_prefix}_API_KEY") or ""
+    return [key.strip() for key in keys.split(",") if key.strip()]
+
+def require_api_keys(env_prefix: str, explicit: Union[str, Sequence[str], None] = None) -> List[str]:
+    keys = api_keys(env_prefix, explicit)
+    if not keys:
+        raise RuntimeError(f"No API key: set {env_prefix}_API_KEY or {env_prefix}_API_KEYS")
+    return keys
+
+@dataclass
+class KeyState:
+    key: str
+    tokens: float = 0.0 # Remaining budget when the pool has an rpm
+    updated: float = 0.0
+    cooldown_until: float = 0.0
+    strikes: int = 0 # Consecutive 429s
+    in_flight: int = 0
+    requests: int = 0
+    rate_limited: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"...{self.key[-4:]}"
+
+class KeyPool:
+    """Spreads requests over API keys by remaining budget and cools down rate-limited keys."""
+    def __init__(self, keys: Sequence[str], rpm: Optional[float] = None, cooldown: float = 30.0,
+                 max_cooldown: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        if not keys:
+            raise ValueError("A key pool needs at least one key")
+        self.clock = clock
+        self.keys = [KeyState(key, updated=clock()) for key in dict.fromkeys(keys)]
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.rpm = None
+        self.configure(rpm=rpm)
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = \
+            weakref.WeakKeyDictionary()
+
+    def configure(self, rpm: Optional[float] = None, cooldown: Optional[float] = None,
+                  max_cooldown: Optional[float] = None):
+        if rpm != self.rpm:
+            self.rpm = rpm
+            for state in self.keys:
+                state.tokens = float(rpm or 0)
+        if cooldown is not None:
+            self.cooldown = cooldown
+        if max_cooldown is not None:
+            self.max_cooldown = max_cooldown
+
+    def transport(self, key: str, factory: Callable[[str], T], variant: Hashable = None) -> T:
+        """The SDK client for `key` on the running loop, built by `factory(key)` on first use."""
+        cache = self._transports.setdefault(asyncio.get_running_loop(), {})
+        if (key, variant) not in cache:
+            cache[(key, variant)] = factory(key)
+        return cache[(key, variant)]
+
+    def _refill(self, state: KeyState, now: float):
+        if self.rpm:
+            state.tokens = min(float(self.rpm), state.tokens + (now - state.updated) * self.rpm / 60.0)
+        state.updated = now
+
+    def _ready_in(self, state: KeyState, now: float) -> float:
+        wait = max(0.0, state.cooldown_until - now)
+        if self.rpm and state.tokens < 1:
+            wait = max(wait, (1 - state.tokens) * 60.0 / self.rpm)
+        return wait
+
+    def pick(self) -> Optional[KeyState]:
+        """Reserves the usable key with the most budget per in-flight request, or returns None."""
+        now = self.clock()
+        for state in self.keys:
+            self._refill(state, now)
+        ready = [state for state in self.keys if self._ready_in(state, now) == 0]
+        if not ready:
+            return None
+        # Fewest requests so far breaks ties, which round-robins keys without an rpm
+        state = max(ready, key=lambda s: ((s.tokens if self.rpm else 1.0) / (1 + s.in_flight), -s.requests))
+        state.in_flight += 1
+        state.requests += 1
+        if self.rpm:
+            state.tokens -= 1
+        return state
+
+    async def acquire(self) -> KeyState:
+        """Like pick(), but waits for the first key to come back from cooldown or refill."""
+        while True:
+            state = self.pick()
+            if state is not None:
+                return state
+            now = self.clock()
+            await asyncio.sleep(max(0.001, min(self._ready_in(s, now) for s in self.keys)))
+
+    def cool_down(self, state: KeyState, seconds: Optional[float] = None):
+        state.strikes += 1
+        state.rate_limited += 1
+        if not seconds:
+            seconds = min(self.max_cooldown, self.cooldown * 2 ** (state.strikes - 1))
+        state.cooldown_until = max(state.cooldown_until, self.clock() + seconds)
+        logger.info(f"API key {state.label} rate limited; cooling down for {seconds:.1f}s")
+
+    async def run(self, call: Callable[[str], Awaitable[T]]) -> T:
+        """Runs `call(key)`. On a 429 the key cools down and the call retries on the next key,
+        until every key has been rate limited once; then the last 429 is raised."""
+        for attempt in range(len(self.keys)):
+            state = await self.acquire()
+            try:
+                result = await call(state.key)
+            except Exception as e:
+                wait = retry_after(e)
+                if wait is None:
+                    raise
+                self.cool_down(state, wait)
+                if attempt == len(self.keys) - 1:
+                    raise
+                continue
+            finally:
+                state.in_flight -= 1
+            state.strikes = 0
+            return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = self.clock()
+        return {state.label: {"requests": state.requests, "rate_limited": state.rate_limited,
+                              "cooling": state.cooldown_until > now} for state in self.keys}
+
+# Provider -> options from `settings.key_pools`
+POOL_SETTINGS: Dict[str, Dict[str, Any]] = {}
+_POOLS: Dict[Tuple[str, Optional[str], Tuple[str, ...]], KeyPool] = {}
+
+def configure_key_pools(settings: Optional[Dict[str, Dict[str, Any]]]):
+    """Applies per-provider pool options to future and existing pools."""
+    for provider, options in (settings or {}).items():
+        POOL_SETTINGS[provider] = dict(options or {})
+        for (name, _, _), pool in _POOLS.items():
+            if name == provider:
+                pool.configure(**POOL_SETTINGS[provider])
+
+def key_pool(provider: str, keys: Sequence[str], base_url: Optional[str] = None) -> KeyPool:
+    """The process-wide pool for `keys` on this provider and endpoint."""
+    ident = (provider, base_url, tuple(keys))
+    if ident not in _POOLS:
+        _POOLS[ident] = KeyPool(keys, **POOL_SETTINGS.get(provider, {}))
+    return _POOLS[ident]
+
+def pool_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Per-key counters of every pool, keyed by provider (and endpoint when one is set)."""
+    return {f"{provider}@{base_url}" if base_url else provider: pool.stats()
+            for (provider, base_url, _), pool in _POOLS.items()}
@@ -0,0 +1,218 @@
+"""Native Ollama client for local models.
+
+Unlike the OpenAI-compatible endpoint, the native API (/api/chat, /api/generate) lets the
+client control model residency (`keep_alive`) and reports where each call spent its time.
+The client:
+- pre-warms the model when a campaign starts and pins it with keep_alive=-1 until the
+  campaign releases it, so no mission pays a cold load;
+- detects how many requests the server runs in parallel for the model (OLLAMA_NUM_PARALLEL,
+  or a short probe) and gates requests with a semaphore of that size, shared by every
+  client of the same model so Rocky and Grace split the slots instead of queueing blindly;
+- records load, prompt-evaluation, generation and local queueing time separately.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "http://localhost:11434"
+NANOSECONDS = 1e9
+
+class OllamaError(RuntimeError):
+    pass
+
+@dataclass
+class OllamaTimings:
+    """Seconds spent per phase, summed over calls."""
+    calls: int = 0
+    cold_starts: int = 0 # Calls that had to load the model first
+    load_seconds: float = 0.0
+    prompt_seconds: float = 0.0
+    inference_seconds: float = 0.0
+    queue_seconds: float = 0.0 # Waiting locally for a free parallel slot
+    warmup_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: round(v, 4) if isinstance(v, float) else v for k, v in asdict(self).items()}
+
+class _ModelRuntime:
+    """Per event loop and (host, model): warm-up state and the shared slot semaphore."""
+    def __init__(self):
+        self.warm_lock = asyncio.Lock()
+        self.warm = False
+        self.parallel: Optional[int] = None
+        self.slots: Optional[asyncio.Semaphore] = None
+        self.users = 0
+
+# Runtimes hold loop-bound primitives, so they are kept per event loop
+_RUNTIMES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], _ModelRuntime]]" = \
+    weakref.WeakKeyDictionary()
+# Detected parallel capacity outlives event loops
+_CAPACITY: Dict[Tuple[str, str], int] = {}
+
+class OllamaClient(LLMClient):
+    supports_structured_output = True
+
+    def __init__(self, model: str = "llama3", base_url: Optional[str] = None, keep_alive: Any = -1,
+                 release_keep_alive: Any = "5m", parallel: Optional[int] = None, max_parallel: int = 8,
+                 timeout: float = 600.0):
+        super().__init__()
+        self.model = model
+        host = base_url or os.getenv("OLLAMA_HOST") or DEFAULT_HOST
+        if "://" not in host:
+            host = f"http://{host}"
+        # Accept the OpenAI-compatible URL too
+        self.base_url = host.rstrip("/")[:-3] if host.rstrip("/").endswith("/v1") else host.rstrip("/")
+        self.keep_alive = keep_alive # Held for the campaign; -1 keeps the model loaded
+        self.release_keep_alive = release_keep_alive # Restored when the campaign ends
+        self.parallel = parallel
+        self.max_parallel = max_parallel
+        self.timeout = timeout
+        self.stats = OllamaTimings()
+
+    # --- HTTP ---
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        request = urllib.request.Request(
+            f"{self.base_url}{path}", data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"}, method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode("utf-8", "replace")
+            raise OllamaError(f"Ollama {path} returned {e.code}: {detail[:200]}") from e
+        except urllib.error.URLError as e:
+            raise OllamaError(f"Ollama server at {self.base_url} is unreachable: {e.reason}") from e
+
+    async def _call(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._post, path, payload)
+
+    # --- Residency and capacity ---
+
+    def _runtime(self) -> _ModelRuntime:
+        runtimes = _RUNTIMES.setdefault(asyncio.get_running_loop(), {})
+        return runtimes.setdefault((self.base_url, self.model), _ModelRuntime())
+
+    async def warm_up(self):
+        """Loads and pins the model, then sizes concurrency to the server's parallel slots."""
+        runtime = self._runtime()
+        async with runtime.warm_lock:
+            runtime.users += 1
+            if runtime.warm:
+                return
+            started = time.perf_counter()
+            # A generate request without a prompt only loads the model
+            await self._call("/api/generate", {"model": self.model, "keep_alive": self.keep_alive})
+            self.stats.warmup_seconds += time.perf_counter() - started
+            runtime.parallel = await self._detect_parallel()
+            runtime.slots = asyncio.Semaphore(runtime.parallel)
+            runtime.warm = True
+            logger.info(f"Ollama {self.model} warm in {self.stats.warmup_seconds:.2f}s, {runtime.parallel} parallel slot(s)")
+
+    async def release(self):
+        """Hands the model back to the server's normal eviction once no client needs it."""
+        runtime = self._runtime()
+        async with runtime.warm_lock:
+            runtime.users = max(0, runtime.users - 1)
+            if runtime.users or not runtime.warm:
+                return
+            runtime.warm = False
+            try:
+                await self._call("/api/generate", {"model": self.model, "keep_alive": self.release_keep_alive})
+            except OllamaError as e:
+                logger.warning(f"Could not release Ollama model {self.model}: {e}")
+
+    async def _detect_parallel(self) -> int:
+        key = (self.base_url, self.model)
+        if self.parallel:
+            return self.parallel
+        if key in _CAPACITY:
+            return _CAPACITY[key]
+        configured = os.getenv("OLLAMA_NUM_PARALLEL")
+        if configured and urlparse(self.base_url).hostname in ("localhost", "127.0.0.1", "::1"):
+            capacity = max(1, int(configured))
+        else:
+            capacity = await self._probe_parallel()
+        _CAPACITY[key] = capacity
+        return capacity
+
+    async def _probe_parallel(self) -> int:
+        """Times one-token requests: k requests that take about as long as one run in parallel."""
+        probe = {"model": self.model, "prompt": "ok", "keep_alive": self.keep_alive, "stream": False,
+                 "options": {"num_predict": 1}}
+
+        async def timed(k: int) -> float:
+            started = time.perf_counter()
+            await asyncio.gather(*(self._call("/api/generate", probe) for _ in range(k)))
+            return time.perf_counter() - started
+
+        single = await timed(1)
+        capacity, k = 1, 2
+        while k <= self.max_parallel:
+            elapsed = await timed(k)
+            estimate = max(1, min(k, round(k * single / elapsed))) if elapsed > 0 else k
+            capacity = max(capacity, estimate)
+            if estimate < k:
+                break
+            k *= 2
+        return capacity
+
+    def timings(self) -> Dict[str, Any]:
+        return self.stats.as_dict()
+
+    # --- Generation ---
+
+    async def _chat(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+            "keep_alive": self.keep_alive,
+        }
+        if schema is not None:
+            payload["format"] = schema
+        runtime = self._runtime()
+        queued = time.perf_counter()
+        if runtime.slots is not None:
+            async with runtime.slots:
+                self.stats.queue_seconds += time.perf_counter() - queued
+                data = await self._call("/api/chat", payload)
+        else:
+            data = await self._call("/api/chat", payload)
+
+        load = data.get("load_duration", 0) / NANOSECONDS
+        self.stats.calls += 1
+        self.stats.load_seconds += load
+        # Ollama reports a few milliseconds of load even for resident models
+        if load > 0.1:
+            self.stats.cold_starts += 1
+        self.stats.prompt_seconds += data.get("prompt_eval_duration", 0) / NANOSECONDS
+        self.stats.inference_seconds += data.get("eval_duration", 0) / NANOSECONDS
+
+        self.last_prompt = prompt
+        self.last_response = (data.get("message") or {}).get("content", "")
+        tokens = None
+        if "prompt_eval_count" in data or "eval_count" in data:
+            tokens = data.get("prompt_eval_count", 0) + data.get("eval_count", 0)
+        self._record_usage(tokens, prompt, self.last_response)
+        return self.last_response
+
+    async def get_generated_text(self, prompt: str) -> str:
+        return await self._chat(prompt)
+
+    async def get_structured_text(self, prompt: str, schema: Dict[str, Any]) -> str:
+        return await self._chat(prompt, schema)
@@ -0,0 +1,26 @@
+import importlib
+from typing import Dict, Type
+from .base import LLMClient
+
+# Provider name -> "module:ClassName". Modules are imported only when a provider is requested,
+# so a mock-only campaign never pays for the openai/anthropic/gemini stacks.
+PROVIDERS: Dict[str, str] = {
+    "openai": "hail_mary.llm.clients:OpenAIClient",
+    "anthropic": "hail_mary.llm.clients:AnthropicClient",
+    "deepseek": "hail_mary.llm.clients:DeepSeekClient",
+    "ollama": "hail_mary.llm.ollama:OllamaClient",
+    "gemini": "hail_mary.llm.gemini_wrapper:GeminiWrapper",
+}
+
+def register_provider(name: str, target: str):
+    """Registers (or replaces) a provider as a lazy 'module:ClassName' reference."""
+    PROVIDERS[name] = target
+
+def get_client_class(provider: str) -> Type[LLMClient]:
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider: {provider}")
+    module_name, _, class_name = PROVIDERS[provider].partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+def get_llm_client(provider: str, model: str, **kwargs) -> LLMClient:
+    return get_client_class(provider)(model=model, **kwargs)
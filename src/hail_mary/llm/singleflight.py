@@ -0,0 +1,45 @@
+"""Coalesces identical in-flight LLM requests.
+
+When several callers send the same prompt to the same provider/model at the same time
+(e.g. the initial-thought prompts of repeated trials), only the first becomes a request.
+The others wait for its result. Results are not cached: once the request finishes, the
+next identical prompt is sent again.
+"""
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .base import LLMClient
+
+class SingleFlight:
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.requests = 0
+        self.coalesced = 0 # Callers served by another caller's request
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.requests += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # A cancelled waiter must not cancel the request the others share
+        return await asyncio.shield(task)
+
+# In-flight tasks are loop-bound, so each event loop has its own table
+_GROUPS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SingleFlight]" = weakref.WeakKeyDictionary()
+
+def single_flight() -> SingleFlight:
+    """The running loop's shared SingleFlight."""
+    return _GROUPS.setdefault(asyncio.get_running_loop(), SingleFlight())
+
+def client_key(client: LLMClient) -> Tuple[Hashable, ...]:
+    """Identifies the provider/model a client talks to. Clients without a `model` (wrappers,
+    test doubles) only coalesce with themselves."""
+    model = getattr(client, "model", None)
+    if not isinstance(model, str):
+        return (id(client),)
+    return (type(client).__name__, model, getattr(client, "base_url", None))
@@ -1,11 +1,14 @@
 import yaml
 from typing import List, Tuple, Dict, Any
-from .mission import AbstractMission, SequenceMission, GridMission, KnowledgeMission, TimeMission, LogicMission, ChemistryMission
+from .mission import AbstractMission
+from .mission_registry import build_mission
 
 def load_campaign_from_yaml(file_path: str) -> Tuple[List[AbstractMission], Dict[str, Any]]:
     with open(file_path, "r") as f:
         config = yaml.safe_load(f)
-    
+    return load_campaign_from_config(config)
+
+def load_campaign_from_config(config: Dict[str, Any]) -> Tuple[List[AbstractMission], Dict[str, Any]]:
     global_personas = config.get("personas", {})
     settings = config.get("settings", {})
     label_style = settings.get("label_style", "names")
@@ -14,24 +17,12 @@ def load_campaign_from_yaml(file_path: str) -> Tuple[List[AbstractMission], Dict
     for m_cfg in config.get("missions", []):
         m_type = m_cfg.get("type")
         m_name = m_cfg.get("name", m_type.capitalize() if m_type else "Unknown")
-        params = m_cfg.get("params", {})
-        
-        if m_type == "sequence":
-            mission = SequenceMission(sequence=params.get("sequence", []))
-        elif m_type == "grid":
-            mission = GridMission(size=params.get("size", 5))
-        elif m_type == "knowledge":
-            mission = KnowledgeMission()
-        elif m_type == "time":
-            mission = TimeMission(interval=params.get("interval", 4))
-        elif m_type == "logic":
-            mission = LogicMission(operator=params.get("operator", "AND"))
-        elif m_type == "chemistry":
-            mission = ChemistryMission()
-        else:
-            print(f"Warning: Unknown mission type '{m_type}'")
-            continue
-            
+        # Unknown types and invalid params fail here, before any agent is called
+        mission = build_mission(m_type, m_cfg.get("params") or {}, name=m_name,
+                                columnar_log=bool(settings.get("columnar_log")))
+        # Recorded in the log so the mission can be rebuilt for re-scoring (see rescore.py)
+        mission.log.metadata["spec"] = {"type": m_type, "params": m_cfg.get("params") or {}}
+
         mission.name = m_name # Override the default subclass name
         mission.set_overrides(
             rocky=m_cfg.get("rocky_prompt"),
@@ -46,7 +37,12 @@ def load_campaign_from_yaml(file_path: str) -> Tuple[List[AbstractMission], Dict
         
         mission.log.metadata["rocky_persona"] = m_cfg.get("rocky_persona") or global_personas.get("rocky")
         mission.log.metadata["grace_persona"] = m_cfg.get("grace_persona") or global_personas.get("grace")
+        if m_cfg.get("fork"):
+            mission.log.metadata["fork"] = m_cfg["fork"]
         
         missions.append(mission)
-            
-    return missions, global_personas
+
+    # Campaign-wide settings (duplex mode, channel timing, ...) travel with the global config
+    global_cfg = dict(global_personas)
+    global_cfg["settings"] = settings
+    return missions, global_cfg
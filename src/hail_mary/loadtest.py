@@ -0,0 +1,150 @@
+"""Load-test driver: runs many concurrent campaigns against the local fake LLM server.
+
+Usage:
+    python3 -m hail_mary.loadtest --provider openai --campaigns 50 --latency typical
+"""
+import argparse
+import asyncio
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .agents import LLMAlienAgent
+from .campaign import CampaignManager
+from .channel import CommChannel
+from .fakeserver import FakeLLMServer, LatencyProfile, FaultProfile
+from .llm.base import LLMClient
+from .loader import load_campaign_from_yaml
+from .mission import AbstractMission, SequenceMission
+
+PROVIDERS = ("openai", "anthropic", "gemini")
+
+class TimedClient(LLMClient):
+    """Delegates to a real provider client and records the latency of every call."""
+    def __init__(self, client: LLMClient, latencies: List[float], errors: List[str]):
+        super().__init__()
+        self.client = client
+        self.latencies = latencies
+        self.errors = errors
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.last_prompt = prompt
+        start = time.perf_counter()
+        try:
+            self.last_response = await self.client.get_generated_text(prompt)
+        except Exception as e:
+            self.errors.append(type(e).__name__)
+            raise
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+            self.total_tokens = self.client.total_tokens
+        return self.last_response
+
+def make_client(provider: str, base_url: str, model: str = "fake-model") -> LLMClient:
+    """Builds the real provider client, pointed at the fake server."""
+    if provider == "openai":
+        from .llm.clients import OpenAIClient
+        return OpenAIClient(model=model, api_key="fake-key", base_url=f"{base_url}/v1")
+    elif provider == "anthropic":
+        from .llm.clients import AnthropicClient
+        return AnthropicClient(model=model, api_key="fake-key", base_url=base_url)
+    elif provider == "gemini":
+        from .llm.gemini_wrapper import GeminiWrapper
+        os.environ.setdefault("GEMINI_API_KEY", "fake-key")
+        return GeminiWrapper(model=model, base_url=base_url)
+    else:
+        raise ValueError(f"Unsupported load-test provider: {provider}")
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+@dataclass
+class LoadTestReport:
+    provider: str
+    campaigns: int
+    calls: int
+    errors: Dict[str, int]
+    wall_time: float
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.wall_time if self.wall_time > 0 else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "campaigns": self.campaigns,
+            "calls": self.calls,
+            "errors": sum(self.errors.values()),
+            "wall_time_s": round(self.wall_time, 3),
+            "calls_per_s": round(self.throughput, 2),
+            "campaigns_per_s": round(self.campaigns / self.wall_time, 3) if self.wall_time > 0 else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 1),
+        }
+
+def _default_missions() -> List[AbstractMission]:
+    return [SequenceMission(sequence=[1, 2, 3, 4, 5])]
+
+async def run_load_test(provider: str = "openai", campaigns: int = 10, latency: Optional[LatencyProfile] = None,
+                        faults: Optional[FaultProfile] = None, config: Optional[str] = None,
+                        seed: Optional[int] = None) -> LoadTestReport:
+    """Runs `campaigns` concurrent campaigns through the real provider clients."""
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    async with FakeLLMServer(latency=latency, faults=faults, seed=seed) as server:
+        managers = []
+        for _ in range(campaigns):
+            missions = load_campaign_from_yaml(config)[0] if config else _default_missions()
+            rocky = LLMAlienAgent("Rocky", "Eridian", TimedClient(make_client(provider, server.base_url), latencies, errors))
+            grace = LLMAlienAgent("Grace", "Human", TimedClient(make_client(provider, server.base_url), latencies, errors))
+            manager = CampaignManager((rocky, grace), CommChannel(), verbose=False, save_log=False)
+            managers.append((manager, missions))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(manager.run_campaign_async(missions) for manager, missions in managers))
+        wall_time = time.perf_counter() - start
+
+    error_counts: Dict[str, int] = {}
+    for name in errors:
+        error_counts[name] = error_counts.get(name, 0) + 1
+    return LoadTestReport(
+        provider=provider, campaigns=campaigns, calls=len(latencies),
+        errors=error_counts, wall_time=wall_time, latencies=latencies
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Project Hail Mary - provider load test")
+    parser.add_argument("--provider", choices=PROVIDERS + ("all",), default="all")
+    parser.add_argument("--campaigns", type=int, default=10, help="Number of concurrent campaigns")
+    parser.add_argument("--config", type=str, help="Campaign YAML to run (defaults to a 5-step sequence mission)")
+    parser.add_argument("--latency", default="typical", help="Preset name or 'distribution:mean[:spread]'")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    faults = FaultProfile(error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, retry_after=0.1)
+    providers = PROVIDERS if args.provider == "all" else (args.provider,)
+    for provider in providers:
+        report = asyncio.run(run_load_test(
+            provider=provider, campaigns=args.campaigns, latency=LatencyProfile.parse(args.latency),
+            faults=faults, config=args.config, seed=args.seed
+        ))
+        print(f"[{provider}] {report.summary()}")
+        if report.errors:
+            print(f"[{provider}] errors: {report.errors}")
+
+if __name__ == "__main__":
+    main()
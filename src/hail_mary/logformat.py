@@ -0,0 +1,170 @@
+"""Compact binary campaign logs with a random-access index (`.hmlog`).
+
+Layout:
+    header  b"HMLOG1" + record codec byte + compression byte
+    blocks  [u32 length][compressed block], one per mission header and per run of exchanges
+    index   [u32 length][compressed index record]
+    footer  [u64 index offset] b"HMLOGIDX"
+
+A block holds length-prefixed records ([u32 length][record]). Each mission is written as
+a header block (the mission record without its history) plus blocks of up to
+`block_size` exchanges. The index lists every block's offset and its first exchange, so a
+reader can jump to any mission or turn and decompress only the blocks it needs.
+
+Records are msgpack and blocks are zstd frames when those packages are installed. Otherwise
+they fall back to compact JSON and zlib. The header records which codec was used, so any
+reader with the same packages can open the file. `pip install hail-mary[binlog]` installs both.
+"""
+import json
+import struct
+import zlib
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"HMLOG1"
+FOOTER_MAGIC = b"HMLOGIDX"
+BINARY_SUFFIX = ".hmlog"
+_LENGTH = struct.Struct("<I")
+_FOOTER = struct.Struct("<Q8s")
+
+class LogFormatError(ValueError):
+    pass
+
+def _record_codec(name: Optional[str] = None) -> Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """(name, pack, unpack); msgpack ('m') when installed, else compact JSON ('j')."""
+    if name in (None, "m"):
+        try:
+            import msgpack
+            return "m", lambda obj: msgpack.packb(obj, use_bin_type=True), lambda data: msgpack.unpackb(data, raw=False)
+        except ImportError:
+            if name == "m":
+                raise LogFormatError("This log was written with msgpack; install hail-mary[binlog] (or msgpack) to read it")
+    return ("j", lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8"),
+            lambda data: json.loads(data.decode("utf-8")))
+
+def _compression(name: Optional[str] = None) -> Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """(name, compress, decompress); zstd ('z') when installed, else zlib ('d')."""
+    if name in (None, "z"):
+        try:
+            import zstandard
+            compressor, decompressor = zstandard.ZstdCompressor(level=10), zstandard.ZstdDecompressor()
+            return "z", compressor.compress, decompressor.decompress
+        except ImportError:
+            if name == "z":
+                raise LogFormatError("This log was compressed with zstd; install hail-mary[binlog] (or zstandard) to read it")
+    return "d", lambda data: zlib.compress(data, 9), zlib.decompress
+
+def is_binary_log(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def write_binary_log(path: str, records: List[Dict[str, Any]], block_size: int = 64):
+    """Writes mission records (the JSON log shape) as an indexed binary log."""
+    codec, pack, _ = _record_codec()
+    compression, compress, _ = _compression()
+    index: Dict[str, Any] = {"version": 1, "missions": []}
+    with open(path, "wb") as f:
+        f.write(MAGIC + codec.encode() + compression.encode())
+
+        def write_block(items: List[Any]) -> List[int]:
+            payload = b"".join(_LENGTH.pack(len(data)) + data for data in map(pack, items))
+            block = compress(payload)
+            offset = f.tell()
+            f.write(_LENGTH.pack(len(block)) + block)
+            return [offset, len(block)]
+
+        for record in records:
+            history = record.get("history") or []
+            header = {key: value for key, value in record.items() if key != "history"}
+            entry = {"mission": record.get("mission"), "header": write_block([header]),
+                     "exchanges": len(history), "blocks": []}
+            for first in range(0, len(history), block_size):
+                entry["blocks"].append(write_block(history[first:first + block_size]) + [first])
+            index["missions"].append(entry)
+
+        index_offset = f.tell()
+        block = compress(pack(index))
+        f.write(_LENGTH.pack(len(block)) + block)
+        f.write(_FOOTER.pack(index_offset, FOOTER_MAGIC))
+
+class BinaryLogReader:
+    """Random access to an `.hmlog`: missions and exchanges are decoded only when asked for."""
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        head = self._file.read(len(MAGIC) + 2)
+        if head[:len(MAGIC)] != MAGIC:
+            self._file.close()
+            raise LogFormatError(f"{path} is not a binary campaign log")
+        _, _, self._unpack = _record_codec(chr(head[-2]))
+        _, _, self._decompress = _compression(chr(head[-1]))
+        self._file.seek(-_FOOTER.size, 2)
+        index_offset, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        if magic != FOOTER_MAGIC:
+            self._file.close()
+            raise LogFormatError(f"{path} has no index (was the write interrupted?)")
+        self.index = self._unpack(self._decompress(self._read_block(index_offset)))
+        self._missions: List[Dict[str, Any]] = self.index["missions"]
+
+    def _read_block(self, offset: int, length: Optional[int] = None) -> bytes:
+        self._file.seek(offset)
+        size = _LENGTH.unpack(self._file.read(_LENGTH.size))[0]
+        if length is not None and size != length:
+            raise LogFormatError(f"Corrupt block at offset {offset}")
+        return self._file.read(size)
+
+    def _records(self, offset: int, length: int) -> Iterator[Any]:
+        payload = self._decompress(self._read_block(offset, length))
+        pos = 0
+        while pos < len(payload):
+            size = _LENGTH.unpack_from(payload, pos)[0]
+            pos += _LENGTH.size
+            yield self._unpack(payload[pos:pos + size])
+            pos += size
+
+    def __len__(self) -> int:
+        return len(self._missions)
+
+    def mission_names(self) -> List[str]:
+        return [entry["mission"] for entry in self._missions]
+
+    def header(self, index: int) -> Dict[str, Any]:
+        """The mission record without its history."""
+        return next(self._records(*self._missions[index]["header"]))
+
+    def exchanges(self, index: int, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Streams exchanges [start, stop) of a mission, decompressing one block at a time."""
+        entry = self._missions[index]
+        stop = entry["exchanges"] if stop is None else min(stop, entry["exchanges"])
+        blocks = entry["blocks"]
+        b = max(0, bisect_right([first for _, _, first in blocks], start) - 1)
+        for offset, length, first in blocks[b:]:
+            if first >= stop:
+                return
+            for i, exchange in enumerate(self._records(offset, length), first):
+                if i >= stop:
+                    return
+                if i >= start:
+                    yield exchange
+
+    def turn(self, index: int, turn: int) -> List[Dict[str, Any]]:
+        """The exchanges of a half-duplex turn (1-based): Rocky's, then Grace's."""
+        return list(self.exchanges(index, 2 * (turn - 1), 2 * turn))
+
+    def mission(self, index: int) -> Dict[str, Any]:
+        record = self.header(index)
+        record["history"] = list(self.exchanges(index))
+        return record
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """The whole log in the JSON log shape."""
+        return [self.mission(i) for i in range(len(self))]
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,25 +3,82 @@ import sys
 import logging
 from .agents import MockEridian, LLMAlienAgent
 from .channel import CommChannel
+from .noise import build_noise_model
+from .broadcast import Observer
 from .campaign import CampaignManager
 from .mission import SequenceMission, GridMission, KnowledgeMission
 from .loader import load_campaign_from_yaml
-from .llm.clients import OpenAIClient, AnthropicClient, DeepSeekClient, OllamaClient
-from .llm.gemini_wrapper import GeminiWrapper
+from .llm.keypool import configure_key_pools
+from .llm.registry import get_llm_client
+from .stopping import build_stopping_policies
 
-def get_llm_client(provider: str, model: str):
-    if provider == "openai":
-        return OpenAIClient(model=model)
-    elif provider == "anthropic":
-        return AnthropicClient(model=model)
-    elif provider == "deepseek":
-        return DeepSeekClient(model=model)
-    elif provider == "ollama":
-        return OllamaClient(model=model)
-    elif provider == "gemini":
-        return GeminiWrapper(model=model)
+# Per-role `personas` keys passed through to LLMAlienAgent, e.g. grace_samples
+AGENT_OPTIONS = ("samples", "min_agreement", "structured", "repair", "features")
+
+def build_agent(name: str, role: str, provider: str, model: str, cascade: list = None, hedge: dict = None,
+                **options):
+    if cascade and hedge:
+        raise ValueError(f"{name}: set 'hedge' on individual cascade tiers instead of the whole cascade")
+    if cascade:
+        from .llm.cascade import build_cascade
+        client = build_cascade(cascade)
+        agent = LLMAlienAgent(name, role, client=client, **options)
+        agent.metadata = {"provider": "cascade", "model": " -> ".join(n for n, _ in client.tiers)}
+    elif provider == "mock":
+        agent = MockEridian(name, role)
+        agent.metadata = {"provider": "mock", "model": "rule-based"}
     else:
-        raise ValueError(f"Unknown provider: {provider}")
+        client = get_llm_client(provider, model)
+        if hedge:
+            from .llm.hedging import build_hedged
+            client = build_hedged(client, hedge)
+        agent = LLMAlienAgent(name, role, client=client, **options)
+        agent.metadata = {"provider": provider, "model": model}
+    return agent
+
+def build_manager(global_cfg: dict, **manager_options) -> CampaignManager:
+    """Builds the channel, agents and CampaignManager described by a loaded campaign config."""
+    settings = global_cfg.get("settings", {})
+    configure_key_pools(settings.get("key_pools"))
+
+    # Global Channel
+    channel = CommChannel(
+        noise_level=global_cfg.get("noise", 0.0),
+        total_energy=global_cfg.get("energy", float('inf')),
+        propagation_delay=settings.get("propagation_delay", 0.0),
+        bandwidth=settings.get("bandwidth"),
+        seed=settings.get("seed"),
+        noise_model=build_noise_model(settings.get("noise_model")),
+    )
+
+    # Agents based on Global Config
+    def create_agent(name, role, prefix):
+        provider = global_cfg.get(f"{prefix}_provider", "mock")
+        model = global_cfg.get(f"{prefix}_model", "default")
+        options = {key: global_cfg[f"{prefix}_{key}"] for key in AGENT_OPTIONS if f"{prefix}_{key}" in global_cfg}
+        return build_agent(name, role, provider, model, cascade=global_cfg.get(f"{prefix}_cascade"),
+                           hedge=global_cfg.get(f"{prefix}_hedge"), **options)
+
+    rocky = create_agent("Rocky", "Eridian", "rocky")
+    grace = create_agent("Grace", "Human", "grace")
+
+    # Broadcast mode: more Graces decoding the same Rocky stream
+    observers = []
+    for i, o_cfg in enumerate(global_cfg.get("grace_observers") or []):
+        options = {key: o_cfg[key] for key in AGENT_OPTIONS if key in o_cfg}
+        agent = build_agent("Grace", "Human", o_cfg.get("provider", "mock"), o_cfg.get("model", "default"),
+                            cascade=o_cfg.get("cascade"), hedge=o_cfg.get("hedge"), **options)
+        observers.append(Observer.from_config(o_cfg, i, agent))
+
+    return CampaignManager((rocky, grace), channel,
+                           duplex=settings.get("duplex", False),
+                           duplex_window=settings.get("duplex_window", 1),
+                           stopping=build_stopping_policies(settings.get("stopping")),
+                           max_turns=settings.get("max_turns", 20),
+                           agent_factory=build_agent,
+                           log_format=settings.get("log_format", "json"),
+                           observers=observers,
+                           **manager_options)
 
 def main():
     parser = argparse.ArgumentParser(description="Project Hail Mary - AI Xeno-Comms Simulation")
@@ -29,6 +86,8 @@ def main():
     parser.add_argument("--mission", type=str, help="Name of a specific mission to run")
     parser.add_argument("--verbose", action="store_true", help="Enable detailed trace logging")
     parser.add_argument("--tui", action="store_true", help="Enable immersive Terminal UI")
+    parser.add_argument("--speed", type=float, default=1.0, help="TUI playback speed multiplier (0 disables pacing)")
+    parser.add_argument("--auto-advance", action="store_true", help="Do not wait for Enter between TUI missions")
     
     args = parser.parse_args()
 
@@ -49,31 +108,9 @@ def main():
             print(f"Error: Mission '{args.mission}' not found in {args.config}")
             sys.exit(1)
 
-    # 2. Setup Global Channel
-    channel = CommChannel(
-        noise_level=global_cfg.get("noise", 0.0),
-        total_energy=global_cfg.get("energy", float('inf'))
-    )
-
-    # 3. Setup Agents based on Global Config
-    def create_agent(name, role, prefix):
-        provider = global_cfg.get(f"{prefix}_provider", "mock")
-        model = global_cfg.get(f"{prefix}_model", "default")
-        
-        if provider == "mock":
-            agent = MockEridian(name, role)
-            agent.metadata = {"provider": "mock", "model": "rule-based"}
-        else:
-            client = get_llm_client(provider, model)
-            agent = LLMAlienAgent(name, role, client=client)
-            agent.metadata = {"provider": provider, "model": model}
-        return agent
-
-    rocky = create_agent("Rocky", "Eridian", "rocky")
-    grace = create_agent("Grace", "Human", "grace")
-    
-    # 4. Run Mission
-    manager = CampaignManager((rocky, grace), channel, use_tui=args.tui)
+    # 2. Setup Channel, Agents and Campaign
+    manager = build_manager(global_cfg, use_tui=args.tui,
+                            playback_speed=args.speed, auto_advance=args.auto_advance)
     manager.run_campaign(missions)
 
 if __name__ == "__main__":
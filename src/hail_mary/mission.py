@@ -1,8 +1,19 @@
 import abc
-from typing import List, Dict, Any, Tuple, Optional
+import random
+from typing import List, Dict, Any, Tuple, Optional, Sequence
 from .protocol import ContactLog, Exchange
+from .grid import MOVE_NAMES, UNREACHABLE, GridMap, distance_field, generated_map
+from .sequences import build_sequence
 
 class AbstractMission(abc.ABC):
+    # JSON-schema subset for the YAML `params` block, checked when the campaign config loads
+    PARAMS_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}, "additionalProperties": False}
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "AbstractMission":
+        """Builds the mission from its validated YAML `params`."""
+        return cls(**params)
+
     def __init__(self, name: str):
         self.name = name
         self.log = ContactLog(mission_name=name)
@@ -11,6 +22,10 @@ class AbstractMission(abc.ABC):
         self.rocky_override = None
         self.grace_override = None
         self.success_turn: Optional[int] = None
+        self.stop_reason: Optional[str] = None
+        # Turn a stopping policy ended the mission on; success_turn stays reserved for update_state
+        self.stop_turn: Optional[int] = None
+        self.scored_turns = 0 # Turns scored by the campaign loop, in any contact mode
 
     def set_overrides(self, rocky: str = None, grace: str = None):
         self.rocky_override = rocky
@@ -41,8 +56,24 @@ class AbstractMission(abc.ABC):
     def get_results(self) -> Dict[str, Any]:
         pass
 
+    def expected_action(self) -> Optional[Any]:
+        """The ACTION scored as correct on the current step, or None if the step is not scored by ACTION."""
+        return None
+
 class SequenceMission(AbstractMission):
-    def __init__(self, sequence: List[int]):
+    PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {"sequence": {"type": ["array", "object"], "items": {"type": "integer"}}},
+        "additionalProperties": False,
+    }
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "SequenceMission":
+        # Named sequences are checked here too, so a bad name or range fails at load
+        return cls(sequence=build_sequence(params.get("sequence", [])))
+
+    def __init__(self, sequence: Sequence[int]):
+        # A list, or a lazy SequenceSlice from sequences.py for long sequences
         super().__init__("Universal Constants")
         self.sequence = sequence
         self.current_idx = 0
@@ -58,6 +89,9 @@ class SequenceMission(AbstractMission):
         grace = "You are receiving a stream of binary signals. You don't know what they mean. They could be numbers, locations, or something else. Observe the history and try to find a pattern. If you think you've found a value, output it as an ACTION."
         return rocky, grace
 
+    def expected_action(self) -> Optional[Any]:
+        return self.sequence[self.current_idx]
+
     def update_state(self, rocky_ex: Exchange, grace_ex: Exchange) -> bool:
         self.total_steps += 1
         target = self.sequence[self.current_idx]
@@ -71,35 +105,89 @@ class SequenceMission(AbstractMission):
         return {"accuracy": self.success_count / self.total_steps if self.total_steps > 0 else 0}
 
 class GridMission(AbstractMission):
-    def __init__(self, size: int = 5):
+    PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "size": {"type": "integer", "minimum": 2},
+            "width": {"type": "integer", "minimum": 2},
+            "height": {"type": "integer", "minimum": 2},
+            "obstacles": {"type": "number", "minimum": 0, "maximum": 0.9},
+            "map": {"type": "array", "items": {"type": "string"}},
+            "start": {"type": "array", "items": {"type": "integer"}, "minItems": 2, "maxItems": 2},
+            "target": {"type": ["array", "string"], "items": {"type": "integer"}, "minItems": 2, "maxItems": 2},
+            "seed": {"type": "integer"},
+        },
+        "additionalProperties": False,
+    }
+
+    def __init__(self, size: int = 5, width: Optional[int] = None, height: Optional[int] = None,
+                 obstacles: float = 0.0, map: Optional[List[str]] = None, start: Sequence[int] = (0, 0),
+                 target: Any = None, seed: Optional[int] = None):
         super().__init__("Rendezvous Task")
-        self.size = size
-        self.target = (size - 1, size - 1)
-        self.grace_pos = (0, 0)
+        start = (start[0], start[1])
+        if map is not None:
+            self.grid = GridMap.parse(map)
+        else:
+            self.grid = generated_map(width or size, height or size, obstacles, seed, keep=[start])
+        self.size = max(self.grid.width, self.grid.height)
+        if not self.grid.is_free(start):
+            raise ValueError(f"Start {start} is an obstacle")
+
+        if target == "random":
+            # Any cell Grace can reach from the start, from a stream independent of the obstacles
+            rng = random.Random(f"target:{seed}") if seed is not None else random.Random()
+            cell = distance_field(self.grid, start).random_reachable(rng)
+            if cell is None:
+                raise ValueError("No cell is reachable from the start")
+            target = self.grid.pos(cell)
+        elif target is None:
+            target = (self.grid.height - 1, self.grid.width - 1)
+        elif isinstance(target, str):
+            raise ValueError(f"target must be [y, x] or 'random', got {target!r}")
+        self.target = (target[0], target[1])
+        if not self.grid.is_free(self.target):
+            raise ValueError(f"Target {self.target} is an obstacle")
+        self.field = distance_field(self.grid, self.target)
+        self.shortest_path = self.field[self.grid.cell(start)]
+        if self.shortest_path == UNREACHABLE:
+            raise ValueError(f"Target {self.target} cannot be reached from {start}")
+        self.grace_pos = start
+        self._cell = self.grid.cell(start)
+        self.optimal_moves = 0
 
     @property
     def description(self) -> str:
         return f"Rocky is guiding Grace to a target. Grace has no map."
 
     def _get_task_prompts(self) -> Tuple[str, str]:
-        rocky = f"The alien is lost. You must guide it to the target location {self.target} in a {self.size}x{self.size} grid. The alien is currently at {self.grace_pos}."
+        rocky = f"The alien is lost. You must guide it to the target location {self.target} in a {self.grid.height}x{self.grid.width} grid. The alien is currently at {self.grace_pos}."
+        if not self.grid.open:
+            moves = ", ".join(f"{MOVE_NAMES[m]} ({m})" for m in self.grid.open_moves(self._cell))
+            rocky += f" Obstacles block some cells. Open moves from here: {moves}. The shortest path is {self.field[self._cell]} steps."
         grace = "You can perform actions 0, 1, 2, or 3. After each action, you receive a signal. What is the source trying to convey? Discern the relationship between actions and signals."
         return rocky, grace
 
     def update_state(self, rocky_ex: Exchange, grace_ex: Exchange) -> bool:
         self.total_steps += 1
         move = grace_ex.action
-        y, x = self.grace_pos
-        if move == 0: y = max(0, y - 1)
-        elif move == 1: y = min(self.size - 1, y + 1)
-        elif move == 2: x = max(0, x - 1)
-        elif move == 3: x = min(self.size - 1, x + 1)
-        
-        self.grace_pos = (y, x)
+        if self.field.is_optimal(self._cell, move):
+            self.optimal_moves += 1
+        self._cell = self.grid.step(self._cell, move)
+        self.grace_pos = self.grid.pos(self._cell)
         return self.grace_pos == self.target
 
     def get_results(self) -> Dict[str, Any]:
-        return {"steps": self.total_steps, "final_pos": self.grace_pos}
+        remaining = self.field[self._cell]
+        reached = remaining == 0
+        return {
+            "steps": self.total_steps,
+            "final_pos": self.grace_pos,
+            "shortest_path": self.shortest_path,
+            "remaining_distance": remaining,
+            "optimal_moves": self.optimal_moves,
+            # Shortest path over steps taken; 1.0 is a perfect rendezvous
+            "path_efficiency": self.shortest_path / self.total_steps if reached and self.total_steps else None,
+        }
 
 class KnowledgeMission(AbstractMission):
     def __init__(self):
@@ -118,6 +206,9 @@ class KnowledgeMission(AbstractMission):
         grace = f"A source is sending you values associated with different external entities. Decipher the values and try to map them to the entities."
         return rocky, grace
 
+    def expected_action(self) -> Optional[Any]:
+        return self.mapping[self.elements[self.current_el_idx]]
+
     def update_state(self, rocky_ex: Exchange, grace_ex: Exchange) -> bool:
         self.total_steps += 1
         target_weight = self.mapping[self.elements[self.current_el_idx]]
@@ -131,6 +222,12 @@ class KnowledgeMission(AbstractMission):
         return {"correct": self.success_count}
 
 class TimeMission(AbstractMission):
+    PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {"interval": {"type": "integer", "minimum": 1}},
+        "additionalProperties": False,
+    }
+
     def __init__(self, interval: int = 4):
         super().__init__("Temporal Sync")
         self.interval = interval
@@ -144,6 +241,9 @@ class TimeMission(AbstractMission):
         grace = "Observe the signal. Is there a repeating pattern or rhythm? If you detect a numerical property of the rhythm, output it as an ACTION."
         return rocky, grace
 
+    def expected_action(self) -> Optional[Any]:
+        return self.interval
+
     def update_state(self, rocky_ex: Exchange, grace_ex: Exchange) -> bool:
         self.total_steps += 1
         if grace_ex.action == self.interval:
@@ -153,7 +253,15 @@ class TimeMission(AbstractMission):
     def get_results(self) -> Dict[str, Any]:
         return {"sync_success": self.success_count > 0}
 
+LOGIC_OPERATOR_ACTIONS = {"AND": 0, "OR": 1, "XOR": 2}
+
 class LogicMission(AbstractMission):
+    PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {"operator": {"type": "string", "enum": sorted(LOGIC_OPERATOR_ACTIONS)}},
+        "additionalProperties": False,
+    }
+
     def __init__(self, operator: str = "AND"):
         super().__init__(f"Logic Gate: {operator}")
         self.operator = operator
@@ -175,11 +283,13 @@ class LogicMission(AbstractMission):
         grace = "You are receiving structured groups of signals. There seems to be a consistent rule connecting the signals in each group. What is the rule? If you can categorize the rule, output your category as an ACTION (0, 1, or 2)."
         return rocky, grace
 
+    def expected_action(self) -> Optional[Any]:
+        return LOGIC_OPERATOR_ACTIONS.get(self.operator)
+
     def update_state(self, rocky_ex: Exchange, grace_ex: Exchange) -> bool:
         self.total_steps += 1
         # Simple mapping for validation
-        op_map = {"AND": 0, "OR": 1, "XOR": 2}
-        if grace_ex.action == op_map.get(self.operator):
+        if grace_ex.action == LOGIC_OPERATOR_ACTIONS.get(self.operator):
             self.success_count += 1
         
         self.current_case = (self.current_case + 1) % len(self.test_cases)
@@ -0,0 +1,141 @@
+"""Mission type registry.
+
+Mission types map to lazy "module:ClassName" references, like LLM providers in
+llm/registry.py. A type's module is imported only when a campaign references it, and
+its `params` are validated against the class's PARAMS_SCHEMA while the config loads.
+
+External packages add types through the `hail_mary.missions` entry point group:
+
+    [project.entry-points."hail_mary.missions"]
+    docking = "my_pack.missions:DockingMission"
+
+Entry points are read (not imported) the first time an unregistered type is looked up.
+"""
+import importlib
+import logging
+from typing import Any, Dict, List, Optional, Type
+
+from .mission import AbstractMission
+from .protocol import ColumnarContactLog
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "hail_mary.missions"
+
+MISSION_TYPES: Dict[str, str] = {
+    "sequence": "hail_mary.mission:SequenceMission",
+    "grid": "hail_mary.mission:GridMission",
+    "knowledge": "hail_mary.mission:KnowledgeMission",
+    "time": "hail_mary.mission:TimeMission",
+    "logic": "hail_mary.mission:LogicMission",
+    "chemistry": "hail_mary.mission:ChemistryMission",
+}
+
+_entry_points_loaded = False
+
+class MissionConfigError(ValueError):
+    """A mission in a campaign config has an unknown type or invalid params."""
+
+def register_mission(name: str, target: str):
+    """Registers (or replaces) a mission type as a lazy 'module:ClassName' reference."""
+    MISSION_TYPES[name] = target
+
+def _entry_points() -> List[Any]:
+    from importlib import metadata
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    return list(eps.get(ENTRY_POINT_GROUP, [])) # Python < 3.10
+
+def discover_missions():
+    """Registers mission types published by installed packages; built-ins and explicit
+    registrations win over entry points of the same name."""
+    global _entry_points_loaded
+    _entry_points_loaded = True
+    for ep in _entry_points():
+        if ep.name in MISSION_TYPES:
+            logger.warning(f"Mission type '{ep.name}' from entry point {ep.value} shadows a registered type; ignored")
+            continue
+        MISSION_TYPES[ep.name] = ep.value
+
+def get_mission_class(mission_type: str) -> Type[AbstractMission]:
+    if mission_type not in MISSION_TYPES and not _entry_points_loaded:
+        discover_missions()
+    if mission_type not in MISSION_TYPES:
+        raise MissionConfigError(f"Unknown mission type '{mission_type}'. Known: {', '.join(sorted(MISSION_TYPES))}")
+    module_name, _, class_name = MISSION_TYPES[mission_type].partition(":")
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        raise MissionConfigError(f"Mission type '{mission_type}' ({MISSION_TYPES[mission_type]}) failed to load: {e}")
+    if not (isinstance(cls, type) and issubclass(cls, AbstractMission)):
+        raise MissionConfigError(f"Mission type '{mission_type}' ({MISSION_TYPES[mission_type]}) is not an AbstractMission")
+    return cls
+
+_TYPES = {
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+def validate_params(schema: Dict[str, Any], value: Any, path: str = "params") -> List[str]:
+    """Checks `value` against a JSON-schema subset (type, enum, minimum, maximum, items,
+    minItems, maxItems, properties, required, additionalProperties). Returns the problems found."""
+    types = schema.get("type")
+    if types is not None:
+        types = [types] if isinstance(types, str) else types
+        if not any(_TYPES[t](value) for t in types):
+            return [f"{path}: expected {' or '.join(types)}, got {type(value).__name__}"]
+    errors = []
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} is not one of {schema['enum']}")
+    if "minimum" in schema and _TYPES["number"](value) and value < schema["minimum"]:
+        errors.append(f"{path}: {value} is below the minimum {schema['minimum']}")
+    if "maximum" in schema and _TYPES["number"](value) and value > schema["maximum"]:
+        errors.append(f"{path}: {value} is above the maximum {schema['maximum']}")
+    if isinstance(value, list) and "minItems" in schema and len(value) < schema["minItems"]:
+        errors.append(f"{path}: expected at least {schema['minItems']} items, got {len(value)}")
+    if isinstance(value, list) and "maxItems" in schema and len(value) > schema["maxItems"]:
+        errors.append(f"{path}: expected at most {schema['maxItems']} items, got {len(value)}")
+    if isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            errors += validate_params(schema["items"], item, f"{path}[{i}]")
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", []):
+            if key not in value:
+                errors.append(f"{path}: missing required '{key}'")
+        for key, item in value.items():
+            if key in properties:
+                errors += validate_params(properties[key], item, f"{path}.{key}")
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}: unknown parameter '{key}' (expected: {', '.join(properties) or 'none'})")
+    return errors
+
+def build_mission(mission_type: str, params: Optional[Dict[str, Any]] = None, name: Optional[str] = None,
+                  columnar_log: bool = False) -> AbstractMission:
+    """Resolves, validates and constructs a mission, raising MissionConfigError on any problem.
+    With `columnar_log` the mission's log is a ColumnarContactLog holding whatever the
+    constructor put on its log."""
+    label = f"Mission '{name or mission_type}'"
+    try:
+        cls = get_mission_class(mission_type)
+    except MissionConfigError as e:
+        raise MissionConfigError(f"{label}: {e}")
+    params = params or {}
+    errors = validate_params(cls.PARAMS_SCHEMA, params)
+    if errors:
+        raise MissionConfigError(f"{label}: " + "; ".join(errors))
+    try:
+        mission = cls.from_params(params)
+    except (TypeError, ValueError) as e:
+        raise MissionConfigError(f"{label}: {e}")
+    if columnar_log and not isinstance(mission.log, ColumnarContactLog):
+        log = mission.log
+        mission.log = ColumnarContactLog(mission_name=name or log.mission_name, history=log.history,
+                                         metadata=log.metadata, store=log.store)
+    return mission
@@ -0,0 +1,223 @@
+"""Pluggable channel noise models and pre-generated noise tapes.
+
+A model turns a seeded RNG into a `NoiseTape`: the noise events for a run of consecutive
+bit positions on the channel. Tapes are generated in bulk and are independent of what is
+transmitted, so a seed fully determines the noise of a run and a recorded tape can be
+replayed against any signal.
+
+Events are sampled by geometric skips (one draw per event, not per bit) and flips are
+applied as a single big-integer XOR, so cost scales with the number of noise events
+rather than the number of bits.
+"""
+import abc
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+ERASURE = "x" # Received symbol for an erased bit
+
+def _positions(start: int, end: int, p: float, rng: random.Random) -> Iterator[int]:
+    """Positions in [start, end) at which an event of per-bit probability `p` occurs."""
+    if p <= 0 or start >= end:
+        return
+    if p >= 1:
+        yield from range(start, end)
+        return
+    log_q = math.log1p(-p)
+    pos = start - 1
+    while True:
+        # Geometric gap to the next event
+        pos += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if pos >= end:
+            return
+        yield pos
+
+def _mask(positions) -> int:
+    mask = 0
+    for pos in positions:
+        mask |= 1 << pos
+    return mask
+
+@dataclass
+class NoiseTape:
+    """Noise events over `length` bit positions. Bit i of each mask is position i."""
+    length: int
+    flips: int = 0
+    erasures: int = 0
+    deletions: int = 0
+    insertions: Dict[int, str] = field(default_factory=dict) # position -> bits inserted before it
+
+    def slice(self, start: int, n: int) -> "NoiseTape":
+        window = (1 << n) - 1
+        return NoiseTape(
+            length=n,
+            flips=(self.flips >> start) & window,
+            erasures=(self.erasures >> start) & window,
+            deletions=(self.deletions >> start) & window,
+            insertions={p - start: b for p, b in self.insertions.items() if start <= p < start + n},
+        )
+
+    def extend(self, other: "NoiseTape") -> "NoiseTape":
+        shift = self.length
+        insertions = dict(self.insertions)
+        insertions.update({p + shift: b for p, b in other.insertions.items()})
+        return NoiseTape(
+            length=self.length + other.length,
+            flips=self.flips | (other.flips << shift),
+            erasures=self.erasures | (other.erasures << shift),
+            deletions=self.deletions | (other.deletions << shift),
+            insertions=insertions,
+        )
+
+    def merge(self, other: "NoiseTape") -> "NoiseTape":
+        """Overlays two tapes of the same length (flips of the same bit cancel out)."""
+        insertions = dict(self.insertions)
+        for pos, bits in other.insertions.items():
+            insertions[pos] = insertions.get(pos, "") + bits
+        return NoiseTape(
+            length=max(self.length, other.length),
+            flips=self.flips ^ other.flips,
+            erasures=self.erasures | other.erasures,
+            deletions=self.deletions | other.deletions,
+            insertions=insertions,
+        )
+
+    def apply(self, chords: str) -> str:
+        n = len(chords)
+        if n == 0:
+            return chords
+        if self.flips:
+            # Reverse so that string index i is integer bit i, flip everything in one XOR
+            flipped = int(chords[::-1], 2) ^ (self.flips & ((1 << n) - 1))
+            chords = format(flipped, f"0{n}b")[::-1]
+        window = (1 << n) - 1
+        erasures, deletions = self.erasures & window, self.deletions & window
+        insertions = [p for p in self.insertions if p < n]
+        if not (erasures or deletions or insertions):
+            return chords
+
+        out: List[str] = []
+        for i, bit in enumerate(chords):
+            if i in self.insertions:
+                out.append(self.insertions[i])
+            if (deletions >> i) & 1:
+                continue
+            out.append(ERASURE if (erasures >> i) & 1 else bit)
+        return "".join(out)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"length": self.length, "flips": hex(self.flips), "erasures": hex(self.erasures),
+                "deletions": hex(self.deletions), "insertions": {str(k): v for k, v in self.insertions.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NoiseTape":
+        return cls(length=data["length"], flips=int(data["flips"], 16), erasures=int(data["erasures"], 16),
+                   deletions=int(data["deletions"], 16),
+                   insertions={int(k): v for k, v in data.get("insertions", {}).items()})
+
+class NoiseModel(abc.ABC):
+    @abc.abstractmethod
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        """Noise events for the next `n` bit positions of the stream."""
+        pass
+
+    def reset(self):
+        """Forgets any state carried between tapes (e.g. the burst state)."""
+        pass
+
+class NoNoise(NoiseModel):
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        return NoiseTape(n)
+
+class BitFlip(NoiseModel):
+    """Independent bit flips with probability `p` (binary symmetric channel)."""
+    def __init__(self, p: float):
+        self.p = p
+
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        return NoiseTape(n, flips=_mask(_positions(0, n, self.p, rng)))
+
+class GilbertElliott(NoiseModel):
+    """Two-state burst noise: a Markov chain switches between a good and a bad state,
+    each with its own flip probability. The state carries over between tapes."""
+    def __init__(self, p_good_to_bad: float, p_bad_to_good: float, error_good: float = 0.0, error_bad: float = 0.5):
+        self.p_good_to_bad = p_good_to_bad
+        self.p_bad_to_good = p_bad_to_good
+        self.error_good = error_good
+        self.error_bad = error_bad
+        self.bad = False
+
+    def reset(self):
+        self.bad = False
+
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        flips = 0
+        pos = 0
+        while pos < n:
+            # Sojourn in the current state is geometric in the leave probability
+            leave = self.p_bad_to_good if self.bad else self.p_good_to_bad
+            switch_at = next(_positions(pos, n, leave, rng), n)
+            flips |= _mask(_positions(pos, switch_at, self.error_bad if self.bad else self.error_good, rng))
+            if switch_at < n:
+                # The switching bit is already sent in the new state
+                self.bad = not self.bad
+                if rng.random() < (self.error_bad if self.bad else self.error_good):
+                    flips |= 1 << switch_at
+                pos = switch_at + 1
+            else:
+                pos = n
+        return NoiseTape(n, flips=flips)
+
+class Erasure(NoiseModel):
+    """Bits lost with probability `p`; the receiver sees an erasure mark in their place."""
+    def __init__(self, p: float):
+        self.p = p
+
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        return NoiseTape(n, erasures=_mask(_positions(0, n, self.p, rng)))
+
+class InsertionDeletion(NoiseModel):
+    """Random bits inserted before a position with `p_insert`; bits dropped with `p_delete`."""
+    def __init__(self, p_insert: float = 0.0, p_delete: float = 0.0):
+        self.p_insert = p_insert
+        self.p_delete = p_delete
+
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        insertions = {pos: str(rng.getrandbits(1)) for pos in _positions(0, n, self.p_insert, rng)}
+        return NoiseTape(n, deletions=_mask(_positions(0, n, self.p_delete, rng)), insertions=insertions)
+
+class CompositeNoise(NoiseModel):
+    """Applies several models at once, e.g. burst flips plus erasures."""
+    def __init__(self, models: List[NoiseModel]):
+        self.models = models
+
+    def reset(self):
+        for model in self.models:
+            model.reset()
+
+    def generate(self, n: int, rng: random.Random) -> NoiseTape:
+        tape = NoiseTape(n)
+        for model in self.models:
+            tape = tape.merge(model.generate(n, rng))
+        return tape
+
+NOISE_MODELS = {
+    "none": NoNoise,
+    "flip": BitFlip,
+    "gilbert_elliott": GilbertElliott,
+    "erasure": Erasure,
+    "indel": InsertionDeletion,
+}
+
+def build_noise_model(cfg: Any) -> Optional[NoiseModel]:
+    """Builds a model from YAML: {type: gilbert_elliott, p_good_to_bad: 0.01, ...} or a list of those."""
+    if cfg is None:
+        return None
+    if isinstance(cfg, list):
+        return CompositeNoise([build_noise_model(c) for c in cfg])
+    params = dict(cfg)
+    kind = params.pop("type", None)
+    if kind not in NOISE_MODELS:
+        raise ValueError(f"Unknown noise model '{kind}'. Known: {', '.join(NOISE_MODELS)}")
+    return NOISE_MODELS[kind](**params)
@@ -0,0 +1,167 @@
+"""Agent response parsing: a compiled single-pass tolerant parser plus the JSON schema
+used by providers with structured output.
+
+Accepts both the THOUGHT/SIGNAL/ACTION text format and the structured-output JSON
+object, and tracks how often each provider's responses fail to parse.
+"""
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Tags may be wrapped in markdown emphasis ("**SIGNAL:**") and spaced from their colon
+_TAG = re.compile(r"[*_]*(THOUGHT|SIGNAL|PREDICTION|ACTION)[*_]*\s*:[*_]*", re.IGNORECASE)
+_NOT_BINARY = re.compile(r"[^01]")
+_INT = re.compile(r"\s*(-?\d+)")
+_JSON_FENCE = re.compile(r"^\s*(?:```(?:json)?\s*)?(\{.*\})\s*(?:```)?\s*$", re.DOTALL)
+
+def response_schema(with_action: bool = True) -> Dict[str, Any]:
+    """JSON schema for a structured agent response."""
+    properties = {
+        "thought": {"type": "string", "description": "Internal reasoning and strategy"},
+        "signal": {"type": "string", "description": "Binary bitstream of '0' and '1' only"},
+    }
+    if with_action:
+        properties["action"] = {
+            "type": ["integer", "null"],
+            "description": "Identified number, coordinate or logic gate as an integer, or null",
+        }
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+@dataclass
+class ParseResult:
+    thought: str
+    chords: str
+    action: Optional[int]
+    # False when the response is unusable: no SIGNAL at all, or a required ACTION tag is missing
+    ok: bool = True
+
+    def as_tuple(self) -> Tuple[str, str, Optional[int]]:
+        return self.thought, self.chords, self.action
+
+def _parse_json(text: str, requires_action: bool) -> Optional[ParseResult]:
+    match = _JSON_FENCE.match(text)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(1))
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not any(k in data for k in ("signal", "SIGNAL")):
+        return None
+    signal = str(data.get("signal", data.get("SIGNAL")) or "")
+    action = data.get("action", data.get("ACTION"))
+    try:
+        action = int(action) if action is not None and action != "" else None
+    except (TypeError, ValueError):
+        action = None
+    thought = str(data.get("thought", data.get("THOUGHT")) or "...").strip() or "..."
+    chords = _NOT_BINARY.sub("", signal)
+    has_action = "action" in data or "ACTION" in data
+    return ParseResult(thought, chords, action, ok=bool(chords) and (has_action or not requires_action))
+
+def parse_response(response: str, requires_action: bool = False) -> ParseResult:
+    """Parses an agent response in one scan over its tags.
+
+    Matches the historical regex parser: THOUGHT runs to the next SIGNAL/PREDICTION/ACTION
+    tag, SIGNAL is the first non-blank line after its tag stripped to 0/1, ACTION is the first
+    PREDICTION/ACTION tag followed by an integer. Without a SIGNAL tag, the first line holding
+    binary digits that is not a THOUGHT/ACTION line is taken as the signal.
+    """
+    response = response or ""
+    stripped = response.lstrip()
+    if stripped.startswith("{") or stripped.startswith("```"):
+        structured = _parse_json(response, requires_action)
+        if structured:
+            return structured
+
+    thought = None
+    signal_at = None
+    action = None
+    has_action_tag = False
+    thought_start = None
+    for match in _TAG.finditer(response):
+        tag = match.group(1).upper()
+        if thought_start is not None and tag != "THOUGHT":
+            thought = response[thought_start:match.start()].strip()
+            thought_start = None
+        if tag == "THOUGHT":
+            if thought is None and thought_start is None:
+                thought_start = match.end()
+        elif tag == "SIGNAL":
+            if signal_at is None:
+                signal_at = match.end()
+        else:
+            has_action_tag = True
+            if action is None:
+                value = _INT.match(response, match.end())
+                if value:
+                    action = int(value.group(1))
+    if thought_start is not None:
+        thought = response[thought_start:].strip()
+
+    chords = ""
+    if signal_at is not None:
+        rest = response[signal_at:].lstrip()
+        chords = _NOT_BINARY.sub("", rest.split("\n", 1)[0])
+    else:
+        for line in response.strip().split("\n"):
+            cleaned = _NOT_BINARY.sub("", line)
+            if cleaned and not _TAG.search(line):
+                chords = cleaned
+                break
+
+    ok = bool(chords) and (has_action_tag or not requires_action)
+    return ParseResult(thought if thought is not None else "...", chords, action, ok=ok)
+
+def to_structured(response: str, with_action: bool = True) -> str:
+    """Re-encodes a text-format response as the structured-output JSON object."""
+    result = parse_response(response)
+    data: Dict[str, Any] = {"thought": result.thought, "signal": result.chords}
+    if with_action:
+        data["action"] = result.action
+    return json.dumps(data)
+
+REPAIR_PROMPT = (
+    "Your previous reply could not be parsed. Rewrite it in exactly this format, changing nothing else:\n"
+    "THOUGHT: <one line>\nSIGNAL: <only 0 and 1 characters>\n{action_line}"
+    "PREVIOUS REPLY:\n{reply}"
+)
+
+def repair_prompt(reply: str, requires_action: bool, max_chars: int = 2000) -> str:
+    """A short reformat-only re-prompt: the previous reply plus the expected format, no history."""
+    action_line = "ACTION: <integer, or leave blank>\n" if requires_action else ""
+    return REPAIR_PROMPT.format(action_line=action_line, reply=reply[:max_chars])
+
+@dataclass
+class ParseCounter:
+    responses: int = 0
+    failures: int = 0
+    repaired: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.responses if self.responses else 0.0
+
+# Provider name -> parse counters, shared process-wide
+PARSE_STATS: Dict[str, ParseCounter] = {}
+
+def record_parse(provider: str, ok: bool, repaired: bool = False):
+    counter = PARSE_STATS.setdefault(provider, ParseCounter())
+    counter.responses += 1
+    if not ok:
+        counter.failures += 1
+    if repaired:
+        counter.repaired += 1
+
+def parse_failure_rates() -> Dict[str, Dict[str, Any]]:
+    return {
+        provider: {"responses": c.responses, "failures": c.failures, "repaired": c.repaired,
+                   "failure_rate": round(c.failure_rate, 4)}
+        for provider, c in PARSE_STATS.items()
+    }
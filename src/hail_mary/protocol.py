@@ -1,24 +1,245 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict
+import hashlib
+import sys
+import zlib
+from array import array
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List, Optional, Any, Dict, Tuple, Union
+
+class TextStore:
+    """Interned storage for large text (prompts, raw responses), referenced by integer id.
+
+    Recently stored identical texts share one entry. Long texts are zlib-compressed against
+    a recent "keyframe" text as preset dictionary: consecutive prompts repeat the same
+    instructions and most of the history, so each costs little more than what changed.
+    Entries live as long as the store; each mission's ContactLog owns one, so a mission's
+    texts are freed with it.
+    """
+    WINDOW = 32768 # zlib's maximum dictionary size
+
+    def __init__(self, compress_above: int = 256, keyframe_every: int = 32, dedupe_window: int = 64):
+        self.compress_above = compress_above
+        self.keyframe_every = keyframe_every
+        self.dedupe_window = dedupe_window
+        self._texts: List[Union[str, bytes]] = []
+        self._keyframe_of = array("q") # Keyframe id a compressed text depends on, -1 for none
+        self._recent: "OrderedDict[int, int]" = OrderedDict() # Text digest -> id
+        self._keyframes: Dict[str, Tuple[int, int]] = {} # Stream -> (current keyframe id, texts since)
+        self._dictionaries: Dict[int, bytes] = {} # Keyframe id -> preset dictionary
+
+    def put(self, text: Optional[str], stream: str = "") -> Optional[int]:
+        """Stores `text`; texts of one `stream` (e.g. prompts) are compressed against each other."""
+        if text is None:
+            return None
+        data = text.encode("utf-8")
+        key = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+        text_id = self._recent.get(key)
+        if text_id is not None:
+            return text_id
+
+        text_id = len(self._texts)
+        self._recent[key] = text_id
+        if len(self._recent) > self.dedupe_window:
+            self._recent.popitem(last=False)
+        keyframe = -1
+        if len(data) <= self.compress_above:
+            self._texts.append(text)
+        else:
+            current, since = self._keyframes.get(stream, (-1, 0))
+            if current < 0 or since >= self.keyframe_every:
+                self._texts.append(zlib.compress(data))
+                self._dictionaries[text_id] = data[-self.WINDOW:]
+                self._keyframes[stream] = (text_id, 0)
+            else:
+                compressor = zlib.compressobj(zdict=self._dictionaries[current])
+                self._texts.append(compressor.compress(data) + compressor.flush())
+                self._keyframes[stream] = (current, since + 1)
+                keyframe = current
+        self._keyframe_of.append(keyframe)
+        return text_id
+
+    def get(self, text_id: Optional[int]) -> Optional[str]:
+        if text_id is None:
+            return None
+        entry = self._texts[text_id]
+        if isinstance(entry, str):
+            return entry
+        keyframe = self._keyframe_of[text_id]
+        if keyframe < 0:
+            return zlib.decompress(entry).decode("utf-8")
+        decompressor = zlib.decompressobj(zdict=self._dictionaries[keyframe])
+        return (decompressor.decompress(entry) + decompressor.flush()).decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    # Append-only, so copies of a log (fork branches, observers) share its store
+    def __deepcopy__(self, memo):
+        return self
+
+_SIGNAL_CHARS = frozenset("01x")
+
+def pack_chords(chords: str) -> Tuple[int, int, int]:
+    """Packs a received signal into (bits, erasures, length); bit i is character i.
+
+    Erased positions ('x', see noise.py) are set in the erasure mask. Raises ValueError
+    for any other character.
+    """
+    length = len(chords)
+    if not length:
+        return 0, 0, 0
+    if not _SIGNAL_CHARS.issuperset(chords):
+        raise ValueError(f"Not a binary signal: {chords[:40]!r}")
+    erasures = 0
+    if "x" in chords:
+        erasures = int(chords.replace("1", "0").replace("x", "1")[::-1], 2)
+        chords = chords.replace("x", "0")
+    return int(chords[::-1], 2), erasures, length
+
+def unpack_chords(bits: int, erasures: int, length: int) -> str:
+    if not length:
+        return ""
+    chords = format(bits, f"0{length}b")[::-1]
+    if erasures:
+        marks = format(erasures, f"0{length}b")[::-1]
+        chords = "".join("x" if m == "1" else c for c, m in zip(chords, marks))
+    return chords
+
+_SENDERS: Dict[str, str] = {}
 
-@dataclass
 class Exchange:
-    sender: str
-    thought: str
-    chords: str
-    action: Optional[Any] = None # Renamed from prediction for generality
-    raw_request: Optional[str] = None
-    raw_response: Optional[str] = None
+    """One transmission. Immutable and slotted: the signal is stored as packed bits and the
+    raw request/response text in a `TextStore`, referenced by id. Without a `store` the
+    exchange keeps its texts in one of its own, and holds no store when it has none."""
+    __slots__ = ("sender", "thought", "action", "sent_at", "received_at", "candidates", "agreement", "tier",
+                 "hedge", "_bits", "_erasures", "_length", "_request_id", "_response_id", "_store")
+
+    def __init__(self, sender: str, thought: str, chords: str, action: Optional[Any] = None,
+                 raw_request: Optional[str] = None, raw_response: Optional[str] = None,
+                 sent_at: Optional[float] = None, received_at: Optional[float] = None,
+                 candidates: Optional[List[Dict[str, Any]]] = None, agreement: Optional[float] = None,
+                 tier: Optional[str] = None, hedge: Optional[Dict[str, int]] = None,
+                 store: Optional[TextStore] = None):
+        if store is None and (raw_request is not None or raw_response is not None):
+            store = TextStore()
+        try:
+            packed = pack_chords(chords)
+        except ValueError:
+            packed = (chords, 0, -1) # Not a 0/1/x signal: kept verbatim
+        bits, erasures, length = packed
+        setter = object.__setattr__
+        setter(self, "sender", _SENDERS.setdefault(sender, sender))
+        setter(self, "thought", thought)
+        setter(self, "action", action) # Renamed from prediction for generality
+        setter(self, "sent_at", sent_at) # Mission-clock seconds
+        setter(self, "received_at", received_at)
+        setter(self, "candidates", candidates) # Parsed self-consistency samples
+        setter(self, "agreement", agreement) # Share of candidates agreeing with the chosen answer
+        setter(self, "tier", tier) # Model-cascade tier that answered
+        setter(self, "hedge", hedge) # Hedged/failed-over LLM requests behind this exchange
+        setter(self, "_bits", bits)
+        setter(self, "_erasures", erasures)
+        setter(self, "_length", length)
+        setter(self, "_request_id", store.put(raw_request, "request") if store is not None else None)
+        setter(self, "_response_id", store.put(raw_response, "response") if store is not None else None)
+        setter(self, "_store", store)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    @property
+    def chords(self) -> str:
+        if self._length < 0:
+            return self._bits
+        return unpack_chords(self._bits, self._erasures, self._length)
+
+    @property
+    def length(self) -> int:
+        return len(self._bits) if self._length < 0 else self._length
+
+    @property
+    def popcount(self) -> int:
+        """Number of '1' bits, without unpacking the signal."""
+        if self._length < 0:
+            return self._bits.count("1")
+        return bin(self._bits).count("1")
+
+    @property
+    def raw_request(self) -> Optional[str]:
+        return None if self._store is None else self._store.get(self._request_id)
+
+    @property
+    def raw_response(self) -> Optional[str]:
+        return None if self._store is None else self._store.get(self._response_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sender": self.sender,
+            "thought": self.thought,
+            "chords": self.chords,
+            "action": self.action,
+            "raw_request": self.raw_request,
+            "raw_response": self.raw_response,
+            "sent_at": self.sent_at,
+            "received_at": self.received_at,
+            "candidates": self.candidates,
+            "agreement": self.agreement,
+            "tier": self.tier,
+            "hedge": self.hedge
+        }
+
+    def replace(self, **changes) -> "Exchange":
+        return Exchange(**{**self.to_dict(), **changes}, store=self._store)
+
+    def __eq__(self, other):
+        if not isinstance(other, Exchange):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Exchange(sender={self.sender!r}, thought={self.thought!r}, chords={self.chords!r}, "
+                f"action={self.action!r}, sent_at={self.sent_at!r}, received_at={self.received_at!r})")
+
+    # Immutable, so copies can share the instance; pickles carry the text itself
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _exchange_from_dict, (self.to_dict(),)
+
+def _exchange_from_dict(data: Dict[str, Any]) -> Exchange:
+    return Exchange(**data)
 
 @dataclass
 class ContactLog:
     mission_name: str
     history: List[Exchange] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    store: TextStore = field(default_factory=TextStore, repr=False, compare=False) # Raw texts of this log's exchanges
 
     def record_exchange(self, exchange: Exchange):
         self.history.append(exchange)
 
+    def visible_to(self, observer: str, now: float) -> "ContactLog":
+        """What `observer` knows at time `now`: its own signals plus everything that has arrived."""
+        return ContactLog(
+            mission_name=self.mission_name,
+            history=[
+                e for e in self.history
+                if e.sender == observer or e.received_at is None or e.received_at <= now
+            ],
+            metadata=self.metadata,
+            store=self.store
+        )
+
     @property
     def signal_history(self) -> str:
         # Formatted history for agent prompts using dynamic labels
@@ -28,3 +249,61 @@ class ContactLog:
     @property
     def last_chords(self) -> str:
         return self.history[-1].chords if self.history else ""
+
+NO_ACTION = -sys.maxsize - 1 # Column sentinel for a missing or non-integer action
+
+@dataclass
+class ColumnarContactLog(ContactLog):
+    """ContactLog that also keeps per-exchange summary columns in typed arrays.
+
+    Aggregates over a mission (bits and pulses per sender, Grace's action series) read
+    the columns instead of walking exchanges. Prompt formatting is unchanged.
+    """
+    senders: List[str] = field(default_factory=list) # Column code -> sender name
+    sender_ids: array = field(default_factory=lambda: array("B"))
+    lengths: array = field(default_factory=lambda: array("I"))
+    popcounts: array = field(default_factory=lambda: array("I"))
+    actions: array = field(default_factory=lambda: array("q"))
+    wide_actions: Dict[int, int] = field(default_factory=dict) # Row -> integer action outside the column's range
+
+    def __post_init__(self):
+        history, self.history = self.history, []
+        for exchange in history:
+            self.record_exchange(exchange)
+
+    def record_exchange(self, exchange: Exchange):
+        super().record_exchange(exchange)
+        if exchange.sender not in self.senders:
+            self.senders.append(exchange.sender)
+        self.sender_ids.append(self.senders.index(exchange.sender))
+        self.lengths.append(exchange.length)
+        self.popcounts.append(exchange.popcount)
+        action = exchange.action
+        if isinstance(action, int) and NO_ACTION < action <= sys.maxsize:
+            self.actions.append(action)
+        else:
+            if isinstance(action, int):
+                self.wide_actions[len(self.actions)] = action
+            self.actions.append(NO_ACTION)
+
+    def _rows(self, sender: Optional[str]) -> List[int]:
+        if sender is None:
+            return list(range(len(self.sender_ids)))
+        if sender not in self.senders:
+            return []
+        code = self.senders.index(sender)
+        return [i for i, s in enumerate(self.sender_ids) if s == code]
+
+    def bits_sent(self, sender: Optional[str] = None) -> int:
+        if sender is None:
+            return sum(self.lengths)
+        return sum(self.lengths[i] for i in self._rows(sender))
+
+    def ones_sent(self, sender: Optional[str] = None) -> int:
+        if sender is None:
+            return sum(self.popcounts)
+        return sum(self.popcounts[i] for i in self._rows(sender))
+
+    def action_series(self, sender: str = "Grace") -> List[Optional[int]]:
+        return [self.wide_actions.get(i) if self.actions[i] == NO_ACTION else self.actions[i]
+                for i in self._rows(sender)]
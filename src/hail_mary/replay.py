@@ -0,0 +1,66 @@
+"""Replays a saved campaign log through the SimulationTUI.
+
+Usage:
+    python3 -m hail_mary.replay logs/campaign_log_YYYYMMDD_HHMMSS.json --speed 10   # or a .hmlog
+"""
+import argparse
+import asyncio
+from typing import Any, Dict, List
+
+from .analyze import load_records
+from .tui import SimulationTUI, ROCKY_STEP_DELAY, GRACE_STEP_DELAY
+
+MIN_SPEED = 1.0
+MAX_SPEED = 100.0
+
+def signal_cost(chords: str, energy_per_bit: float = 1.0) -> float:
+    """Energy spent on a transmission under the default CommChannel cost model."""
+    ones = chords.count("1")
+    return ones * energy_per_bit + (len(chords) - ones) * 0.1
+
+async def replay_mission(tui: SimulationTUI, mission: Dict[str, Any]):
+    history: List[Dict[str, Any]] = mission.get("history", [])
+    # Logs only store the energy left at the end, so walk the spend backwards to animate the bar
+    remaining = mission.get("energy_remaining", 0.0) or 0.0
+    energy = remaining + sum(signal_cost(h.get("chords") or "") for h in history)
+    tui.energy_total = energy
+    tui.post(energy=energy)
+
+    for i in range(0, len(history), 2):
+        rocky = history[i]
+        grace = history[i + 1] if i + 1 < len(history) else None
+        energy -= signal_cost(rocky.get("chords") or "")
+        tui.post(rocky_thought=rocky.get("thought"), rocky_signal=rocky.get("chords"), energy=energy)
+        await asyncio.sleep(tui.delay(ROCKY_STEP_DELAY))
+        if grace:
+            energy -= signal_cost(grace.get("chords") or "")
+            tui.post(grace_thought=grace.get("thought"), grace_action=grace.get("action"), energy=energy)
+        tui.post_turn(rocky.get("chords") or "", (grace or {}).get("chords") or "")
+        await asyncio.sleep(tui.delay(GRACE_STEP_DELAY))
+
+    outcome = "COMPLETED" if mission.get("turns_to_success") or mission.get("stop_reason") == "converged" else "ENDED"
+    await tui.wait_for_advance(f"REPLAY {outcome}: {mission.get('summary')}")
+
+async def replay_campaign(log_path: str, speed: float = 1.0, auto_advance: bool = True):
+    from rich.live import Live
+
+    campaign_data = load_records(log_path)
+
+    speed = min(MAX_SPEED, max(MIN_SPEED, speed))
+    for mission in campaign_data:
+        tui = SimulationTUI(mission["mission"], str(mission.get("summary")),
+                            playback_speed=speed, auto_advance=auto_advance)
+        tui.status_message = f"Replay {speed:g}x"
+        with Live(tui, screen=True, auto_refresh=True, refresh_per_second=tui.max_fps):
+            await replay_mission(tui, mission)
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a campaign log in the Terminal UI")
+    parser.add_argument("log_file", type=str)
+    parser.add_argument("--speed", type=float, default=1.0, help=f"Playback speed ({MIN_SPEED:g}x-{MAX_SPEED:g}x)")
+    parser.add_argument("--wait", action="store_true", help="Wait for Enter between missions")
+    args = parser.parse_args()
+    asyncio.run(replay_campaign(args.log_file, speed=args.speed, auto_advance=not args.wait))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Counterfactual re-scoring of recorded campaigns, without calling any LLM.
+
+Every recorded Exchange is fed back through a freshly built mission, so results reflect
+the current `update_state`/`get_results` rules. With `--noise`/`--noise-model`/`--energy`,
+signals also pass through a new CommChannel; `--seed` derives per-mission streams exactly
+as a live run does. Agents' actions are replayed as recorded (open loop): the replay shows
+how the same run would have scored, not what agents would have done differently.
+
+Usage:
+    python3 -m hail_mary.rescore logs/*.json [--config experiments/campaign.yaml] [--noise 0.05 --seed 7]
+"""
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .analyze import load_records
+from .channel import CommChannel
+from .mission import AbstractMission
+from .mission_registry import MissionConfigError, build_mission
+from .noise import build_noise_model
+from .parsing import parse_response
+from .protocol import Exchange
+
+logger = logging.getLogger(__name__)
+
+# Outcome fields compared between the recorded and re-scored runs
+OUTCOME_FIELDS = ("summary", "turns_to_success", "stop_reason")
+# Stops the replay decides itself; any other recorded reason came from a stopping policy
+REPLAYED_STOPS = ("success", "energy_depleted", "max_turns", "history_exhausted")
+
+@dataclass
+class Rescored:
+    log: str
+    index: int
+    mission: str
+    original: Dict[str, Any]
+    rescored: Dict[str, Any] = field(default_factory=dict)
+    diverged: List[str] = field(default_factory=list) # Outcome fields that differ
+    error: Optional[str] = None # Why the mission could not be re-scored
+
+def _normalized(value: Any) -> Any:
+    """Round-trips through JSON so tuples compare equal to the lists a log holds."""
+    return json.loads(json.dumps(value, default=str))
+
+def build_channel(channel_cfg: Optional[Dict[str, Any]]) -> Optional[CommChannel]:
+    """A channel from {noise, energy, seed, noise_model}, or None to keep recorded signals."""
+    if not channel_cfg:
+        return None
+    return CommChannel(
+        noise_level=channel_cfg.get("noise", 0.0),
+        total_energy=channel_cfg.get("energy", float("inf")),
+        seed=channel_cfg.get("seed"),
+        noise_model=build_noise_model(channel_cfg.get("noise_model")),
+    )
+
+def replay_history(mission: AbstractMission, history: List[Dict[str, Any]], original_stop: Optional[str],
+                   channel: Optional[CommChannel] = None) -> Dict[str, Any]:
+    """Scores recorded exchanges on `mission` and returns its outcome fields."""
+    rocky: Optional[Exchange] = None
+    turn = 0
+    stop = None
+    for entry in history:
+        chords = entry.get("chords") or ""
+        if channel is not None:
+            # Re-transmit what the agent meant to send, when the log has its reply
+            response = entry.get("raw_response")
+            clean = parse_response(response).chords if response else chords
+            chords = channel.transmit(clean)
+        exchange = Exchange(sender=entry.get("sender", ""), thought=entry.get("thought", ""), chords=chords,
+                            action=entry.get("action"), sent_at=entry.get("sent_at"),
+                            received_at=entry.get("received_at"), store=mission.log.store)
+        mission.log.record_exchange(exchange)
+        if exchange.sender == "Rocky":
+            rocky = exchange
+            continue
+        if rocky is None:
+            continue
+        turn += 1
+        if mission.update_state(rocky, exchange):
+            mission.success_turn = turn
+            stop = "success"
+            break
+        if channel is not None and channel.is_depleted():
+            stop = "energy_depleted"
+            break
+
+    if stop is None:
+        # The history ran out. Outcomes the replay models (success, and energy when a channel
+        # is given) should have been reproduced; others (max_turns, policy stops) carry over.
+        reproducible = ("success", "energy_depleted") if channel is not None else ("success",)
+        stop = "history_exhausted" if original_stop in reproducible else original_stop
+    mission.stop_reason = stop
+    return {"summary": _normalized(mission.get_results()), "turns_to_success": mission.success_turn,
+            "stop_reason": stop}
+
+def _missions_in(record: Dict[str, Any]) -> Iterable[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]]:
+    """(label, full history, original outcome) per scored run: the record, or each fork branch,
+    plus each broadcast observer."""
+    if record.get("branches"):
+        for branch in record["branches"]:
+            # Branch histories start at the fork point
+            yield (f"{record['mission']}/{branch.get('branch')}", record.get("history", []) + branch.get("history", []),
+                   branch)
+    else:
+        yield record["mission"], record.get("history", []), record
+    for observer in record.get("observers") or []:
+        yield f"{record['mission']}/{observer.get('observer')}", observer.get("history", []), observer
+
+def rescore_records(records: List[Dict[str, Any]], log: str = "", specs: Optional[Dict[str, Dict[str, Any]]] = None,
+                    channel_cfg: Optional[Dict[str, Any]] = None) -> List[Rescored]:
+    """Re-scores every mission record of one campaign log.
+
+    Missions are rebuilt from the record's `spec` (type and params), or from `specs` by
+    mission name for logs written before specs were recorded.
+    """
+    results = []
+    for index, record in enumerate(records):
+        spec = record.get("spec") or (specs or {}).get(record.get("mission"))
+        for label, history, original in _missions_in(record):
+            outcome = {key: _normalized(original.get(key)) for key in OUTCOME_FIELDS}
+            result = Rescored(log, index, label, outcome)
+            results.append(result)
+            if not spec:
+                result.error = "no mission spec in the log; pass the campaign config"
+                continue
+            try:
+                mission = build_mission(spec["type"], spec.get("params") or {}, name=record["mission"])
+            except MissionConfigError as e:
+                result.error = str(e)
+                continue
+            channel = build_channel(channel_cfg)
+            if channel is not None and channel.seed is not None:
+                # The same per-mission stream a live run with this seed would use
+                channel.reseed("mission", index)
+            result.rescored = replay_history(mission, history, original.get("stop_reason"), channel)
+            compared = OUTCOME_FIELDS
+            if result.rescored["stop_reason"] not in REPLAYED_STOPS:
+                # Policies are not replayed, and logs written before stop_turn existed put a
+                # converged stop's turn in turns_to_success
+                compared = tuple(key for key in OUTCOME_FIELDS if key != "turns_to_success")
+            result.diverged = [key for key in compared if result.rescored[key] != outcome[key]]
+    return results
+
+def rescore_log(path: str, specs: Optional[Dict[str, Dict[str, Any]]] = None,
+                channel_cfg: Optional[Dict[str, Any]] = None) -> List[Rescored]:
+    return rescore_records(load_records(path), log=path, specs=specs, channel_cfg=channel_cfg)
+
+def _rescore_batch(args: Tuple[List[str], Optional[Dict[str, Dict[str, Any]]], Optional[Dict[str, Any]]]) -> List[Rescored]:
+    paths, specs, channel_cfg = args
+    return [result for path in paths for result in rescore_log(path, specs, channel_cfg)]
+
+def rescore_archive(paths: List[str], specs: Optional[Dict[str, Dict[str, Any]]] = None,
+                    channel_cfg: Optional[Dict[str, Any]] = None, workers: int = 1,
+                    batch_size: int = 64) -> List[Rescored]:
+    """Re-scores many logs. With workers > 1, batches of logs are spread over processes."""
+    if workers <= 1 or len(paths) <= batch_size:
+        return _rescore_batch((paths, specs, channel_cfg))
+    batches = [(paths[i:i + batch_size], specs, channel_cfg) for i in range(0, len(paths), batch_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [result for batch in pool.map(_rescore_batch, batches) for result in batch]
+
+def specs_from_config(config_path: str) -> Dict[str, Dict[str, Any]]:
+    """Mission name -> {type, params} from a campaign YAML."""
+    import yaml
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+    specs = {}
+    for m_cfg in config.get("missions", []):
+        m_type = m_cfg.get("type")
+        specs[m_cfg.get("name", m_type.capitalize() if m_type else "Unknown")] = {
+            "type": m_type, "params": m_cfg.get("params") or {}}
+    return specs
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score campaign logs under the current mission rules, without LLM calls")
+    parser.add_argument("logs", nargs="+", help="Campaign log files")
+    parser.add_argument("--config", help="Campaign YAML, for logs that do not record mission specs")
+    parser.add_argument("--noise", type=float, help="Re-transmit signals through a channel with this flip rate")
+    parser.add_argument("--noise-model", help="Noise model as JSON, e.g. '{\"type\": \"erasure\", \"p\": 0.1}'")
+    parser.add_argument("--energy", type=float, help="Channel energy budget per mission")
+    parser.add_argument("--seed", type=int, help="Channel seed (per-mission streams as in a live run)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--json", action="store_true", help="Print every result as JSON")
+    args = parser.parse_args()
+
+    channel_cfg = {}
+    if args.noise is not None:
+        channel_cfg["noise"] = args.noise
+    if args.noise_model:
+        channel_cfg["noise_model"] = json.loads(args.noise_model)
+    if args.energy is not None:
+        channel_cfg["energy"] = args.energy
+    if channel_cfg and args.seed is not None:
+        channel_cfg["seed"] = args.seed
+    specs = specs_from_config(args.config) if args.config else None
+
+    results = rescore_archive(args.logs, specs, channel_cfg or None, workers=args.workers)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+        return
+
+    failed = [r for r in results if r.error]
+    diverged = [r for r in results if r.diverged]
+    print(f"Re-scored {len(results) - len(failed)} of {len(results)} missions from {len(args.logs)} log(s); "
+          f"{len(diverged)} diverged")
+    for r in diverged:
+        changes = ", ".join(f"{key}: {r.original[key]!r} -> {r.rescored[key]!r}" for key in r.diverged)
+        print(f"  {r.log} #{r.index} {r.mission}: {changes}")
+    for r in failed:
+        print(f"  {r.log} #{r.index} {r.mission}: skipped ({r.error})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import asyncio
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+class EventScheduler:
+    """Discrete-event scheduler on a mission clock.
+
+    Events are kept in a heap and fired in timestamp order by a single runner task,
+    which sleeps until the earliest pending event. The clock is real (loop) time since
+    `start()`, multiplied by `time_scale` so light-lag experiments can run compressed.
+    """
+    def __init__(self, time_scale: float = 1.0):
+        self.time_scale = time_scale
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._origin: Optional[float] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+
+    def now(self) -> float:
+        if self._origin is None:
+            return 0.0
+        return (asyncio.get_running_loop().time() - self._origin) * self.time_scale
+
+    def schedule(self, at: float, callback: Callable[[], None]):
+        """Fires `callback` once the mission clock reaches `at`."""
+        heapq.heappush(self._events, (at, next(self._counter), callback))
+        if self._wakeup:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._events)
+
+    def start(self):
+        self._origin = asyncio.get_running_loop().time()
+        self._wakeup = asyncio.Event()
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self, flush: bool = True):
+        """Stops the runner. With `flush`, events still pending fire immediately in order."""
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        while flush and self._events:
+            heapq.heappop(self._events)[2]()
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            if not self._events:
+                await self._wakeup.wait()
+                continue
+            at = self._events[0][0]
+            delay = (at - self.now()) / self.time_scale if self.time_scale > 0 else 0.0
+            if delay > 0:
+                try:
+                    # A newly scheduled earlier event interrupts the wait
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+            while self._events and self._events[0][0] <= max(at, self.now()):
+                heapq.heappop(self._events)[2]()
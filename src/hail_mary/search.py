@@ -0,0 +1,264 @@
+"""Adaptive search for the parameter value where missions stop succeeding.
+
+Instead of a brute-force grid of campaigns, each trial is placed where it tells us most
+about the threshold (the value with a 50% success rate):
+
+- `bayes` (default) keeps a posterior over the threshold on a grid, assuming success
+  falls off along a logistic curve of width `slope`. Each trial runs at the posterior
+  median, and the search stops once the `confidence` credible interval is narrower than
+  `tolerance`.
+- `bisect` halves a bracket, moving towards the side where the success rate at the
+  midpoint says the threshold lies. The final bracket is the interval.
+
+The parameter is `noise` or `energy` (the channel), or `params.<path>` inside every
+selected mission's params, e.g. `params.size` (grid) or `params.sequence.length`.
+
+Usage:
+    python3 -m hail_mary.search experiments/campaign.yaml --param noise --low 0 --high 0.3
+    python3 -m hail_mary.search experiments/campaign.yaml --param params.size --low 3 --high 30 --method bisect
+"""
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from .loader import load_campaign_from_config
+from .mission_registry import get_mission_class
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PARAMETERS = ("noise", "energy")
+# Success rises with these parameters; it falls with everything else (noise, size, length)
+INCREASING = ("energy",)
+# A run succeeded if its mission completed or a policy stopped it as converged
+SUCCESS_STOPS = ("success", "converged")
+
+# A trial: parameter value -> (successes, runs)
+TrialFn = Callable[[float], Awaitable[Tuple[int, int]]]
+
+@dataclass
+class Trial:
+    value: float
+    successes: int
+    runs: int
+
+@dataclass
+class SearchResult:
+    parameter: str
+    method: str
+    threshold: float
+    interval: Tuple[float, float]
+    converged: bool
+    trials: List[Trial] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        return sum(t.runs for t in self.trials)
+
+class BayesianThreshold:
+    """Grid posterior over the threshold of a logistic success curve."""
+    def __init__(self, low: float, high: float, increasing: bool = False, slope: Optional[float] = None,
+                 lapse: float = 0.02, points: int = 201, integer: bool = False):
+        self.low, self.high = low, high
+        self.increasing = increasing
+        self.slope = slope or (high - low) / 20
+        self.lapse = lapse
+        self.integer = integer
+        self.grid = [low + (high - low) * i / (points - 1) for i in range(points)]
+        self.log_posterior = [0.0] * points
+
+    def success_probability(self, value: float, threshold: float) -> float:
+        z = (value - threshold if self.increasing else threshold - value) / self.slope
+        z = max(-50.0, min(50.0, z))
+        return self.lapse + (1 - 2 * self.lapse) / (1 + math.exp(-z))
+
+    def update(self, value: float, successes: int, runs: int):
+        failures = runs - successes
+        for i, threshold in enumerate(self.grid):
+            p = self.success_probability(value, threshold)
+            self.log_posterior[i] += successes * math.log(p) + failures * math.log(1 - p)
+
+    def _quantile(self, q: float) -> float:
+        top = max(self.log_posterior)
+        weights = [math.exp(lp - top) for lp in self.log_posterior]
+        total, cumulative = sum(weights), 0.0
+        for threshold, weight in zip(self.grid, weights):
+            cumulative += weight
+            if cumulative >= q * total:
+                return threshold
+        return self.grid[-1]
+
+    def estimate(self) -> float:
+        return self._quantile(0.5)
+
+    def interval(self, confidence: float) -> Tuple[float, float]:
+        return self._quantile((1 - confidence) / 2), self._quantile((1 + confidence) / 2)
+
+    def next_point(self) -> float:
+        value = self.estimate()
+        return int(round(value)) if self.integer else value
+
+class Bisection:
+    """Noisy bisection: the midpoint's success rate decides which half keeps the threshold."""
+    def __init__(self, low: float, high: float, increasing: bool = False, integer: bool = False):
+        self.low, self.high = low, high
+        self.increasing = increasing
+        self.integer = integer
+
+    def update(self, value: float, successes: int, runs: int):
+        succeeded = runs and successes / runs >= 0.5
+        # Success below a falling threshold means it lies above the value, and vice versa
+        if succeeded != self.increasing:
+            self.low = value
+        else:
+            self.high = value
+
+    def estimate(self) -> float:
+        return (self.low + self.high) / 2
+
+    def interval(self, confidence: float) -> Tuple[float, float]:
+        return self.low, self.high
+
+    def next_point(self) -> float:
+        return (int(self.low) + int(self.high)) // 2 if self.integer else self.estimate()
+
+async def search(trial: TrialFn, strategy, tolerance: float, confidence: float = 0.9, max_trials: int = 30,
+                 parameter: str = "", method: str = "") -> SearchResult:
+    """Runs trials where `strategy` points until its interval is narrower than `tolerance`."""
+    trials: List[Trial] = []
+    converged = False
+    while len(trials) < max_trials:
+        lo, hi = strategy.interval(confidence)
+        if trials and hi - lo <= tolerance:
+            converged = True
+            break
+        value = strategy.next_point()
+        successes, runs = await trial(value)
+        trials.append(Trial(value, successes, runs))
+        strategy.update(value, successes, runs)
+        logger.info(f"{parameter}={value:g}: {successes}/{runs} succeeded; interval {strategy.interval(confidence)}")
+    else:
+        lo, hi = strategy.interval(confidence)
+        converged = hi - lo <= tolerance
+    return SearchResult(parameter, method, strategy.estimate(), strategy.interval(confidence), converged, trials)
+
+def apply_parameter(config: Dict[str, Any], parameter: str, value: Any,
+                    missions: Optional[List[str]] = None) -> Dict[str, Any]:
+    """A copy of a raw campaign config with `params.<path>` set in the selected missions."""
+    config = copy.deepcopy(config)
+    path = parameter.split(".")[1:]
+    if parameter.split(".")[0] != "params" or not path:
+        raise ValueError(f"Unknown search parameter {parameter!r}: use noise, energy or params.<path>")
+    for m_cfg in config.get("missions", []):
+        if missions and m_cfg.get("name") not in missions:
+            continue
+        if m_cfg.get("params") is None:
+            m_cfg["params"] = {}
+        node = m_cfg["params"]
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return config
+
+def integer_parameter(config: Dict[str, Any], parameter: str, missions: Optional[List[str]] = None) -> bool:
+    """Whether a selected mission's PARAMS_SCHEMA declares `params.<path>` as an integer."""
+    if parameter in CHANNEL_PARAMETERS:
+        return False
+    for m_cfg in config.get("missions", []):
+        if missions and m_cfg.get("name") not in missions:
+            continue
+        schema = get_mission_class(m_cfg.get("type", "")).PARAMS_SCHEMA
+        for key in parameter.split(".")[1:]:
+            schema = schema.get("properties", {}).get(key, {})
+        if schema.get("type") == "integer":
+            return True
+    return False
+
+def campaign_trial(config: Dict[str, Any], parameter: str, missions: Optional[List[str]] = None,
+                   repeats: int = 1, seed: Optional[int] = None) -> TrialFn:
+    """A trial that runs the campaign `repeats` times concurrently; each mission run is one
+    observation. With a seed, trial n uses seed + n, so repeated values see fresh noise.
+    Integer params only take whole values."""
+    from .main import build_manager
+    trials = 0
+    integer = integer_parameter(config, parameter, missions)
+
+    async def run(value: float) -> Tuple[int, int]:
+        nonlocal trials
+        if integer:
+            if value != int(value):
+                raise ValueError(f"{parameter} is an integer param; search it with whole values (--integer)")
+            value = int(value)
+        managers = []
+        for _ in range(repeats):
+            cfg = config if parameter in CHANNEL_PARAMETERS else apply_parameter(config, parameter, value, missions)
+            selected, global_cfg = load_campaign_from_config(cfg)
+            if missions:
+                selected = [m for m in selected if m.name in missions]
+            if parameter in CHANNEL_PARAMETERS:
+                global_cfg[parameter] = value
+            if seed is not None:
+                global_cfg["settings"] = dict(global_cfg["settings"], seed=seed + trials)
+            trials += 1
+            manager = build_manager(global_cfg, verbose=False, save_log=False)
+            # Post-mission analysis does not affect success and would cost a call per mission
+            manager.analyst = None
+            managers.append((manager, selected))
+        await asyncio.gather(*(manager.run_campaign_async(selected) for manager, selected in managers))
+        records = [record for manager, _ in managers for record in manager.results]
+        return sum(record.get("stop_reason") in SUCCESS_STOPS for record in records), len(records)
+
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description="Find where missions stop succeeding with few campaign runs")
+    parser.add_argument("config", help="Campaign YAML")
+    parser.add_argument("--param", required=True, help="noise, energy or params.<path> (e.g. params.size)")
+    parser.add_argument("--low", type=float, required=True)
+    parser.add_argument("--high", type=float, required=True)
+    parser.add_argument("--method", choices=("bayes", "bisect"), default="bayes")
+    parser.add_argument("--mission", action="append", help="Only these missions (repeatable)")
+    parser.add_argument("--increasing", action="store_true", default=None,
+                        help="Success rises with the parameter (default for energy)")
+    parser.add_argument("--integer", action="store_true", help="Only try whole values (sizes, lengths)")
+    parser.add_argument("--tolerance", type=float, help="Stop when the interval is this narrow (default: range/20)")
+    parser.add_argument("--confidence", type=float, default=0.9)
+    parser.add_argument("--slope", type=float, help="Width of the logistic success curve (bayes; default: range/20)")
+    parser.add_argument("--repeats", type=int, default=1, help="Concurrent campaign runs per trial")
+    parser.add_argument("--max-trials", type=int, default=30)
+    parser.add_argument("--seed", type=int, help="Channel seed of the first run; later runs add their index")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    with open(args.config, "r") as f:
+        config = yaml.safe_load(f)
+    if integer_parameter(config, args.param, args.mission) and not args.integer:
+        parser.error(f"{args.param} is an integer param: add --integer")
+    increasing = args.increasing if args.increasing is not None else args.param in INCREASING
+    if args.method == "bayes":
+        strategy = BayesianThreshold(args.low, args.high, increasing, slope=args.slope, integer=args.integer)
+    else:
+        strategy = Bisection(args.low, args.high, increasing, integer=args.integer)
+    tolerance = args.tolerance or (args.high - args.low) / 20
+    if args.integer:
+        tolerance = max(tolerance, 1)
+    trial = campaign_trial(config, args.param, args.mission, repeats=args.repeats, seed=args.seed)
+    result = asyncio.run(search(trial, strategy, tolerance, args.confidence, args.max_trials, args.param, args.method))
+
+    if args.json:
+        print(json.dumps(dict(asdict(result), runs=result.runs), indent=2))
+        return
+    lo, hi = result.interval
+    state = "converged" if result.converged else f"stopped after {args.max_trials} trials"
+    print(f"{args.param} threshold ~ {result.threshold:g} (interval {lo:g} - {hi:g}, {state}; "
+          f"{len(result.trials)} trials, {result.runs} mission runs)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Lazy, memoized integer sequences for sequence missions and the Petrova task.
+
+Sequences are looked up by name in a registry and built on first use. Terms are
+produced on demand: closed forms (squares, powers, user expressions) compute any index
+directly, while primes and Fibonacci extend a memoized prefix shared by every mission
+in the process. A mission only ever holds a `SequenceSlice` view, never the list itself.
+
+YAML:
+    params: { sequence: [2, 3, 5] }                          # explicit list, unchanged
+    params: { sequence: { name: primes, length: 100000 } }
+    params: { sequence: { name: fibonacci, start: 10, stop: 40 } }
+    params: { sequence: { name: powers, base: 3, length: 20 } }
+    params: { sequence: { expr: "3*n + 1", length: 50 } }   # n = 1, 2, 3, ...
+"""
+import abc
+import ast
+import math
+from array import array
+from collections.abc import Sequence
+from itertools import compress
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+class LazySequence(abc.ABC):
+    """An infinite integer sequence indexed from 0."""
+    name = "sequence"
+
+    @abc.abstractmethod
+    def __getitem__(self, index: int) -> int:
+        pass
+
+    def take(self, start: int = 0, stop: Optional[int] = None, length: Optional[int] = None) -> "SequenceSlice":
+        if stop is None:
+            if length is None:
+                raise ValueError(f"Sequence '{self.name}' needs a length or a stop index")
+            stop = start + length
+        if not 0 <= start <= stop:
+            raise ValueError(f"Invalid range [{start}, {stop}) for sequence '{self.name}'")
+        return SequenceSlice(self, start, stop)
+
+    def verify(self, prediction: Any, index: int) -> bool:
+        return prediction == self[index]
+
+class ClosedForm(LazySequence):
+    """Term i is `formula(i)`; nothing is cached."""
+    def __init__(self, name: str, formula: Callable[[int], int]):
+        self.name = name
+        self.formula = formula
+
+    def __getitem__(self, index: int) -> int:
+        return self.formula(index)
+
+class MemoizedSequence(LazySequence):
+    """Extends a memoized prefix until it covers the requested index."""
+    def __init__(self):
+        self._prefix: Union[List[int], array] = []
+
+    @abc.abstractmethod
+    def _extend(self, length: int):
+        """Grows the prefix to at least `length` terms."""
+        pass
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            raise IndexError("Lazy sequences are infinite; negative indexes are not supported")
+        if index >= len(self._prefix):
+            self._extend(index + 1)
+        return self._prefix[index]
+
+    @property
+    def memoized(self) -> int:
+        return len(self._prefix)
+
+class Primes(MemoizedSequence):
+    """Primes by a segmented sieve of Eratosthenes; each segment doubles the sieved range."""
+    name = "primes"
+    FIRST_SEGMENT = 1 << 15
+
+    def __init__(self):
+        self._prefix = array("q")
+        self._limit = 0 # Every prime below this is in the prefix
+
+    def _extend(self, length: int):
+        while len(self._prefix) < length:
+            if not self._limit:
+                self._sieve_first(self.FIRST_SEGMENT)
+            else:
+                self._sieve_segment(self._limit, 2 * self._limit)
+
+    def _sieve_first(self, hi: int):
+        sieve = bytearray(b"\x01") * hi
+        sieve[:2] = b"\x00\x00"
+        for p in range(2, math.isqrt(hi - 1) + 1):
+            if sieve[p]:
+                sieve[p * p::p] = bytes(len(range(p * p, hi, p)))
+        self._prefix.extend(compress(range(hi), sieve))
+        self._limit = hi
+
+    def _sieve_segment(self, lo: int, hi: int):
+        # hi <= 2 * lo, so every base prime up to sqrt(hi) is already in the prefix
+        segment = bytearray(b"\x01") * (hi - lo)
+        root = math.isqrt(hi - 1)
+        for p in self._prefix:
+            if p > root:
+                break
+            start = max(p * p, -(-lo // p) * p) - lo
+            segment[start::p] = bytes(len(range(start, len(segment), p)))
+        self._prefix.extend(compress(range(lo, hi), segment))
+        self._limit = hi
+
+class Fibonacci(MemoizedSequence):
+    """1, 1, 2, 3, 5, ..."""
+    name = "fibonacci"
+
+    def __init__(self):
+        self._prefix = [1, 1]
+
+    def _extend(self, length: int):
+        prefix = self._prefix
+        while len(prefix) < length:
+            prefix.append(prefix[-1] + prefix[-2])
+
+# Nodes a user expression may contain: arithmetic over `n` and integer constants
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Load, ast.Call,
+    ast.Add, ast.Sub, ast.Mult, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+)
+_ALLOWED_CALLS = {"abs": abs, "min": min, "max": max}
+# Largest constant or power a user expression may produce, in bits (about 20,000 digits)
+MAX_TERM_BITS = 1 << 16
+
+def _bounded_pow(base: int, exponent: int) -> int:
+    if exponent < 0:
+        raise ValueError(f"Negative exponent {exponent} in sequence expression")
+    if abs(base) > 1 and exponent * abs(base).bit_length() > MAX_TERM_BITS:
+        raise ValueError(f"{base}**{exponent} exceeds {MAX_TERM_BITS} bits")
+    return base ** exponent
+
+class _BoundPowers(ast.NodeTransformer):
+    """Rewrites `a ** b` as a size-checked call, so `n**n**n` fails instead of hanging."""
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            call = ast.Call(func=ast.Name(id="_pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[])
+            return ast.copy_location(call, node)
+        return node
+
+def compile_expression(expr: str) -> Callable[[int], int]:
+    """Compiles an arithmetic expression in `n` (e.g. "n**2 + 1") after checking every node.
+    Constants and powers are limited to MAX_TERM_BITS."""
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid sequence expression {expr[:40]!r}: {e.msg}")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+            if node.value.bit_length() > MAX_TERM_BITS:
+                raise ValueError(f"Constant in sequence expression {expr!r} exceeds {MAX_TERM_BITS} bits")
+            continue
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax in sequence expression {expr!r}: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id != "n" and node.id not in _ALLOWED_CALLS:
+            raise ValueError(f"Unknown name '{node.id}' in sequence expression {expr!r}")
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and node.func.id in _ALLOWED_CALLS):
+            raise ValueError(f"Only {', '.join(_ALLOWED_CALLS)} may be called in sequence expression {expr!r}")
+    code = compile(ast.fix_missing_locations(_BoundPowers().visit(tree)), "<sequence>", "eval")
+    namespace = {"__builtins__": {}, "_pow": _bounded_pow, **_ALLOWED_CALLS}
+    return lambda n: eval(code, namespace, {"n": n})
+
+# Name -> factory(**params). Instances are created on first use and cached.
+SEQUENCES: Dict[str, Callable[..., LazySequence]] = {
+    "primes": Primes,
+    "fibonacci": Fibonacci,
+    "squares": lambda: ClosedForm("squares", lambda i: (i + 1) ** 2),
+    "powers": lambda base=2: ClosedForm(f"powers of {base}", lambda i: base ** i),
+    "astrophage_growth": lambda: ClosedForm("astrophage_growth", lambda i: 2 ** i),
+    "expr": lambda expr: ClosedForm(expr, lambda i, f=compile_expression(expr): f(i + 1)),
+}
+
+_INSTANCES: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], LazySequence] = {}
+
+def get_sequence(name: str, **params) -> LazySequence:
+    key = (name, tuple(sorted(params.items())))
+    sequence = _INSTANCES.get(key)
+    if sequence is None:
+        if name not in SEQUENCES:
+            raise ValueError(f"Unknown sequence '{name}'. Known: {', '.join(SEQUENCES)}")
+        sequence = _INSTANCES[key] = SEQUENCES[name](**params)
+    return sequence
+
+class SequenceSlice(Sequence):
+    """Read-only view of terms [start, stop) of a lazy sequence. Behaves like a list."""
+    PREVIEW = 10
+
+    def __init__(self, source: LazySequence, start: int, stop: int):
+        self.source = source
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return SequenceSlice(self.source, self.start + start, self.start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sequence index out of range")
+        return self.source[self.start + index]
+
+    def verify_prediction(self, prediction: Any, index: int) -> bool:
+        return 0 <= index < len(self) and self.source.verify(prediction, self.start + index)
+
+    def __eq__(self, other):
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        # Short sequences print exactly like the list they replace
+        if len(self) <= 2 * self.PREVIEW:
+            return repr(list(self))
+        head = ", ".join(str(self[i]) for i in range(self.PREVIEW))
+        return f"[{head}, ...] ({len(self)} terms of {self.source.name})"
+
+    # A view over shared memoized state: copies share it
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+def build_sequence(cfg: Any) -> Sequence:
+    """An explicit list is returned unchanged; a mapping names a registered sequence and a range.
+    The first term is computed here, so an expression that cannot be evaluated fails at load."""
+    if cfg is None:
+        return []
+    if isinstance(cfg, (list, tuple)):
+        return list(cfg)
+    if not isinstance(cfg, dict):
+        raise ValueError(f"A sequence must be a list or a mapping, got {cfg!r}")
+    params = dict(cfg)
+    start = params.pop("start", 0)
+    stop = params.pop("stop", None)
+    length = params.pop("length", None)
+    if "expr" in params:
+        params.pop("name", None)
+        source = get_sequence("expr", **params)
+    else:
+        source = get_sequence(params.pop("name", None), **params)
+    sequence = source.take(start, stop, length)
+    if len(sequence):
+        try:
+            sequence[0]
+        except (ArithmeticError, TypeError, ValueError) as e:
+            raise ValueError(f"Sequence '{source.name}' fails at term {start}: {e}")
+    return sequence
@@ -0,0 +1,311 @@
+"""Local simulation server: runs many campaigns on one event loop and streams their turns.
+
+Routes:
+    POST /campaigns                       campaign YAML (or JSON) -> {"id": ...}; ?paused=1 starts held
+    GET  /campaigns                       every session's status
+    GET  /campaigns/{id}                  status, plus mission records once finished
+    POST /campaigns/{id}/pause|resume|cancel
+    GET  /campaigns/{id}/stream           WebSocket: one JSON message per turn event
+
+Each stream is an event-bus subscriber with its own bounded drop-oldest buffer, so a
+slow browser loses old events instead of stalling the campaign. Stream clients may also
+send {"command": "pause" | "resume" | "cancel"}.
+"""
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import math
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from .events import DROP_OLDEST
+from .httpd import (
+    HTTPRequest, WebSocket, accept_websocket, is_websocket_upgrade, serve_connection, write_json,
+)
+from .loader import load_campaign_from_config
+from .main import build_manager
+from .protocol import Exchange
+
+logger = logging.getLogger(__name__)
+
+# Providers that never leave the machine
+OFFLINE_PROVIDERS = {"mock", "ollama"}
+
+def _json_safe(value: Any) -> Any:
+    """Replaces non-finite floats (e.g. unlimited energy), which JSON cannot carry, with None."""
+    if isinstance(value, Exchange):
+        return _json_safe(value.to_dict())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _json_safe(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+def event_to_dict(event: Any) -> Dict[str, Any]:
+    return {"type": type(event).__name__, **_json_safe(event)}
+
+def _providers(config: Dict[str, Any]) -> List[str]:
+    """Every provider a campaign config could call: agents, cascade tiers, hedge fallbacks, fork branches
+    and broadcast observers."""
+    personas = config.get("personas") or {}
+    providers = []
+    for observer in personas.get("grace_observers") or []:
+        providers.append(observer.get("provider", "mock"))
+        providers += [tier.get("provider") for tier in observer.get("cascade") or []]
+        if (observer.get("hedge") or {}).get("fallback"):
+            providers.append(observer["hedge"]["fallback"].get("provider"))
+    for role in ("rocky", "grace"):
+        providers.append(personas.get(f"{role}_provider", "mock"))
+        tiers = personas.get(f"{role}_cascade") or []
+        providers += [tier.get("provider") for tier in tiers]
+        # Hedge fallbacks, on the agent itself or on cascade tiers
+        for hedge in [personas.get(f"{role}_hedge")] + [tier.get("hedge") for tier in tiers]:
+            if hedge and hedge.get("fallback"):
+                providers.append(hedge["fallback"].get("provider"))
+        for mission in config.get("missions") or []:
+            for branch in (mission.get("fork") or {}).get("branches", []):
+                if branch.get(f"{role}_provider"):
+                    providers.append(branch[f"{role}_provider"])
+    return providers
+
+class CampaignSession:
+    def __init__(self, session_id: str, config: Dict[str, Any], start_paused: bool = False, save_log: bool = False):
+        self.id = session_id
+        self.missions, global_cfg = load_campaign_from_config(config)
+        if not self.missions:
+            raise ValueError("Campaign has no missions")
+        self.manager = build_manager(global_cfg, verbose=False, save_log=save_log)
+        if start_paused:
+            self.manager.pause()
+        self.created = time.time()
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self.streams = 0
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self.manager.run_campaign_async(self.missions))
+        self.task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.error = str(task.exception())
+            logger.error(f"Campaign {self.id} failed: {self.error}")
+
+    @property
+    def status(self) -> str:
+        if self.task is None or not self.task.done():
+            return "paused" if self.manager.paused else "running"
+        if self.cancelled or self.task.cancelled():
+            return "cancelled"
+        return "failed" if self.error else "finished"
+
+    def cancel(self):
+        if self.task and not self.task.done():
+            self.cancelled = True
+            self.task.cancel()
+
+    def summary(self, results: bool = False) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "missions": [m.name for m in self.missions],
+            "completed": len(self.manager.results),
+            "metrics": self.manager.metrics.summary(),
+            "streams": self.streams,
+            "dropped": self.dropped,
+            "error": self.error,
+        }
+        if results and self.status in ("finished", "cancelled", "failed"):
+            data["results"] = self.manager.results
+        return _json_safe(data)
+
+class SimulationServer:
+    """Asyncio HTTP + WebSocket front-end over CampaignManager. One event loop hosts every session."""
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, offline: bool = True,
+                 client_buffer: int = 256, max_sessions: int = 64, save_logs: bool = False):
+        self.host = host
+        self.port = port
+        self.offline = offline
+        self.client_buffer = client_buffer
+        self.max_sessions = max_sessions
+        self.save_logs = save_logs
+        self.sessions: Dict[str, CampaignSession] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Simulation server listening on {self.base_url}")
+
+    async def stop(self):
+        for session in self.sessions.values():
+            session.cancel()
+        await asyncio.gather(*(s.task for s in self.sessions.values() if s.task), return_exceptions=True)
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task, writer in list(self._connections.items()):
+            writer.close()
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            await serve_connection(reader, writer, self._handle)
+        finally:
+            self._connections.pop(task, None)
+
+    async def __aenter__(self) -> "SimulationServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def create_session(self, config: Dict[str, Any], start_paused: bool = False) -> CampaignSession:
+        if not isinstance(config, dict):
+            raise ValueError("Campaign config must be a mapping")
+        if self.offline:
+            remote = sorted({p for p in _providers(config) if p not in OFFLINE_PROVIDERS})
+            if remote:
+                raise ValueError(f"Offline server refuses remote providers: {', '.join(remote)}")
+        active = sum(1 for s in self.sessions.values() if s.status in ("running", "paused"))
+        if active >= self.max_sessions:
+            raise OverflowError(f"Session limit reached ({self.max_sessions})")
+        session = CampaignSession(uuid.uuid4().hex[:12], config, start_paused, save_log=self.save_logs)
+        self.sessions[session.id] = session
+        session.start()
+        return session
+
+    async def _handle(self, request: HTTPRequest, reader, writer) -> bool:
+        parts = [p for p in request.path.split("/") if p]
+        if not parts or parts[0] != "campaigns":
+            await write_json(writer, 404, {"error": f"No route for {request.path}"})
+            return True
+
+        if len(parts) == 1:
+            if request.method == "GET":
+                await write_json(writer, 200, [s.summary() for s in self.sessions.values()])
+            elif request.method == "POST":
+                try:
+                    config = yaml.safe_load(request.body.decode("utf-8")) if request.body else None
+                    session = self.create_session(config, start_paused=request.query.get("paused") in ("1", "true"))
+                except OverflowError as e:
+                    await write_json(writer, 503, {"error": str(e)})
+                except Exception as e:
+                    await write_json(writer, 400, {"error": str(e)})
+                else:
+                    await write_json(writer, 201, session.summary())
+            else:
+                await write_json(writer, 405, {"error": "Use GET or POST"})
+            return True
+
+        session = self.sessions.get(parts[1])
+        if session is None:
+            await write_json(writer, 404, {"error": f"Unknown campaign {parts[1]}"})
+            return True
+        action = parts[2] if len(parts) > 2 else None
+
+        if action is None and request.method == "GET":
+            await write_json(writer, 200, session.summary(results=True))
+        elif action == "stream" and is_websocket_upgrade(request):
+            await self._stream(session, await accept_websocket(request, reader, writer))
+            return False
+        elif action in ("pause", "resume", "cancel") and request.method == "POST":
+            if session.status not in ("running", "paused"):
+                await write_json(writer, 409, {"error": f"Campaign is {session.status}"})
+            else:
+                self._command(session, action)
+                await write_json(writer, 200, session.summary())
+        else:
+            await write_json(writer, 404, {"error": f"No route for {request.method} {request.path}"})
+        return True
+
+    def _command(self, session: CampaignSession, command: str):
+        if command == "pause":
+            session.manager.pause()
+        elif command == "resume":
+            session.manager.resume()
+        elif command == "cancel":
+            session.cancel()
+
+    async def _stream(self, session: CampaignSession, ws: WebSocket):
+        await ws.send_json({"type": "Hello", **session.summary()})
+
+        async def forward(event: Any):
+            if not ws.closed:
+                await ws.send_json(event_to_dict(event))
+
+        subscription = session.manager.bus.subscribe(forward, maxsize=self.client_buffer, policy=DROP_OLDEST)
+        session.streams += 1
+        try:
+            while True:
+                receive = asyncio.ensure_future(ws.receive())
+                done, _ = await asyncio.wait({receive, session.task}, return_when=asyncio.FIRST_COMPLETED)
+                if receive in done:
+                    message = receive.result()
+                    if message is None:
+                        break
+                    try:
+                        command = json.loads(message).get("command")
+                    except Exception:
+                        command = None
+                    if command in ("pause", "resume", "cancel"):
+                        self._command(session, command)
+                    else:
+                        await ws.send_json({"type": "Error", "error": f"Unknown command: {message[:100]}"})
+                    continue
+                # The bus drains every subscriber before the campaign task ends
+                receive.cancel()
+                await ws.send_json({"type": "SessionEnded", **session.summary()})
+                await ws.close()
+                break
+        finally:
+            session.streams -= 1
+            session.dropped += subscription.dropped
+            session.manager.bus.unsubscribe(subscription)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local simulation server with WebSocket turn streaming")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8770)
+    parser.add_argument("--allow-remote", action="store_true", help="Allow campaigns that call hosted LLM providers")
+    parser.add_argument("--buffer", type=int, default=256, help="Per-client event buffer (oldest events dropped)")
+    parser.add_argument("--max-sessions", type=int, default=64)
+    parser.add_argument("--save-logs", action="store_true", help="Write a campaign log per session")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = SimulationServer(args.host, args.port, offline=not args.allow_remote, client_buffer=args.buffer,
+                              max_sessions=args.max_sessions, save_logs=args.save_logs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
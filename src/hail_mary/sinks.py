@@ -0,0 +1,178 @@
+"""Default event-bus subscribers: console printer, TUI renderer, campaign log writer and metrics."""
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .logformat import BINARY_SUFFIX, write_binary_log
+from .llm.keypool import pool_stats
+from .parsing import parse_failure_rates
+from .events import (
+    CampaignStarted, MissionStarted, ExchangeTransmitted, TurnCompleted,
+    MissionFinished, AnalysisReady, CampaignFinished,
+)
+
+class ConsolePrinter:
+    """Prints the classic line-per-turn campaign transcript."""
+    def __call__(self, event: Any):
+        if isinstance(event, CampaignStarted):
+            print(f"--- Starting Campaign with {event.missions} Missions ---")
+        elif isinstance(event, MissionStarted):
+            print(f"\n🚀 Mission: {event.mission}")
+            print(f"   Objective: {event.objective}")
+            if event.rocky_thought is not None:
+                print(f"   Rocky's Initial Understanding: {event.rocky_thought[:100]}...")
+            if event.grace_thought is not None:
+                print(f"   Grace's Initial Understanding: {event.grace_thought[:100]}...")
+        elif isinstance(event, TurnCompleted):
+            rocky_intent = event.rocky.thought.split('.')[0][:50]
+            grace_analysis = event.grace.thought.split('.')[0][:50]
+            print(f"  [Turn {event.turn}]")
+            print(f"    Rocky sends: {event.rocky.chords} (Intent: {rocky_intent}...)")
+            print(f"    Grace action: {event.grace.action} (Analysis: {grace_analysis}...)")
+        elif isinstance(event, MissionFinished):
+            if event.outcome == "success":
+                print(f"  ✅ Mission Objective Met in {event.turns} turns!")
+            elif event.outcome == "energy_depleted":
+                print("  ❌ MISSION FAILURE: Energy Depleted.")
+            elif event.outcome == "converged":
+                print(f"  ✅ Converged after {event.turns} turns, stopping early.")
+            elif event.outcome == "forked":
+                record = event.record
+                print(f"  🔀 Forked at turn {record['fork_turn']} into {len(record['branches'])} branches:")
+                for branch in record["branches"]:
+                    turns = branch["turns_to_success"] or record["fork_turn"] + len(branch["history"]) // 2
+                    print(f"     - {branch['branch']}: {branch['stop_reason']} after {turns} turns")
+            elif event.outcome != "max_turns":
+                print(f"  ⏹ Stopped early: {event.outcome}.")
+            if event.analysis_pending:
+                print(f"   Analyzing contact dynamics...")
+
+class TUIRenderer:
+    """Drives a SimulationTUI per mission. Pacing sleeps happen here, off the engine's task."""
+    def __init__(self, playback_speed: float = 1.0, auto_advance: bool = False):
+        self.playback_speed = playback_speed
+        self.auto_advance = auto_advance
+        self.tui = None
+        self.live = None
+
+    async def __call__(self, event: Any):
+        from .tui import SimulationTUI, ROCKY_STEP_DELAY, GRACE_STEP_DELAY
+
+        if isinstance(event, MissionStarted):
+            from rich.live import Live
+            self.tui = SimulationTUI(event.mission, event.objective,
+                                     playback_speed=self.playback_speed, auto_advance=self.auto_advance)
+            self.tui.energy_total = event.energy if event.energy != float('inf') else 1000
+            self.tui.energy_remaining = event.energy
+            self.live = Live(self.tui, screen=True, auto_refresh=True, refresh_per_second=self.tui.max_fps)
+            self.live.start()
+        elif self.tui is None:
+            return
+        elif isinstance(event, ExchangeTransmitted):
+            ex = event.exchange
+            if ex.sender == "Rocky":
+                self.tui.post(rocky_thought=ex.thought, rocky_signal=ex.chords, energy=event.energy)
+                await asyncio.sleep(self.tui.delay(ROCKY_STEP_DELAY))
+            else:
+                self.tui.post(grace_thought=ex.thought, grace_action=ex.action, energy=event.energy)
+        elif isinstance(event, TurnCompleted):
+            self.tui.post_turn(event.rocky.chords, event.grace.chords)
+            await asyncio.sleep(self.tui.delay(GRACE_STEP_DELAY))
+        elif isinstance(event, MissionFinished):
+            if event.outcome == "success":
+                self.tui.post(rocky_thought="MISSION ACCOMPLISHED! Amaaze!",
+                              grace_thought="Pattern identified. We saved Earth.")
+                await self.tui.wait_for_advance("COMPLETED")
+            elif event.outcome == "energy_depleted":
+                self.tui.post(rocky_thought="Bad, bad, bad! Out of energy!",
+                              grace_thought="I've lost the signal...")
+                await self.tui.wait_for_advance("FAILED")
+            self.live.stop()
+            self.tui = self.live = None
+
+class CampaignLogWriter:
+    """Collects mission records (and their analyses) and writes the campaign log:
+    indented JSON, or the indexed binary format of logformat.py with log_format="binary"."""
+    def __init__(self, log_dir: str = "logs", announce: bool = True, log_format: str = "json"):
+        if log_format not in ("json", "binary"):
+            raise ValueError(f"Unknown log format: {log_format}")
+        self.log_dir = log_dir
+        self.announce = announce
+        self.log_format = log_format
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.log_path: Optional[str] = None
+
+    def __call__(self, event: Any):
+        if isinstance(event, MissionFinished):
+            self.records[event.index] = event.record
+        elif isinstance(event, AnalysisReady):
+            record = self.records.get(event.index)
+            if record is not None:
+                record["analysis"] = event.analysis
+                if event.metrics is not None:
+                    record["metrics"] = event.metrics
+        elif isinstance(event, CampaignFinished):
+            self.save()
+
+    def save(self) -> str:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        suffix = BINARY_SUFFIX if self.log_format == "binary" else ".json"
+        filename = f"campaign_log_{timestamp}{suffix}"
+        log_path = filename
+        if os.path.exists(self.log_dir) and os.path.isdir(self.log_dir):
+            log_path = os.path.join(self.log_dir, filename)
+
+        records = [self.records[i] for i in sorted(self.records)]
+        if self.log_format == "binary":
+            write_binary_log(log_path, records)
+        else:
+            with open(log_path, "w") as f:
+                json.dump(records, f, indent=2)
+        self.log_path = log_path
+        if self.announce:
+            print(f"\nCampaign complete. Log saved to {log_path}")
+        return log_path
+
+class MetricsCollector:
+    """Aggregates throughput and signal statistics for a campaign."""
+    def __init__(self):
+        self.missions = 0
+        self.turns = 0
+        self.exchanges = 0
+        self.bits = 0
+        self.ones = 0
+        self.outcomes: Dict[str, int] = {}
+        self.mission_seconds: Dict[str, float] = {}
+        self._started: Dict[str, float] = {}
+
+    def __call__(self, event: Any):
+        if isinstance(event, MissionStarted):
+            self._started[event.mission] = time.perf_counter()
+        elif isinstance(event, ExchangeTransmitted):
+            self.exchanges += 1
+            self.bits += event.exchange.length
+            self.ones += event.exchange.popcount
+        elif isinstance(event, TurnCompleted):
+            self.turns += 1
+        elif isinstance(event, MissionFinished):
+            self.missions += 1
+            self.outcomes[event.outcome] = self.outcomes.get(event.outcome, 0) + 1
+            started = self._started.pop(event.mission, None)
+            if started is not None:
+                self.mission_seconds[event.mission] = time.perf_counter() - started
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "missions": self.missions,
+            "turns": self.turns,
+            "exchanges": self.exchanges,
+            "bits": self.bits,
+            "ones": self.ones,
+            "outcomes": dict(self.outcomes),
+            "mission_seconds": {k: round(v, 3) for k, v in self.mission_seconds.items()},
+            "parse_failures": parse_failure_rates(),
+            "api_keys": pool_stats(),
+        }
@@ -0,0 +1,110 @@
+"""Pluggable early-termination policies for missions.
+
+Policies watch each scored turn and end a mission once its outcome is decided.
+They never touch mission scoring: `update_state`/`get_results` see the same turns
+they would have seen, just fewer of them.
+"""
+import abc
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+@dataclass
+class TurnObservation:
+    turn: int
+    action: Optional[Any]
+    expected: Optional[Any] # None when the mission step is not scored by ACTION
+    tokens: int # Tokens spent by both agents on this mission so far
+
+    @property
+    def correct(self) -> Optional[bool]:
+        return None if self.expected is None else self.action == self.expected
+
+class StoppingPolicy(abc.ABC):
+    reason: str = "stopped"
+    # Whether stopping under this policy means the objective was reached
+    converged: bool = False
+
+    def start(self):
+        """Resets per-mission state. Called before the first turn of every mission."""
+        pass
+
+    @abc.abstractmethod
+    def should_stop(self, observation: TurnObservation) -> bool:
+        pass
+
+class ConsecutiveCorrect(StoppingPolicy):
+    """Stops once Grace's ACTION has been correct `k` turns in a row."""
+    reason = "converged"
+    converged = True
+
+    def __init__(self, k: int = 2):
+        self.k = k
+        self.streak = 0
+
+    def start(self):
+        self.streak = 0
+
+    def should_stop(self, observation: TurnObservation) -> bool:
+        self.streak = self.streak + 1 if observation.correct else 0
+        return self.streak >= self.k
+
+class Stagnation(StoppingPolicy):
+    """Fails fast when Grace repeats the same wrong (or missing) ACTION for `k` turns.
+    Turns the mission does not score by ACTION (e.g. grid moves) are ignored."""
+    reason = "stagnated"
+
+    def __init__(self, k: int = 3):
+        self.k = k
+        self.last_action = None
+        self.repeats = 0
+
+    def start(self):
+        self.last_action = None
+        self.repeats = 0
+
+    def should_stop(self, observation: TurnObservation) -> bool:
+        if observation.expected is None:
+            return False
+        if observation.correct:
+            self.repeats = 0
+            return False
+        self.repeats = self.repeats + 1 if self.repeats and observation.action == self.last_action else 1
+        self.last_action = observation.action
+        return self.repeats >= self.k
+
+class TokenBudget(StoppingPolicy):
+    """Caps the tokens both agents may spend on a single mission."""
+    reason = "token_budget"
+
+    def __init__(self, max_tokens: int):
+        self.max_tokens = max_tokens
+
+    def should_stop(self, observation: TurnObservation) -> bool:
+        return observation.tokens >= self.max_tokens
+
+class CostBudget(StoppingPolicy):
+    """Caps the estimated spend of a single mission, priced per 1k tokens."""
+    reason = "cost_budget"
+
+    def __init__(self, max_cost: float, cost_per_1k_tokens: float):
+        self.max_cost = max_cost
+        self.cost_per_1k_tokens = cost_per_1k_tokens
+
+    def should_stop(self, observation: TurnObservation) -> bool:
+        return observation.tokens / 1000.0 * self.cost_per_1k_tokens >= self.max_cost
+
+def build_stopping_policies(cfg: Optional[Dict[str, Any]]) -> List[StoppingPolicy]:
+    """Builds policies from the `settings.stopping` YAML block."""
+    cfg = cfg or {}
+    policies: List[StoppingPolicy] = []
+    if cfg.get("consecutive_correct"):
+        policies.append(ConsecutiveCorrect(cfg["consecutive_correct"]))
+    if cfg.get("stagnation"):
+        policies.append(Stagnation(cfg["stagnation"]))
+    if cfg.get("max_tokens"):
+        policies.append(TokenBudget(cfg["max_tokens"]))
+    if cfg.get("max_cost"):
+        if not cfg.get("cost_per_1k_tokens"):
+            raise ValueError("settings.stopping.max_cost requires cost_per_1k_tokens")
+        policies.append(CostBudget(cfg["max_cost"], cfg["cost_per_1k_tokens"]))
+    return policies
@@ -1,4 +1,5 @@
-import time
+import asyncio
+import queue
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.live import Live
@@ -6,10 +7,33 @@ from rich.table import Table
 from rich.progress import ProgressBar
 from rich.text import Text
 from rich.console import Console, Group
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
+
+# Which layout panels each piece of state is drawn in
+PANELS_BY_FIELD = {
+    "rocky_thought": ("rocky",),
+    "rocky_signal": ("rocky",),
+    "grace_thought": ("grace",),
+    "grace_action": ("grace",),
+    "energy": ("footer",),
+    "status": ("footer",),
+    "turn": ("header", "signal", "rocky"),
+}
+ALL_PANELS = ("header", "footer", "rocky", "grace", "signal")
+
+# Base pacing (seconds at 1x) between the steps of a turn, and before auto-advancing
+ROCKY_STEP_DELAY = 0.5
+GRACE_STEP_DELAY = 1.0
+AUTO_ADVANCE_HOLD = 3.0
 
 class SimulationTUI:
-    def __init__(self, mission_name: str, objective: str):
+    """Live mission display.
+
+    Producers push state changes with `post()`/`post_turn()`; they are queued without blocking
+    and applied on the next frame, which only rebuilds the panels whose state changed.
+    """
+    def __init__(self, mission_name: str, objective: str, playback_speed: float = 1.0,
+                 auto_advance: bool = False, max_fps: int = 10):
         self.console = Console()
         self.mission_name = mission_name
         self.objective = objective
@@ -23,6 +47,11 @@ class SimulationTUI:
         self.turn_count = 0
         self.status_message = "Simulation Active"
         self.history = []
+        self.playback_speed = playback_speed
+        self.auto_advance = auto_advance
+        self.max_fps = max_fps
+        self.events: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+        self.dirty: Set[str] = set(ALL_PANELS)
         self.layout = self._make_layout()
 
     def _make_layout(self) -> Layout:
@@ -105,16 +134,64 @@ class SimulationTUI:
         if grace_action is not None: self.grace_action = grace_action
         if energy is not None: self.energy_remaining = energy
         if status: self.status_message = status
+        changed = dict(rocky_thought=rocky_thought, rocky_signal=rocky_signal, grace_thought=grace_thought,
+                       grace_action=grace_action, energy=energy, status=status)
+        for name, value in changed.items():
+            if value is not None:
+                self.dirty.update(PANELS_BY_FIELD[name])
 
     def record_turn(self, rocky_signal: str, grace_signal: str):
         self.turn_count += 1
         self.history.append((rocky_signal, grace_signal))
         self.rocky_signal = "" # Clear for next turn
+        self.dirty.update(PANELS_BY_FIELD["turn"])
+
+    def post(self, **fields):
+        """Queues a state update for the next frame. Safe to call from any thread."""
+        self.events.put(fields)
+
+    def post_turn(self, rocky_signal: str, grace_signal: str):
+        self.events.put({"turn": (rocky_signal, grace_signal)})
+
+    def drain(self) -> int:
+        """Applies all queued updates. Returns the number of events consumed."""
+        count = 0
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return count
+            count += 1
+            turn = event.pop("turn", None)
+            if event:
+                self.update(**event)
+            if turn is not None:
+                self.record_turn(*turn)
+
+    def delay(self, seconds: float) -> float:
+        """Scales a pacing delay by the playback speed. A speed of 0 disables pacing."""
+        return seconds / self.playback_speed if self.playback_speed > 0 else 0.0
+
+    async def wait_for_advance(self, status: str):
+        """Holds the final frame of a mission until Enter, or briefly when auto-advancing."""
+        if self.auto_advance:
+            self.post(status=f"{status} - auto-advancing")
+            await asyncio.sleep(self.delay(AUTO_ADVANCE_HOLD))
+        else:
+            self.post(status=f"{status} - Press Enter to continue")
+            await asyncio.get_running_loop().run_in_executor(None, input)
 
     def __rich__(self) -> Layout:
-        self.layout["header"].update(self._get_header())
-        self.layout["footer"].update(self._get_footer())
-        self.layout["rocky"].update(self._get_rocky_panel())
-        self.layout["grace"].update(self._get_grace_panel())
-        self.layout["signal"].update(self._get_signal_history())
+        self.drain()
+        renderers = {
+            "header": self._get_header,
+            "footer": self._get_footer,
+            "rocky": self._get_rocky_panel,
+            "grace": self._get_grace_panel,
+            "signal": self._get_signal_history,
+        }
+        for name in ALL_PANELS:
+            if name in self.dirty:
+                self.layout[name].update(renderers[name]())
+        self.dirty.clear()
         return self.layout
@@ -0,0 +1,96 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent, MockEridian
+from hail_mary.broadcast import Observer
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.llm.base import LLMClient
+from hail_mary.loader import load_campaign_from_config
+from hail_mary.main import build_manager
+from hail_mary.mission import GridMission, SequenceMission
+from hail_mary.rescore import rescore_records
+
+class ScriptedClient(LLMClient):
+    def __init__(self, action, delay=0.0, probe=None):
+        super().__init__()
+        self.action = action
+        self.delay = delay
+        self.prompts = []
+        # In-flight counters, shared between the Graces of one run
+        self.probe = probe if probe is not None else {"in_flight": 0, "peak": 0}
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.probe["in_flight"] += 1
+        self.probe["peak"] = max(self.probe["peak"], self.probe["in_flight"])
+        await asyncio.sleep(self.delay)
+        self.probe["in_flight"] -= 1
+        return f"THOUGHT: ok\nSIGNAL: 10\nACTION: {self.action}"
+
+def _actions(client):
+    return [p for p in client.prompts if "SIGNAL HISTORY" in p]
+
+def _broadcast(mission, lead_action, observer_actions, max_turns=20, delay=0.0):
+    rocky_client = ScriptedClient(0)
+    probe = {"in_flight": 0, "peak": 0}
+    clients = [ScriptedClient(action, delay, probe) for action in observer_actions]
+    observers = [Observer(f"obs-{i}", LLMAlienAgent("Grace", "Human", client=c)) for i, c in enumerate(clients)]
+    lead = ScriptedClient(lead_action, delay, probe)
+    manager = CampaignManager((LLMAlienAgent("Rocky", "Eridian", client=rocky_client),
+                               LLMAlienAgent("Grace", "Human", client=lead)),
+                              CommChannel(), verbose=False, save_log=False, max_turns=max_turns, observers=observers)
+    manager.analyst = None
+    manager.run_campaign([mission])
+    return manager.results[0], rocky_client, lead, clients
+
+def test_one_rocky_call_per_turn_for_all_observers():
+    record, rocky, lead, clients = _broadcast(SequenceMission([1, 1, 1]), 1, [2, 1, 1], delay=0.01)
+    assert len(_actions(rocky)) == 3
+    assert record["summary"] == {"accuracy": 1.0}
+    assert [(o["observer"], o["summary"]["accuracy"]) for o in record["observers"]] == \
+           [("obs-0", 0.0), ("obs-1", 1.0), ("obs-2", 1.0)]
+    # The lead and all observers answer each transmission concurrently
+    assert all(len(_actions(c)) == 3 for c in clients) and lead.probe["peak"] == 4
+    assert [e["sender"] for e in record["observers"][0]["history"]] == ["Rocky", "Grace"] * 3
+    assert record["observers"][0]["history"][0]["raw_response"] == record["history"][0]["raw_response"]
+
+def test_observers_stop_independently_and_rocky_follows_survivors():
+    # The lead walks right, down to the target of a 2x2 grid; the observer keeps hitting the wall
+    class Walker(ScriptedClient):
+        async def get_generated_text(self, prompt):
+            self.action = (3, 1)[len(_actions(self))]
+            return await super().get_generated_text(prompt)
+
+    mission = GridMission(size=2)
+    rocky = ScriptedClient(0)
+    lead = Walker(3)
+    wall = ScriptedClient(0)
+    manager = CampaignManager((LLMAlienAgent("Rocky", "Eridian", client=rocky), LLMAlienAgent("Grace", "Human", client=lead)),
+                              CommChannel(), verbose=False, save_log=False, max_turns=4,
+                              observers=[Observer("wall", LLMAlienAgent("Grace", "Human", client=wall))])
+    manager.analyst = None
+    manager.run_campaign([mission])
+    record = manager.results[0]
+    assert (record["stop_reason"], record["turns_to_success"]) == ("success", 2)
+    assert record["observers"][0]["stop_reason"] == "max_turns"
+    assert len(_actions(rocky)) == 4 and len(_actions(lead)) == 2 and len(_actions(wall)) == 4
+
+def test_observers_from_config_with_own_channels_and_rescoring():
+    config = {
+        "personas": {"grace_observers": [{"name": "noisy", "provider": "mock", "noise": 0.5},
+                                         {"provider": "mock", "energy": 0.0}]},
+        "settings": {"seed": 3},
+        "missions": [{"name": "Seq", "type": "sequence", "params": {"sequence": [1, 2, 3]}}],
+    }
+    missions, global_cfg = load_campaign_from_config(config)
+    manager = build_manager(global_cfg, verbose=False, save_log=False)
+    manager.analyst = None
+    manager.run_campaign(missions)
+    record = manager.results[0]
+    noisy, starved = record["observers"]
+    assert (noisy["observer"], starved["observer"]) == ("noisy", "observer-2")
+    assert starved["stop_reason"] == "energy_depleted" and record["stop_reason"] == "success"
+    assert [e["chords"] for e in noisy["history"] if e["sender"] == "Rocky"] != \
+           [e["chords"] for e in record["history"] if e["sender"] == "Rocky"]
+    results = rescore_records(manager.results)
+    assert [r.mission for r in results] == ["Seq", "Seq/noisy", "Seq/observer-2"]
+    assert all(not r.error for r in results)
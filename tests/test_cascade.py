@@ -0,0 +1,51 @@
+from hail_mary.agents import LLMAlienAgent, MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.llm.base import LLMClient
+from hail_mary.llm.cascade import CascadeClient
+from hail_mary.mission import TimeMission
+
+class FixedClient(LLMClient):
+    def __init__(self, replies):
+        super().__init__()
+        self.replies = replies
+        self.calls = 0
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.calls += 1
+        reply = self.replies[(self.calls - 1) % len(self.replies)]
+        if isinstance(reply, Exception):
+            raise reply
+        self._record_usage(10, prompt, reply)
+        return reply
+
+def _grace_run(cheap_replies, strong_reply="THOUGHT: sure\nSIGNAL: 1111\nACTION: 4", samples=1):
+    cheap, strong = FixedClient(cheap_replies), FixedClient([strong_reply])
+    grace = LLMAlienAgent("Grace", "Human", client=CascadeClient([("cheap", cheap), ("strong", strong)]),
+                          samples=samples)
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), grace), CommChannel(),
+                              verbose=False, save_log=False)
+    manager.analyst = None
+    manager.run_campaign([TimeMission(interval=4)])
+    return manager.results[0]["history"][1], cheap, strong, grace
+
+def test_cheap_tier_answers_when_acceptable():
+    grace_ex, cheap, strong, grace = _grace_run(["THOUGHT: easy\nSIGNAL: 1111\nACTION: 4"])
+    assert grace_ex["tier"] == "cheap"
+    # Initial thought plus every action turn stayed on the cheap tier
+    assert strong.calls == 0
+    assert grace.tokens_used == 10 * cheap.calls
+
+def test_escalates_without_action():
+    grace_ex, _, strong, _ = _grace_run(["THOUGHT: unsure\nSIGNAL: 10\nACTION:"])
+    assert grace_ex["tier"] == "strong"
+    assert grace_ex["action"] == 4
+
+def test_escalates_on_error_and_low_agreement():
+    grace_ex, _, _, _ = _grace_run([RuntimeError("overloaded")])
+    assert grace_ex["tier"] == "strong"
+
+    split = ["THOUGHT: a\nSIGNAL: 1\nACTION: 1", "THOUGHT: b\nSIGNAL: 1\nACTION: 2", "THOUGHT: c\nSIGNAL: 1\nACTION: 3"]
+    grace_ex, _, _, _ = _grace_run(split, samples=3)
+    assert grace_ex["tier"] == "strong"
+    assert grace_ex["agreement"] == 1.0
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from hail_mary.agents import MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.events import MissionFinished
+from hail_mary.mission import SequenceMission
+from hail_mary.scheduler import EventScheduler
+
+class SlowMock(MockEridian):
+    """Mock agent with a fixed simulated LLM round trip."""
+    LATENCY = 0.05
+
+    async def get_action_async(self, log, mission_prompt):
+        await asyncio.sleep(self.LATENCY)
+        return self.get_action(log, mission_prompt)
+
+def _run(duplex: bool, channel: CommChannel = None):
+    manager = CampaignManager(
+        (SlowMock("Rocky", "Eridian"), SlowMock("Grace", "Human")),
+        channel or CommChannel(), verbose=False, save_log=False, duplex=duplex
+    )
+    mission = SequenceMission([1, 2, 3, 4, 5, 6])
+    start = time.perf_counter()
+    manager.run_campaign([mission])
+    return mission, time.perf_counter() - start
+
+def test_scheduler_fires_in_time_order():
+    fired = []
+
+    async def scenario():
+        scheduler = EventScheduler()
+        scheduler.start()
+        scheduler.schedule(0.03, lambda: fired.append("late"))
+        scheduler.schedule(0.01, lambda: fired.append("early"))
+        await asyncio.sleep(0.06)
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    assert fired == ["early", "late"]
+
+def test_duplex_overlaps_agent_latency():
+    half_mission, half_time = _run(duplex=False)
+    duplex_mission, duplex_time = _run(duplex=True)
+    assert half_mission.success_turn == duplex_mission.success_turn == 6
+    assert duplex_time < 0.8 * half_time
+    graces = [e for e in duplex_mission.log.history if e.sender == "Grace"]
+    rockies = [e for e in duplex_mission.log.history if e.sender == "Rocky"]
+    # Rocky's next transmission is sent while Grace is still answering the previous one
+    assert rockies[1].sent_at < graces[0].sent_at
+
+def test_duplex_reports_scored_turns():
+    finished = []
+    rocky = SlowMock("Rocky", "Eridian")
+    rocky.LATENCY = 0.005
+    manager = CampaignManager(
+        (rocky, SlowMock("Grace", "Human")),
+        CommChannel(), verbose=False, save_log=False, duplex=True, max_turns=3, duplex_window=4
+    )
+    manager.bus.subscribe(finished.append, event_types=(MissionFinished,))
+    mission = SequenceMission([1, 2, 3, 4, 5, 6])
+    manager.run_campaign([mission])
+    # A fast Rocky sends more often than Grace answers; only her scored turns count
+    assert finished[0].outcome == "max_turns"
+    assert finished[0].turns == 3 < len(mission.log.history) // 2
+    assert sum(e.sender == "Grace" for e in mission.log.history) == 3
+
+def test_duplex_propagation_delay_is_respected():
+    mission, _ = _run(duplex=True, channel=CommChannel(propagation_delay=0.02))
+    for exchange in mission.log.history:
+        assert abs(exchange.received_at - exchange.sent_at - 0.02) < 1e-9
+    first_rocky = mission.log.history[0]
+    first_grace = next(e for e in mission.log.history if e.sender == "Grace")
+    assert first_grace.sent_at >= first_rocky.received_at
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from hail_mary.agents import MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.events import (
+    EventBus, DROP_OLDEST, DROP_NEWEST, MissionStarted, ExchangeTransmitted,
+    TurnCompleted, MissionFinished, CampaignFinished, SubscriberError,
+)
+from hail_mary.mission import SequenceMission
+
+def test_bus_delivers_in_order():
+    received = []
+
+    async def scenario():
+        bus = EventBus()
+        bus.subscribe(received.append)
+        async with bus:
+            for i in range(5):
+                await bus.publish(i)
+
+    asyncio.run(scenario())
+    assert received == [0, 1, 2, 3, 4]
+
+def test_bus_drop_policies_do_not_block_publisher():
+    received = {DROP_OLDEST: [], DROP_NEWEST: []}
+
+    async def scenario():
+        release = asyncio.Event()
+
+        def slow(policy):
+            async def handler(event):
+                await release.wait()
+                received[policy].append(event)
+            return handler
+
+        bus = EventBus()
+        oldest = bus.subscribe(slow(DROP_OLDEST), maxsize=2, policy=DROP_OLDEST)
+        newest = bus.subscribe(slow(DROP_NEWEST), maxsize=2, policy=DROP_NEWEST)
+        async with bus:
+            for i in range(10):
+                await bus.publish(i)
+            release.set()
+        return oldest.dropped, newest.dropped
+
+    dropped_oldest, dropped_newest = asyncio.run(scenario())
+    # Publishing never yields, so the two queue slots keep either the latest or the earliest events
+    assert received[DROP_OLDEST] == [8, 9]
+    assert received[DROP_NEWEST] == [0, 1]
+    assert dropped_oldest == dropped_newest == 8
+
+def test_failing_subscriber_surfaces_when_the_bus_closes():
+    received = []
+
+    def broken(event):
+        if isinstance(event, CampaignFinished):
+            raise OSError("disk full")
+
+    manager = CampaignManager(
+        (MockEridian("Rocky", "Eridian"), MockEridian("Grace", "Human")),
+        CommChannel(), verbose=False, save_log=False
+    )
+    manager.bus.subscribe(broken)
+    manager.bus.subscribe(received.append)
+    with pytest.raises(SubscriberError, match="disk full") as failure:
+        manager.run_campaign([SequenceMission([1, 2, 3])])
+    assert isinstance(failure.value.errors[0], OSError)
+    # The other subscribers still saw every event
+    assert isinstance(received[-1], CampaignFinished)
+
+def test_campaign_publishes_typed_events():
+    events = []
+    manager = CampaignManager(
+        (MockEridian("Rocky", "Eridian"), MockEridian("Grace", "Human")),
+        CommChannel(), verbose=False, save_log=False
+    )
+    manager.bus.subscribe(events.append)
+    manager.run_campaign([SequenceMission([1, 2, 3])])
+
+    kinds = [type(e) for e in events]
+    assert kinds.count(MissionStarted) == 1
+    assert kinds.count(ExchangeTransmitted) == 6
+    assert kinds.count(TurnCompleted) == 3
+    finished = next(e for e in events if isinstance(e, MissionFinished))
+    assert finished.outcome == "success"
+    assert isinstance(events[-1], CampaignFinished)
+    assert manager.metrics.summary()["turns"] == 3
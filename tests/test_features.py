@@ -0,0 +1,58 @@
+from hail_mary.agents import LLMAlienAgent
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.features import candidate_periods, readings, repeated_block, run_lengths, shortest_period, summarize
+from hail_mary.llm.base import LLMClient
+from hail_mary.mission import SequenceMission
+
+class RecordingClient(LLMClient):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return "THOUGHT: pulses\nSIGNAL: 1000100010001000\nACTION: 4"
+
+def test_shortest_period_wins_over_its_multiples():
+    periods = candidate_periods("1000100010001000")
+    assert periods[0] == (4, 1.0)
+    assert (8, 1.0) in periods
+    assert repeated_block("1000100010001000") == ("1000", 4)
+    assert repeated_block("10110") is None
+
+def test_shortest_period_tolerates_a_stray_bit():
+    # Exactly periodic at 64, but one extra pulse per block: the pulse interval is still 4
+    chords = ("1000" * 15 + "1001") * 2
+    assert candidate_periods(chords)[0] == (64, 1.0)
+    assert shortest_period(chords) == 4
+    assert "Shortest strong period: 4." in summarize([chords])
+    assert shortest_period("1011001110001011") is None
+
+def test_runs_and_readings():
+    runs = run_lengths("1110010")
+    assert runs["1"] == {3: 1, 1: 1} and runs["0"] == {2: 1, 1: 1}
+    assert readings("1110010") == {"binary": 114, "ones": 4, "unary": 3}
+    assert readings("1x1") == {}
+
+def test_erasures_are_ignored_and_series_are_described():
+    # Erased bits never count as matches or mismatches
+    assert candidate_periods("10x010001000")[0] == (4, 1.0)
+    text = summarize(["1", "11", "111", "1111"], source="the source")
+    assert "4 signal(s) received from the source" in text
+    assert "count of 1s: 1, 2, 3, 4 (constant step 1)" in text
+    assert summarize([]) == "No signal received from the source yet."
+
+def test_features_reach_the_prompt_only_when_enabled():
+    for enabled in (False, True):
+        rocky_client, grace_client = RecordingClient(), RecordingClient()
+        agents = (LLMAlienAgent("Rocky", "Eridian", client=rocky_client),
+                  LLMAlienAgent("Grace", "Human", client=grace_client, features=enabled))
+        manager = CampaignManager(agents, CommChannel(), verbose=False, save_log=False, max_turns=1)
+        manager.analyst = None
+        manager.run_campaign([SequenceMission([1, 2, 3])])
+        action_prompts = [p for p in grace_client.prompts if "SIGNAL HISTORY" in p]
+        assert action_prompts
+        assert ("SIGNAL FEATURES" in action_prompts[-1]) is enabled
+        assert not any("SIGNAL FEATURES" in p for p in rocky_client.prompts)
+    assert "Shortest strong period: 4" in action_prompts[-1]
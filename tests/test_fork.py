@@ -0,0 +1,65 @@
+import asyncio
+from hail_mary.agents import MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.fork import ForkPlan, MissionSnapshot
+from hail_mary.mission import SequenceMission
+
+class ConcurrencyProbe(MockEridian):
+    """Mock Grace that records how many of its calls overlap (shared across branch copies)."""
+    def __init__(self, name, role):
+        super().__init__(name, role)
+        self.stats = {"in_flight": 0, "peak": 0}
+
+    async def get_action_async(self, log, mission_prompt):
+        self.stats["in_flight"] += 1
+        self.stats["peak"] = max(self.stats["peak"], self.stats["in_flight"])
+        await asyncio.sleep(0.01)
+        self.stats["in_flight"] -= 1
+        return self.get_action(log, mission_prompt)
+
+def _forked_run(branches, grace=None):
+    mission = SequenceMission([1] * 6)
+    mission.log.metadata["fork"] = {"at_turn": 2, "branches": branches}
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), grace or MockEridian("Grace", "Human")),
+                              CommChannel(), verbose=False, save_log=False)
+    manager.run_campaign([mission])
+    return manager.results[0]
+
+def test_snapshot_restores_independent_state_and_rng():
+    channel = CommChannel(noise_level=0.5, seed=7)
+    mission = SequenceMission([1, 2, 3])
+    snapshot = MissionSnapshot(0, mission, channel, [], {}, 0)
+    channel.transmit("1111")
+
+    (m1, c1, _), (m2, c2, _) = snapshot.restore(), snapshot.restore()
+    assert c1.transmit("0" * 32) == c2.transmit("0" * 32)
+    m1.current_idx = 2
+    assert m2.current_idx == 0
+
+def test_fork_stores_prefix_once_and_branches_diverge():
+    record = _forked_run([{"name": "clean"}, {"name": "dead", "energy": 0}])
+
+    assert record["stop_reason"] == "forked"
+    assert len(record["history"]) == 4
+    clean, dead = record["branches"]
+    assert (clean["branch"], clean["stop_reason"], clean["turns_to_success"]) == ("clean", "success", 6)
+    assert len(clean["history"]) == 8
+    assert dead["stop_reason"] == "energy_depleted"
+    assert dead["settings"]["channel"] == {"remaining_energy": 0}
+
+def test_branches_run_concurrently():
+    grace = ConcurrencyProbe("Grace", "Human")
+    _forked_run([{"name": f"b{i}"} for i in range(3)], grace=grace)
+    assert grace.stats["peak"] == 3
+
+def test_fork_plan_validation():
+    plan = ForkPlan.from_config({"at_turn": 3, "branches": [{"noise": 0.2, "grace_model": "x", "grace_provider": "ollama"}]})
+    assert plan.branches[0].name == "branch-1"
+    assert plan.branches[0].channel == {"noise_level": 0.2}
+    assert plan.branches[0].models["grace"] == {"provider": "ollama", "model": "x"}
+    try:
+        ForkPlan.from_config({"at_turn": 0, "branches": [{}]})
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
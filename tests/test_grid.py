@@ -0,0 +1,57 @@
+import copy
+import pytest
+from hail_mary.mission import GridMission
+from hail_mary.mission_registry import MissionConfigError, build_mission
+from hail_mary.protocol import Exchange
+
+ROCKY = Exchange("Rocky", "", "1")
+
+def _walk(mission, moves):
+    for move in moves:
+        done = mission.update_state(ROCKY, Exchange("Grace", "", "1", action=move))
+    return done
+
+def test_default_grid_keeps_its_behaviour():
+    mission = GridMission()
+    assert mission.target == (4, 4) and mission.grace_pos == (0, 0)
+    assert _walk(mission, [1, 1, 1, 1, 3, 3, 3, 3])
+    results = mission.get_results()
+    assert results["final_pos"] == (4, 4) and results["steps"] == 8
+    assert results["path_efficiency"] == 1.0 and results["optimal_moves"] == 8
+
+def test_obstacles_route_around_walls_and_score_detours():
+    # The wall forces a detour through the right-hand column
+    mission = GridMission(map=["...",
+                               "##.",
+                               "..."], target=[2, 0])
+    assert mission.shortest_path == 6
+    assert "Open moves from here: right (3)." in mission.get_prompts()[0] # Down is a wall
+    # Bumping into the wall wastes a step; the rest is optimal
+    assert _walk(mission, [1, 3, 3, 1, 1, 2, 2])
+    results = mission.get_results()
+    assert (results["steps"], results["optimal_moves"]) == (7, 6)
+    assert results["path_efficiency"] == pytest.approx(6 / 7)
+
+def test_random_targets_are_reachable_and_reproducible():
+    first = GridMission(width=40, height=30, obstacles=0.3, target="random", seed=5)
+    again = GridMission(width=40, height=30, obstacles=0.3, target="random", seed=5)
+    assert first.target == again.target and first.grid is again.grid
+    assert first.shortest_path > 0
+    with pytest.raises(MissionConfigError):
+        build_mission("grid", {"map": ["..", ".."], "target": "corner"})
+    # Snapshots for forks share the map and its distance field
+    assert copy.deepcopy(first).field is first.field
+
+def test_cells_must_be_y_x_pairs():
+    for params in ({"start": [0]}, {"target": [1, 2, 3]}):
+        with pytest.raises(MissionConfigError, match="items"):
+            build_mission("grid", params)
+
+def test_large_open_map_needs_no_search():
+    mission = GridMission(width=1000, height=1000, target="random", seed=1)
+    # Open maps answer distances from the Manhattan formula instead of a BFS field
+    assert mission.field._dist is None
+    for _ in range(2000):
+        mission.update_state(ROCKY, Exchange("Grace", "", "1", action=3))
+        mission.get_prompts()
+    assert mission.get_results()["remaining_distance"] >= 0
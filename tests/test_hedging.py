@@ -0,0 +1,69 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent, MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.llm.base import LLMClient
+from hail_mary.llm.hedging import HedgedClient, RollingLatency
+from hail_mary.mission import TimeMission
+
+REPLY = "THOUGHT: sure\nSIGNAL: 1111\nACTION: 4"
+
+class SlowClient(LLMClient):
+    """Replies after scripted delays; an Exception entry is raised instead."""
+    def __init__(self, delays, reply=REPLY):
+        super().__init__()
+        self.delays = delays
+        self.reply = reply
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get_generated_text(self, prompt: str) -> str:
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        if isinstance(delay, Exception):
+            raise delay
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self._record_usage(10, prompt, self.reply)
+        return self.reply
+
+def test_rolling_percentile_forgets_old_samples():
+    latency = RollingLatency(window=10)
+    for seconds in [5.0] * 10 + [0.1] * 10:
+        latency.observe(seconds)
+    assert len(latency) == 10
+    assert latency.percentile(0.95) == 0.1
+
+def test_slow_primary_is_hedged_and_cancelled():
+    primary = SlowClient([0.01] * 5 + [2.0])
+    fallback = SlowClient([0.01], reply="fallback")
+    client = HedgedClient(primary, fallback, min_samples=5, min_delay=0.02)
+
+    async def scenario():
+        for _ in range(5):
+            await client.get_generated_text("p")
+        started = asyncio.get_running_loop().time()
+        reply = await client.get_generated_text("p")
+        await asyncio.sleep(0) # Let the cancellation land
+        return reply, asyncio.get_running_loop().time() - started
+
+    reply, elapsed = asyncio.run(scenario())
+    assert reply == "fallback" and elapsed < 0.5
+    assert primary.cancelled == 1
+    assert client.hedge_stats() == {"calls": 6, "hedges": 1, "hedge_wins": 1, "failovers": 0}
+    assert client.total_tokens == 60
+
+def test_hard_error_fails_over_and_is_recorded_per_exchange():
+    primary = SlowClient([RuntimeError("503 overloaded")])
+    fallback = SlowClient([0.0])
+    grace = LLMAlienAgent("Grace", "Human", client=HedgedClient(primary, fallback))
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), grace), CommChannel(), verbose=False, save_log=False)
+    manager.analyst = None
+    manager.run_campaign([TimeMission(interval=4)])
+    grace_ex = manager.results[0]["history"][1]
+    assert grace_ex["action"] == 4
+    assert grace_ex["hedge"] == {"calls": 1, "hedges": 0, "hedge_wins": 0, "failovers": 1}
+    assert manager.results[0]["history"][0]["hedge"] is None # Rule-based Rocky
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from openai import RateLimitError
+from hail_mary.fakeserver import FakeLLMServer, FaultProfile
+from hail_mary.llm.clients import OpenAIClient
+from hail_mary.llm.gemini_wrapper import GeminiWrapper
+from hail_mary.llm.keypool import KeyPool, api_keys, retry_after
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class RateLimit(Exception):
+    status_code = 429
+    headers = {"retry-after": "5"}
+
+def test_pool_spreads_by_budget_and_refills():
+    clock = Clock()
+    pool = KeyPool(["a", "b"], rpm=2, clock=clock)
+    picked = [pool.pick() for _ in range(5)]
+    assert [s.key for s in picked[:4]] == ["a", "b", "a", "b"] and picked[4] is None
+    for state in picked[:4]:
+        state.in_flight -= 1
+    clock.now = 30.0 # Half a minute refills one request per key
+    assert {pool.pick().key, pool.pick().key} == {"a", "b"} and pool.pick() is None
+
+def test_rate_limited_key_cools_down_and_call_moves_on():
+    clock = Clock()
+    pool = KeyPool(["a", "b"], clock=clock)
+    calls = []
+
+    async def call(key):
+        calls.append(key)
+        if key == "a":
+            raise RateLimit()
+        return key
+
+    async def scenario():
+        return [await pool.run(call) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == ["b", "b", "b"]
+    assert calls == ["a", "b", "b", "b"] # "a" is skipped while cooling down
+    assert pool.stats()["...a"] == {"requests": 1, "rate_limited": 1, "cooling": True}
+    clock.now = 5.0
+    assert pool.pick().key == "a"
+    assert retry_after(RateLimit()) == 5.0 and retry_after(ValueError()) is None
+
+def test_key_lists_from_environment(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEYS", "k1, k2,")
+    assert api_keys("OPENAI") == ["k1", "k2"]
+    monkeypatch.delenv("OPENAI_API_KEYS")
+    monkeypatch.setenv("OPENAI_API_KEY", "solo")
+    assert api_keys("OPENAI") == ["solo"] and api_keys("OPENAI", ["x", "y"]) == ["x", "y"]
+
+def test_throughput_scales_with_keys(monkeypatch):
+    async def scenario():
+        async with FakeLLMServer(faults=FaultProfile(key_rpm=3), seed=1) as server:
+            base_url = f"{server.base_url}/v1"
+            rocky = OpenAIClient(model="fake", api_key=["k1", "k2", "k3"], base_url=base_url)
+            grace = OpenAIClient(model="fake", api_key=["k1", "k2", "k3"], base_url=base_url)
+            assert rocky.pool is grace.pool
+            replies = await asyncio.gather(*(client.get_generated_text("hi") for client in [rocky, grace] * 4),
+                                           rocky.get_generated_text("hi"))
+            with pytest.raises(RateLimitError):
+                await grace.get_generated_text("hi")
+            return replies, dict(server.stats.keys)
+
+    replies, keys = asyncio.run(scenario())
+    assert len(replies) == 9 and keys == {"k1": 4, "k2": 4, "k3": 4}
+
+    async def gemini():
+        async with FakeLLMServer(faults=FaultProfile(key_rpm=1), seed=1) as server:
+            client = GeminiWrapper(model="fake", base_url=server.base_url)
+            await client.get_generated_text("hi")
+            await client.get_generated_text("hi")
+            return dict(server.stats.keys)
+
+    monkeypatch.setenv("GEMINI_API_KEYS", "g1,g2")
+    assert asyncio.run(gemini()) == {"g1": 1, "g2": 1}
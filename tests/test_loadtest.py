@@ -0,0 +1,66 @@
+import asyncio
+import urllib.error
+import pytest
+from openai import AsyncOpenAI
+from hail_mary.fakeserver import FakeLLMServer, FaultProfile, LatencyProfile, ResponseScript
+from hail_mary.loadtest import make_client, percentile, run_load_test
+
+def test_fake_server_speaks_all_providers():
+    async def scenario():
+        async with FakeLLMServer(seed=1) as server:
+            return [
+                await make_client(provider, server.base_url).get_generated_text("Current value to send: 3.")
+                for provider in ("openai", "anthropic", "gemini")
+            ], server.stats.requests
+
+    replies, requests = asyncio.run(scenario())
+    for reply in replies:
+        assert "SIGNAL: 1110" in reply
+        assert "ACTION: 3" in reply
+    assert requests == {"openai": 1, "anthropic": 1, "gemini": 1}
+
+def test_fake_server_streaming():
+    script = ResponseScript(responses=["THOUGHT: streamed.\nSIGNAL: 1010\nACTION: 2"])
+
+    async def scenario():
+        async with FakeLLMServer(script=script, stream_chunks=5) as server:
+            client = AsyncOpenAI(api_key="fake-key", base_url=f"{server.base_url}/v1")
+            stream = await client.chat.completions.create(
+                model="fake", messages=[{"role": "user", "content": "hi"}], stream=True
+            )
+            pieces = [chunk.choices[0].delta.content async for chunk in stream if chunk.choices[0].delta.content]
+            return pieces, server.stats.streams
+
+    pieces, streams = asyncio.run(scenario())
+    assert len(pieces) > 1
+    assert "".join(pieces) == script.responses[0]
+    assert streams == 1
+
+def test_fake_server_rate_limit_injection():
+    async def scenario():
+        async with FakeLLMServer(faults=FaultProfile(rate_limit_rate=1.0)) as server:
+            with pytest.raises(urllib.error.HTTPError) as exc:
+                await make_client("gemini", server.base_url).get_generated_text("hi")
+            return exc.value.code, server.stats.rate_limited
+
+    assert asyncio.run(scenario()) == (429, 1)
+
+def test_latency_profile_parse():
+    profile = LatencyProfile.parse("uniform:0.5:0.1")
+    assert profile.distribution == "uniform"
+    assert profile.mean == 0.5
+    assert LatencyProfile.parse("instant").mean == 0.0
+
+def test_percentile():
+    values = [i / 100 for i in range(1, 101)]
+    assert percentile(values, 50) == 0.5
+    assert percentile(values, 99) == 0.99
+    assert percentile([], 95) == 0.0
+
+def test_load_test_report():
+    report = asyncio.run(run_load_test(provider="openai", campaigns=3, seed=7))
+    summary = report.summary()
+    # 2 initial thoughts + 5 turns x 2 agents + 1 analysis per campaign
+    assert summary["calls"] == 3 * 13
+    assert summary["errors"] == 0
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
@@ -0,0 +1,77 @@
+import json
+import sys
+import pytest
+from hail_mary.analyze import convert_log, load_records, open_log
+from hail_mary.logformat import MAGIC, BinaryLogReader, LogFormatError, write_binary_log
+from hail_mary.sinks import CampaignLogWriter
+
+PERSONA = "You are Rocky, an Eridian engineer. Communicate only in binary chords. " * 8
+
+def _records(missions=12, turns=30):
+    records = []
+    for m in range(missions):
+        history = []
+        for t in range(turns):
+            for sender in ("Rocky", "Grace"):
+                signals = " | ".join(f"{e['sender']}: {e['chords']}" for e in history)
+                history.append({
+                    "sender": sender, "thought": f"{sender} thinking about turn {t}", "chords": format(t, "b"),
+                    "action": t if sender == "Grace" else None,
+                    "raw_request": f"{PERSONA}\nMISSION CONTEXT: mission {m}\nSIGNAL HISTORY:\n{signals}",
+                    "raw_response": f"THOUGHT: turn {t}\nSIGNAL: {t:b}", "sent_at": t * 1.5,
+                    "received_at": t * 1.5, "candidates": None, "agreement": None, "tier": None, "hedge": None,
+                })
+        records.append({"mission": f"Mission {m}", "summary": {"accuracy": 0.5}, "turns_to_success": None,
+                        "stop_reason": "max_turns", "agents": {}, "history": history, "energy_remaining": 12.5})
+    return records
+
+def test_binary_log_is_compact_and_round_trips(tmp_path):
+    records = _records()
+    json_path, binary_path = tmp_path / "log.json", tmp_path / "log.hmlog"
+    json_path.write_text(json.dumps(records, indent=2))
+    convert_log(str(json_path), str(binary_path))
+    assert json_path.stat().st_size > 5 * binary_path.stat().st_size
+    assert load_records(str(binary_path)) == records
+
+    convert_log(str(binary_path), str(tmp_path / "back.json"))
+    assert json.loads((tmp_path / "back.json").read_text()) == records
+
+def test_reader_seeks_to_missions_and_turns(tmp_path):
+    records = _records()
+    path = str(tmp_path / "log.hmlog")
+    write_binary_log(path, records, block_size=16)
+    with BinaryLogReader(path) as log:
+        assert len(log) == 12 and log.mission_names()[7] == "Mission 7"
+        assert "history" not in log.header(7) and log.header(7)["energy_remaining"] == 12.5
+        assert log.turn(7, 20) == records[7]["history"][38:40]
+        streamed = log.exchanges(3, start=17)
+        assert next(streamed) == records[3]["history"][17]
+        assert list(log.exchanges(3, 50, 70)) == records[3]["history"][50:60]
+    # JSON logs answer the same calls
+    json_path = tmp_path / "log.json"
+    json_path.write_text(json.dumps(records))
+    with open_log(str(json_path)) as log:
+        assert log.turn(7, 20) == records[7]["history"][38:40]
+
+def test_log_writer_saves_binary_logs(tmp_path):
+    writer = CampaignLogWriter(log_dir=str(tmp_path), announce=False, log_format="binary")
+    writer.records = dict(enumerate(_records(missions=2, turns=3)))
+    path = writer.save()
+    assert path.endswith(".hmlog")
+    assert load_records(path) == _records(missions=2, turns=3)
+
+def test_json_zlib_fallback_without_binlog_extra(tmp_path, monkeypatch):
+    # As if msgpack and zstandard were not installed, whatever this machine has
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    records = _records(missions=2, turns=5)
+    path = tmp_path / "log.hmlog"
+    write_binary_log(str(path), records)
+    data = path.read_bytes()
+    assert data[:len(MAGIC) + 2] == MAGIC + b"jd"
+    assert load_records(str(path)) == records
+
+    # A log written with msgpack names the extra that reads it
+    path.write_bytes(MAGIC + b"md" + data[len(MAGIC) + 2:])
+    with pytest.raises(LogFormatError, match=r"hail-mary\[binlog\]"):
+        load_records(str(path))
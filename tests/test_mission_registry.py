@@ -0,0 +1,64 @@
+import sys
+from types import SimpleNamespace
+import pytest
+from hail_mary import mission_registry
+from hail_mary.loader import load_campaign_from_config
+from hail_mary.mission_registry import MissionConfigError, build_mission, validate_params
+
+PLUGIN = '''
+from hail_mary.mission import AbstractMission
+
+class DockingMission(AbstractMission):
+    PARAMS_SCHEMA = {"type": "object", "properties": {"port": {"type": "integer"}},
+                     "required": ["port"], "additionalProperties": False}
+
+    def __init__(self, port):
+        super().__init__("Docking")
+        self.port = port
+
+    @property
+    def description(self):
+        return "Dock"
+
+    def _get_task_prompts(self):
+        return "dock", "dock"
+
+    def update_state(self, rocky_exchange, grace_exchange):
+        return True
+
+    def get_results(self):
+        return {}
+'''
+
+def _campaign(mission_type, params):
+    return {"missions": [{"name": "M", "type": mission_type, "params": params}]}
+
+def test_unknown_types_and_bad_params_fail_at_load():
+    with pytest.raises(MissionConfigError, match="Unknown mission type 'warp'"):
+        load_campaign_from_config(_campaign("warp", {}))
+    with pytest.raises(MissionConfigError, match=r"params.size: expected integer"):
+        load_campaign_from_config(_campaign("grid", {"size": "big"}))
+    with pytest.raises(MissionConfigError, match="unknown parameter 'speed'"):
+        load_campaign_from_config(_campaign("time", {"interval": 2, "speed": 3}))
+    with pytest.raises(MissionConfigError, match="not one of"):
+        build_mission("logic", {"operator": "NAND"})
+    with pytest.raises(MissionConfigError, match="Unknown sequence"):
+        build_mission("sequence", {"sequence": {"name": "nope", "length": 3}})
+    assert validate_params({"type": "array", "items": {"type": "integer"}}, [1, "2"]) == [
+        "params[1]: expected integer, got str"]
+
+def test_entry_point_missions_load_lazily(tmp_path, monkeypatch):
+    (tmp_path / "docking_pack.py").write_text(PLUGIN)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(mission_registry, "_entry_points_loaded", False)
+    monkeypatch.setattr(mission_registry, "MISSION_TYPES", dict(mission_registry.MISSION_TYPES))
+    monkeypatch.setattr(mission_registry, "_entry_points",
+                        lambda: [SimpleNamespace(name="docking", value="docking_pack:DockingMission")])
+
+    load_campaign_from_config(_campaign("grid", {"size": 3}))
+    assert "docking_pack" not in sys.modules
+
+    missions, _ = load_campaign_from_config(_campaign("docking", {"port": 4}))
+    assert (type(missions[0]).__name__, missions[0].port, missions[0].name) == ("DockingMission", 4, "M")
+    with pytest.raises(MissionConfigError, match="missing required 'port'"):
+        load_campaign_from_config(_campaign("docking", {}))
@@ -0,0 +1,64 @@
+import random
+from hail_mary.agents import MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.mission import SequenceMission
+from hail_mary.noise import (
+    BitFlip, CompositeNoise, Erasure, GilbertElliott, InsertionDeletion, NoiseTape, build_noise_model,
+)
+
+def test_seeded_streams_are_reproducible_and_independent():
+    signal = "01" * 500
+    a, b = CommChannel(noise_level=0.2, seed=3), CommChannel(noise_level=0.2, seed=3)
+    assert a.transmit(signal) == b.transmit(signal)
+
+    # Derived streams depend only on the seed and key, not on what ran before
+    a.transmit(signal)
+    assert a.reseed("mission", 1).transmit(signal) == b.reseed("mission", 1).transmit(signal)
+    assert a.reseed("mission", 2).transmit(signal) != b.reseed("mission", 1).transmit(signal)
+
+    # Noise does not depend on the content sent, so a tape replays against any signal
+    tape = CommChannel(noise_level=0.2, seed=5).pregenerate(2000)
+    replay = CommChannel()
+    replay.load_tape(tape)
+    assert replay.transmit("1" * 1000) == tape.slice(0, 1000).apply("1" * 1000)
+    assert CommChannel(noise_level=0.2, seed=5).transmit("0" * 1000) == tape.slice(0, 1000).apply("0" * 1000)
+
+def test_noise_model_rates_and_shapes():
+    n = 200_000
+    rng = random.Random(1)
+    flips = BitFlip(0.05).generate(n, rng).flips
+    assert abs(bin(flips).count("1") / n - 0.05) < 0.005
+
+    # Burst noise: same long-run rate as its stationary mix, but errors cluster
+    burst = GilbertElliott(0.01, 0.1, error_good=0.0, error_bad=0.5)
+    mask = burst.generate(n, rng).flips
+    rate = bin(mask).count("1") / n
+    assert abs(rate - (0.01 / 0.11) * 0.5) < 0.01
+    adjacent = bin(mask & (mask >> 1)).count("1") / max(1, bin(mask).count("1"))
+    assert adjacent > 2 * rate
+
+    erased = Erasure(0.1).generate(16, random.Random(2)).apply("1" * 16)
+    assert len(erased) == 16 and set(erased) <= {"1", "x"}
+    shifted = InsertionDeletion(0.3, 0.3).generate(100, random.Random(2)).apply("1" * 100)
+    assert len(shifted) != 100 or "0" in shifted
+
+    combined = build_noise_model([{"type": "flip", "p": 0.1}, {"type": "erasure", "p": 0.1}])
+    assert isinstance(combined, CompositeNoise)
+
+def test_tape_slicing_and_serialization():
+    tape = NoiseTape(8, flips=0b00000101, erasures=0b10000000, insertions={3: "1"})
+    assert tape.apply("00000000") == "101" + "1" + "0000x"
+    assert tape.slice(2, 4).apply("0000") == "1" + "1" + "000"
+    assert NoiseTape.from_dict(tape.to_dict()) == tape
+
+def test_campaign_missions_get_seeded_streams():
+    def run(seed):
+        missions = [SequenceMission([1, 2, 3]), SequenceMission([1, 2, 3])]
+        manager = CampaignManager((MockEridian("Rocky", "Eridian"), MockEridian("Grace", "Human")),
+                                  CommChannel(noise_level=0.3, seed=seed), verbose=False, save_log=False)
+        manager.run_campaign(missions)
+        return [[ex["chords"] for ex in r["history"]] for r in manager.results]
+
+    assert run(11) == run(11)
+    assert run(11) != run(12)
@@ -0,0 +1,46 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.fakeserver import FakeLLMServer, LatencyProfile, OllamaProfile
+from hail_mary.llm.ollama import _CAPACITY, OllamaClient
+from hail_mary.mission import SequenceMission
+
+def _server(load_time=0.2, parallel=2, latency=0.05):
+    return FakeLLMServer(seed=1, latency=LatencyProfile(mean=latency),
+                         ollama=OllamaProfile(load_time=load_time, num_parallel=parallel))
+
+def test_cold_client_reports_load_separately():
+    async def scenario():
+        async with _server() as server:
+            client = OllamaClient("llama3", base_url=server.base_url + "/v1")
+            first = await client.get_generated_text("Value to send: 2.")
+            await client.get_generated_text("Value to send: 3.")
+            return first, client.timings()
+
+    first, timings = asyncio.run(scenario())
+    assert "SIGNAL: 110" in first
+    assert (timings["calls"], timings["cold_starts"]) == (2, 1)
+    assert 0.15 < timings["load_seconds"] < 0.4
+    assert 0.05 < timings["inference_seconds"] + timings["prompt_seconds"] < 0.2
+
+def test_campaign_prewarms_pins_and_shares_parallel_slots():
+    async def scenario():
+        async with _server(parallel=2) as server:
+            rocky = LLMAlienAgent("Rocky", "Eridian", client=OllamaClient("llama3", base_url=server.base_url))
+            grace = LLMAlienAgent("Grace", "Human", client=OllamaClient("llama3", base_url=server.base_url),
+                                  samples=3)
+            manager = CampaignManager((rocky, grace), CommChannel(), verbose=False, save_log=False)
+            await manager.run_campaign_async([SequenceMission([1, 2]), SequenceMission([3])])
+            return server.stats, server._models, manager.results, rocky.client, _CAPACITY[(server.base_url, "llama3")]
+
+    stats, models, results, rocky_client, capacity = asyncio.run(scenario())
+    # Loaded once at campaign start, never again; released to the default keep-alive afterwards
+    assert stats.model_loads == 1
+    assert models["llama3"] is not None
+    assert rocky_client.stats.cold_starts == 0 and rocky_client.stats.warmup_seconds >= 0.2
+    # Grace's three samples queue locally for the two detected slots
+    assert capacity == 2
+    timings = results[0]["agents"]["grace"]["timings"]
+    assert timings["cold_starts"] == 0 and timings["calls"] >= 6
+    assert timings["queue_seconds"] > 0.03
@@ -0,0 +1,60 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent
+from hail_mary.fakeserver import FakeLLMServer
+from hail_mary.llm.base import LLMClient
+from hail_mary.loadtest import make_client
+from hail_mary.parsing import PARSE_STATS, parse_response, response_schema
+from hail_mary.protocol import ContactLog
+
+class QueueClient(LLMClient):
+    def __init__(self, replies):
+        super().__init__()
+        self.replies = list(replies)
+        self.prompts = []
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return self.replies.pop(0)
+
+def test_parser_matches_text_format():
+    result = parse_response("THOUGHT: pattern is 3.\nSIGNAL:\n 1 1 1 0\nACTION: 3", requires_action=True)
+    assert result.as_tuple() == ("pattern is 3.", "1110", 3)
+    assert result.ok
+
+    # Tolerates markdown emphasis and a missing SIGNAL tag
+    assert parse_response("**THOUGHT:** hm\n**SIGNAL:** 101").as_tuple() == ("hm", "101", None)
+    assert parse_response("hm\n0101\nACTION: 2").as_tuple() == ("...", "0101", 2)
+
+    # A blank ACTION is an abstention, a missing one is a format failure
+    assert parse_response("THOUGHT: ?\nSIGNAL: 1\nACTION:", requires_action=True).ok
+    assert not parse_response("THOUGHT: ?\nSIGNAL: 1", requires_action=True).ok
+    assert not parse_response("I am not sure what to send.").ok
+
+def test_parser_reads_structured_json():
+    result = parse_response('```json\n{"thought": "t", "signal": "1 0 1", "action": null}\n```', requires_action=True)
+    assert result.as_tuple() == ("t", "101", None)
+    assert result.ok
+
+def test_repair_reprompt_recovers_mangled_reply():
+    client = QueueClient(["I think it's three, sending ones.", "THOUGHT: three\nSIGNAL: 111\nACTION: 3"])
+    grace = LLMAlienAgent("Grace", "Human", client=client)
+    grace.metadata = {"provider": "queue-test"}
+
+    thought, chords, action, _, response = asyncio.run(grace.get_action_async(ContactLog("t"), "ctx"))
+    assert (chords, action) == ("111", 3)
+    assert "could not be parsed" in client.prompts[1]
+    assert "I think it's three" in client.prompts[1]
+    stats = PARSE_STATS["queue-test"]
+    assert (stats.responses, stats.failures, stats.repaired) == (1, 1, 1)
+
+def test_structured_output_on_providers():
+    async def scenario():
+        async with FakeLLMServer(seed=1) as server:
+            schema = response_schema(with_action=True)
+            return [
+                await make_client(provider, server.base_url).get_structured_text("Value to send: 2.", schema)
+                for provider in ("openai", "anthropic", "gemini")
+            ]
+
+    for reply in asyncio.run(scenario()):
+        assert parse_response(reply, requires_action=True).as_tuple()[1:] == ("110", 2)
@@ -0,0 +1,76 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.llm.base import LLMClient
+from hail_mary.llm.singleflight import SingleFlight
+from hail_mary.mission import SequenceMission
+
+class CountingClient(LLMClient):
+    """Slow client that tracks how many of its requests overlap."""
+    def __init__(self, model="test-model", delay=0.05):
+        super().__init__()
+        self.model = model
+        self.delay = delay
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return "THOUGHT: plan\nSIGNAL: 1\nACTION: 1"
+
+def _manager(rocky_client, grace_client):
+    agents = (LLMAlienAgent("Rocky", "Eridian", client=rocky_client),
+              LLMAlienAgent("Grace", "Human", client=grace_client))
+    manager = CampaignManager(agents, CommChannel(), verbose=False, save_log=False, max_turns=1)
+    manager.analyst = None
+    return manager
+
+def _initial(prompts):
+    return [p for p in prompts if "initial strategy" in p]
+
+def test_single_flight_shares_in_flight_requests_only():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def scenario():
+        group = SingleFlight()
+        first = await asyncio.gather(*(group.do("k", call) for _ in range(5)))
+        second = await group.do("k", call)
+        return group, first, second
+
+    group, first, second = asyncio.run(scenario())
+    assert first == [1] * 5 and second == 2
+    assert (group.requests, group.coalesced) == (2, 4)
+
+def test_initial_thoughts_are_requested_together_at_campaign_start():
+    client = CountingClient()
+    manager = _manager(client, client)
+    missions = [SequenceMission([1, 2]), SequenceMission([3, 4]), SequenceMission([5, 6])]
+    manager.run_campaign(missions)
+    # Rocky's three prompts name their sequences; Grace's are identical and collapse into one.
+    # All of them overlapped before the first turn.
+    assert len(_initial(client.prompts)) == 4
+    assert client.peak == 4
+    assert client.prompts[:4] == _initial(client.prompts)
+    assert len(manager.results) == 3
+
+def test_identical_trials_share_initial_thought_requests():
+    clients = [CountingClient() for _ in range(4)]
+    managers = [_manager(clients[0], clients[1]), _manager(clients[2], clients[3])]
+
+    async def scenario():
+        await asyncio.gather(*(m.run_campaign_async([SequenceMission([1, 2])]) for m in managers))
+
+    asyncio.run(scenario())
+    # Same provider/model and byte-identical prompts: one request per role across both trials
+    assert sum(len(_initial(c.prompts)) for c in clients) == 2
@@ -0,0 +1,86 @@
+import json
+import time
+from hail_mary.agents import MockEridian
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.loader import load_campaign_from_config
+from hail_mary.mission import TimeMission
+from hail_mary.protocol import ColumnarContactLog
+from hail_mary.rescore import rescore_archive, rescore_records
+from hail_mary.stopping import build_stopping_policies
+
+CONFIG = {"missions": [
+    {"name": "Ones", "type": "sequence", "params": {"sequence": [1, 1, 1]}},
+    {"name": "Walk", "type": "grid", "params": {"size": 3}},
+]}
+
+def _records(config=CONFIG):
+    missions, _ = load_campaign_from_config(config)
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), MockEridian("Grace", "Human")), CommChannel(),
+                              verbose=False, save_log=False, max_turns=4)
+    manager.analyst = None
+    manager.run_campaign(missions)
+    return json.loads(json.dumps(manager.results))
+
+def test_rescoring_reproduces_recorded_outcomes(tmp_path):
+    records = _records()
+    assert records[0]["spec"] == {"type": "sequence", "params": {"sequence": [1, 1, 1]}}
+    path = tmp_path / "log.json"
+    path.write_text(json.dumps(records))
+
+    results = rescore_archive([str(path)])
+    assert [r.mission for r in results] == ["Ones", "Walk"]
+    assert all(not r.error and not r.diverged for r in results)
+    assert results[0].rescored == {"summary": {"accuracy": 1.0}, "turns_to_success": 3, "stop_reason": "success"}
+    assert results[1].rescored["stop_reason"] == "max_turns"
+
+def test_columnar_logs_keep_their_spec():
+    missions, _ = load_campaign_from_config(dict(CONFIG, settings={"columnar_log": True}, personas={"grace": "calm"}))
+    assert isinstance(missions[0].log, ColumnarContactLog)
+    assert missions[0].log.metadata["spec"] == {"type": "sequence", "params": {"sequence": [1, 1, 1]}}
+    assert missions[0].log.metadata["grace_persona"] == "calm"
+    results = rescore_records(_records(dict(CONFIG, settings={"columnar_log": True})))
+    assert [r.mission for r in results] == ["Ones", "Walk"]
+    assert all(not r.error and not r.diverged for r in results)
+
+def test_changed_rules_and_channel_are_flagged():
+    records = _records()
+    for record in records:
+        del record["spec"] # An older log: missions come from the config instead
+    specs = {"Ones": {"type": "sequence", "params": {"sequence": [1, 2, 1]}},
+             "Walk": {"type": "grid", "params": {"size": 2}}}
+    ones, walk = rescore_records(records, specs=specs)
+    assert ones.diverged == ["summary"] and ones.rescored["summary"] == {"accuracy": 2 / 3}
+    # The same recorded moves stop at the edge of the smaller grid
+    assert walk.original["summary"]["final_pos"] == [2, 0]
+    assert walk.rescored["summary"]["final_pos"] == [1, 0] and walk.diverged == ["summary"]
+
+    # A tight energy budget ends the sequence mission before it succeeds
+    ones, _ = rescore_records(records, specs=specs, channel_cfg={"energy": 1.0})
+    assert ones.rescored["stop_reason"] == "energy_depleted"
+    assert set(ones.diverged) == {"turns_to_success", "stop_reason"}
+
+    missing, _ = rescore_records(records)
+    assert missing.error and not missing.rescored
+
+def test_policy_stopped_missions_do_not_diverge():
+    mission = TimeMission(interval=1)
+    mission.log.metadata["spec"] = {"type": "time", "params": {"interval": 1}}
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), MockEridian("Grace", "Human")), CommChannel(),
+                              verbose=False, save_log=False,
+                              stopping=build_stopping_policies({"consecutive_correct": 2}))
+    manager.analyst = None
+    manager.run_campaign([mission])
+    record = json.loads(json.dumps(manager.results[0]))
+    assert (record["stop_reason"], record["stop_turn"]) == ("converged", 2)
+
+    older = dict(record, turns_to_success=2) # Logs from before stop_turn stamped the turn here
+    for result in rescore_records([record, older]):
+        assert result.rescored["stop_reason"] == "converged" and not result.diverged
+
+def test_thousands_of_logs_rescore_quickly():
+    records = _records() * 1000
+    started = time.perf_counter()
+    results = rescore_records(records)
+    assert len(results) == 2000 and not any(r.diverged or r.error for r in results)
+    assert time.perf_counter() - started < 5.0
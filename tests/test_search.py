@@ -0,0 +1,68 @@
+import asyncio
+import math
+import random
+import pytest
+import yaml
+from hail_mary.search import BayesianThreshold, Bisection, apply_parameter, campaign_trial, search
+
+def _noisy_trial(threshold, width, runs=4, seed=0, increasing=False):
+    rng = random.Random(seed)
+
+    async def trial(value):
+        z = (value - threshold if increasing else threshold - value) / width
+        p = 1 / (1 + math.exp(-z))
+        return sum(rng.random() < p for _ in range(runs)), runs
+    return trial
+
+def test_bayesian_search_finds_threshold_with_few_runs():
+    strategy = BayesianThreshold(0.0, 0.5, slope=0.02)
+    result = asyncio.run(search(_noisy_trial(0.3, 0.01), strategy, tolerance=0.05, parameter="noise"))
+    lo, hi = result.interval
+    assert result.converged and lo <= 0.3 <= hi and hi - lo <= 0.05
+    # A 0.01-step grid with the same 4 runs per point would take 51 trials
+    assert len(result.trials) < 15
+    assert abs(result.threshold - 0.3) < 0.03
+
+def test_bisection_brackets_integer_threshold():
+    # Success rises with the value (e.g. energy); whole values only
+    strategy = Bisection(0, 64, increasing=True, integer=True)
+    result = asyncio.run(search(_noisy_trial(21.5, 0.01, increasing=True), strategy, tolerance=1))
+    assert result.interval == (21, 22) and result.converged
+    assert all(t.value == int(t.value) for t in result.trials)
+    assert len(result.trials) == 6
+
+def test_apply_parameter_sets_nested_mission_params():
+    config = {"missions": [{"name": "A", "type": "sequence", "params": {"sequence": {"name": "primes"}}},
+                           {"name": "B", "type": "grid"}]}
+    updated = apply_parameter(config, "params.sequence.length", 7, missions=["A"])
+    assert updated["missions"][0]["params"]["sequence"] == {"name": "primes", "length": 7}
+    assert "params" not in updated["missions"][1] and "length" not in config["missions"][0]["params"]["sequence"]
+    assert apply_parameter(config, "params.size", 9)["missions"][1]["params"] == {"size": 9}
+    with pytest.raises(ValueError):
+        apply_parameter(config, "turns", 3)
+
+def test_campaign_trial_runs_headless_campaigns():
+    with open("experiments/test_mock.yaml") as f:
+        config = yaml.safe_load(f)
+    trial = campaign_trial(config, "energy", repeats=3, seed=1)
+    assert asyncio.run(trial(500.0)) == (3, 3)
+    trial = campaign_trial(config, "params.sequence", missions=["Mock Sequence"])
+    successes, runs = asyncio.run(trial([1, 2]))
+    assert runs == 1
+
+def test_strategies_drive_integer_mission_params():
+    config = {"rocky_provider": "mock", "grace_provider": "mock", "settings": {"max_turns": 3},
+              "missions": [{"name": "Walk", "type": "grid", "params": {"size": 3}}]}
+    trial = campaign_trial(config, "params.size")
+    for strategy in (Bisection(3, 9, integer=True), BayesianThreshold(3, 9, integer=True)):
+        result = asyncio.run(search(trial, strategy, tolerance=1, max_trials=2))
+        assert [type(t.value) for t in result.trials] == [int, int]
+        assert all(t.runs == 1 for t in result.trials)
+    with pytest.raises(ValueError, match="integer"):
+        asyncio.run(trial(4.5))
+
+def test_converged_stops_count_as_successes():
+    config = {"rocky_provider": "mock", "grace_provider": "mock",
+              "settings": {"stopping": {"consecutive_correct": 2}},
+              "missions": [{"name": "Sync", "type": "time", "params": {"interval": 1}}]}
+    assert asyncio.run(campaign_trial(config, "noise")(0.0)) == (1, 1)
@@ -0,0 +1,68 @@
+import copy
+import pytest
+from hail_mary.environment import PetrovaTask
+from hail_mary.loader import load_campaign_from_config
+from hail_mary.mission_registry import MissionConfigError, build_mission
+from hail_mary.sequences import Primes, build_sequence, compile_expression, get_sequence
+
+def _naive_primes(n):
+    primes, k = [], 2
+    while len(primes) < n:
+        if all(k % p for p in primes if p * p <= k):
+            primes.append(k)
+        k += 1
+    return primes
+
+def test_segmented_sieve_matches_trial_division():
+    primes = Primes()
+    # Crosses several segment boundaries
+    assert list(primes.take(0, length=5000)) == _naive_primes(5000)
+    assert primes[99_999] == 1_299_709
+    assert get_sequence("primes") is get_sequence("primes")
+
+def test_registry_sequences_and_ranges():
+    assert build_sequence({"name": "fibonacci", "start": 5, "length": 4}) == [8, 13, 21, 34]
+    assert build_sequence({"name": "squares", "stop": 4}) == [1, 4, 9, 16]
+    assert build_sequence({"name": "powers", "base": 3, "length": 4}) == [1, 3, 9, 27]
+    assert build_sequence({"expr": "n**2 + max(n, 2)", "length": 3}) == [3, 6, 12]
+    assert build_sequence([5, 6]) == [5, 6]
+    with pytest.raises(ValueError):
+        build_sequence({"name": "nope", "length": 3})
+    with pytest.raises(ValueError):
+        compile_expression("__import__('os').getcwd()")
+    with pytest.raises(ValueError):
+        build_sequence({"name": "primes"}) # No length or stop
+
+def test_expressions_are_bounded_and_checked_at_load():
+    runaway = compile_expression("n**n**n")
+    assert runaway(3) == 3 ** 27
+    with pytest.raises(ValueError, match="bits"):
+        runaway(10)
+    with pytest.raises(ValueError):
+        compile_expression("9" * 30000)
+    with pytest.raises(ValueError):
+        compile_expression("2**-n")(1)
+    with pytest.raises(ValueError, match="term 0"):
+        build_sequence({"expr": "n % (n-1)", "length": 5})
+    with pytest.raises(MissionConfigError):
+        build_mission("sequence", {"sequence": {"expr": "10**10**6", "length": 3}})
+
+def test_long_lazy_sequence_mission_from_yaml():
+    missions, _ = load_campaign_from_config({"missions": [
+        {"name": "Big", "type": "sequence", "params": {"sequence": {"name": "primes", "start": 10, "length": 200_000}}},
+    ]})
+    mission = missions[0]
+    assert len(mission.sequence) == 200_000
+    assert mission.expected_action() == 31
+    rocky_prompt, _ = mission.get_prompts()
+    assert "(200000 terms of primes)" in rocky_prompt and len(rocky_prompt) < 2000
+    assert copy.deepcopy(mission).sequence is mission.sequence
+
+def test_petrova_task_keeps_its_phenomena():
+    assert list(PetrovaTask("primes").get_data_points()) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert list(PetrovaTask("astrophage_growth").get_data_points())[-1] == 512
+    task = PetrovaTask("squares", length=100_000)
+    assert task.verify_prediction(10_000_000_000, 99_999)
+    assert not task.verify_prediction(4, 100_000)
+    with pytest.raises(ValueError):
+        PetrovaTask("sunspots")
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import urllib.error
+import urllib.request
+from hail_mary.httpd import connect_websocket
+from hail_mary.server import SimulationServer
+
+CAMPAIGN = """
+personas: {rocky_provider: mock, grace_provider: mock}
+energy: 500
+missions:
+  - {name: Count, type: sequence, params: {sequence: [1, 2, 3]}}
+  - {name: Clock, type: time, params: {interval: 1}}
+"""
+
+def _request(url: str, method: str = "GET", body: str = None):
+    req = urllib.request.Request(url, data=body.encode() if body else None, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+async def _call(*args, **kwargs):
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: _request(*args, **kwargs))
+
+def test_streams_a_paused_campaign_after_resume():
+    async def scenario():
+        async with SimulationServer() as server:
+            status, created = await _call(f"{server.base_url}/campaigns?paused=1", "POST", CAMPAIGN)
+            assert (status, created["status"]) == (201, "paused")
+
+            ws = await connect_websocket(server.host, server.port, f"/campaigns/{created['id']}/stream")
+            hello = json.loads(await ws.receive())
+            await ws.send_json({"command": "resume"})
+            events = [hello]
+            while True:
+                message = await ws.receive()
+                if message is None:
+                    break
+                events.append(json.loads(message))
+            _, final = await _call(f"{server.base_url}/campaigns/{created['id']}")
+            return events, final
+
+    events, final = asyncio.run(scenario())
+    types = [e["type"] for e in events]
+    assert types[0] == "Hello" and types[-1] == "SessionEnded"
+    assert types.count("MissionStarted") == 2
+    assert "ExchangeTransmitted" in types and "CampaignFinished" in types
+    assert final["status"] == "finished"
+    assert [r["mission"] for r in final["results"]] == ["Count", "Clock"]
+
+def test_many_sessions_share_one_loop_and_cancel():
+    async def scenario():
+        async with SimulationServer() as server:
+            created = [await _call(f"{server.base_url}/campaigns", "POST", CAMPAIGN) for _ in range(10)]
+            _, held = await _call(f"{server.base_url}/campaigns?paused=1", "POST", CAMPAIGN)
+            await asyncio.sleep(0.2)
+            cancelled = await _call(f"{server.base_url}/campaigns/{held['id']}/cancel", "POST")
+            await asyncio.sleep(0.05)
+            _, sessions = await _call(f"{server.base_url}/campaigns")
+            return created, cancelled, sessions
+
+    created, cancelled, sessions = asyncio.run(scenario())
+    assert all(status == 201 for status, _ in created)
+    assert cancelled[0] == 200
+    statuses = sorted(s["status"] for s in sessions)
+    assert statuses == ["cancelled"] + ["finished"] * 10
+
+def test_offline_server_rejects_remote_providers():
+    async def scenario():
+        async with SimulationServer() as server:
+            return await _call(f"{server.base_url}/campaigns", "POST",
+                               CAMPAIGN.replace("grace_provider: mock", "grace_provider: openai"))
+
+    status, body = asyncio.run(scenario())
+    assert status == 400
+    assert "openai" in body["error"]
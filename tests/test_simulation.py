@@ -1,4 +1,8 @@
-from hail_mary.protocol import ContactLog, Exchange
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+import pytest
+from hail_mary.protocol import ColumnarContactLog, ContactLog, Exchange, TextStore
 from hail_mary.channel import CommChannel
 from hail_mary.mission import SequenceMission
 
@@ -33,3 +37,66 @@ def test_sequence_mission():
     rocky_prompt, grace_prompt = mission.get_prompts()
     assert "1, 2, 3" in rocky_prompt
     assert "binary signals" in grace_prompt
+
+def test_channel_arrival_time():
+    channel = CommChannel(propagation_delay=2.0, bandwidth=4.0)
+    # 8 bits at 4 bit/s take 2 s on the wire, then 2 s in flight
+    assert channel.arrival_time("Rocky", "10101010", sent_at=0.0) == 4.0
+    # The next transmission queues behind the first on the same link
+    assert channel.arrival_time("Rocky", "1111", sent_at=1.0) == 5.0
+    assert channel.arrival_time("Grace", "1111", sent_at=1.0) == 4.0
+
+def test_contact_log_visibility():
+    log = ContactLog(mission_name="Lag")
+    log.record_exchange(Exchange(sender="Rocky", thought="", chords="1", sent_at=0.0, received_at=3.0))
+    log.record_exchange(Exchange(sender="Grace", thought="", chords="0", sent_at=1.0, received_at=4.0))
+    assert [e.chords for e in log.visible_to("Grace", 2.0).history] == ["0"]
+    assert [e.chords for e in log.visible_to("Grace", 3.0).history] == ["1", "0"]
+    assert [e.chords for e in log.visible_to("Rocky", 3.5).history] == ["1"]
+
+def test_exchange_is_compact_and_round_trips():
+    store = TextStore(compress_above=16)
+    prompt = "Instructions. " * 100
+    ex = Exchange(sender="Grace", thought="t", chords="10x1", action=2, raw_request=prompt,
+                  raw_response="ACTION: 2", store=store)
+    assert (ex.chords, ex.length, ex.popcount) == ("10x1", 4, 2)
+    assert ex.raw_request == prompt and ex.raw_response == "ACTION: 2"
+    assert Exchange(sender="Grace", thought="t", chords="1", raw_request=prompt, store=store)._request_id == ex._request_id
+    with pytest.raises(FrozenInstanceError):
+        ex.chords = "0"
+    assert copy.deepcopy(ex) is ex
+    assert pickle.loads(pickle.dumps(ex)) == ex
+    assert ex.replace(action=3).action == 3
+    # Exchanges without raw text hold no store; with text and no store they get their own
+    assert Exchange(sender="Rocky", thought="", chords="1")._store is None
+    assert Exchange(sender="Rocky", thought="", chords="1", raw_response="r").raw_response == "r"
+    # Anything that is not a 0/1/x signal is kept verbatim
+    assert Exchange(sender="Rocky", thought="", chords="1 0").chords == "1 0"
+
+def test_each_log_owns_its_text_store():
+    first, second = ContactLog("A"), ContactLog("B")
+    first.record_exchange(Exchange(sender="Grace", thought="", chords="1", raw_request="prompt", store=first.store))
+    assert (len(first.store), len(second.store)) == (1, 0)
+    assert copy.deepcopy(first).store is first.store
+    assert first.visible_to("Grace", 0.0).history[0].raw_request == "prompt"
+
+def test_columnar_log_matches_plain_log():
+    exchanges = [
+        Exchange(sender="Rocky", thought="", chords="1101"),
+        Exchange(sender="Grace", thought="", chords="11", action=3),
+        Exchange(sender="Rocky", thought="", chords=""),
+        Exchange(sender="Grace", thought="", chords="0001000", action=None),
+    ]
+    plain, columnar = ContactLog("P"), ColumnarContactLog("C")
+    for log in (plain, columnar):
+        log.metadata["labels"] = {"Rocky": "A"}
+        for ex in exchanges:
+            log.record_exchange(ex)
+    assert columnar.signal_history == plain.signal_history
+    assert columnar.last_chords == plain.last_chords == "0001000"
+    assert (columnar.bits_sent(), columnar.ones_sent("Rocky"), columnar.bits_sent("Grace")) == (13, 3, 9)
+    assert columnar.action_series("Grace") == [3, None]
+    # Actions beyond the 64-bit column are kept aside
+    for action in (2 ** 63, -2 ** 63, -2 ** 70):
+        columnar.record_exchange(Exchange(sender="Grace", thought="", chords="1", action=action))
+    assert columnar.action_series("Grace") == [3, None, 2 ** 63, -2 ** 63, -2 ** 70]
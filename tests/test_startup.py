@@ -0,0 +1,49 @@
+import re
+import subprocess
+import sys
+import pytest
+from hail_mary.llm.registry import get_client_class, register_provider, PROVIDERS
+
+# Cumulative import time of the CLI entry point, measured with `python -X importtime`.
+STARTUP_BUDGET_MS = 500
+HEAVY_MODULES = ("openai", "anthropic", "rich", "gemini")
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+def test_cli_import_skips_heavy_modules():
+    code = f"import sys, hail_mary.main; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    assert _run(code).stdout.strip() == "[]"
+
+def test_mock_campaign_setup_skips_heavy_modules():
+    code = (
+        "import sys\n"
+        "from hail_mary.loader import load_campaign_from_yaml\n"
+        "from hail_mary.agents import MockEridian\n"
+        "from hail_mary.campaign import CampaignManager\n"
+        "from hail_mary.channel import CommChannel\n"
+        "missions, _ = load_campaign_from_yaml('experiments/test_mock.yaml')\n"
+        "CampaignManager((MockEridian('Rocky', 'Eridian'), MockEridian('Grace', 'Human')), CommChannel())\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    assert _run(code).stdout.strip() == "[]"
+
+def test_cli_import_time_budget():
+    stderr = _run("import hail_mary.main").stderr
+    match = re.search(r"\|\s*(\d+)\s*\|\s*hail_mary\.main\s*$", stderr, re.MULTILINE)
+    assert match, "hail_mary.main missing from -X importtime output"
+    cumulative_ms = int(match.group(1)) / 1000
+    assert cumulative_ms < STARTUP_BUDGET_MS, f"CLI import took {cumulative_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)"
+
+def test_registry_resolves_lazily():
+    from hail_mary.llm.clients import OpenAIClient
+    assert get_client_class("openai") is OpenAIClient
+    with pytest.raises(ValueError):
+        get_client_class("carrier-pigeon")
+
+def test_register_provider():
+    register_provider("fake-openai", "hail_mary.llm.clients:OpenAIClient")
+    try:
+        assert get_client_class("fake-openai").__name__ == "OpenAIClient"
+    finally:
+        PROVIDERS.pop("fake-openai")
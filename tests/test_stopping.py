@@ -0,0 +1,55 @@
+from hail_mary.agents import MockEridian, LLMAlienAgent
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.llm.base import LLMClient
+from hail_mary.mission import GridMission, SequenceMission, TimeMission
+from hail_mary.stopping import build_stopping_policies
+
+class ScriptedClient(LLMClient):
+    async def get_generated_text(self, prompt: str) -> str:
+        response = "THOUGHT: guessing\nSIGNAL: 1\nACTION: 1"
+        self._record_usage(100, prompt, response)
+        return response
+
+def _run(mission, stopping, grace=None):
+    manager = CampaignManager(
+        (MockEridian("Rocky", "Eridian"), grace or MockEridian("Grace", "Human")),
+        CommChannel(), verbose=False, save_log=False,
+        stopping=build_stopping_policies(stopping)
+    )
+    manager.run_campaign([mission])
+    return manager.results[0]
+
+def test_stops_on_consecutive_correct():
+    mission = TimeMission(interval=1)
+    record = _run(mission, {"consecutive_correct": 2})
+    assert record["stop_reason"] == "converged"
+    # Convergence is a policy decision, not a completion reported by the mission
+    assert (record["stop_turn"], record["turns_to_success"]) == (2, None)
+    assert record["summary"] == {"sync_success": True}
+
+def test_fails_fast_on_stagnation():
+    # Mock Grace always answers 1, so a sequence of 5s never progresses
+    mission = SequenceMission([5] * 10)
+    record = _run(mission, {"stagnation": 3})
+    assert record["stop_reason"] == "stagnated"
+    assert len(record["history"]) == 6
+    assert record["turns_to_success"] is None
+
+def test_stagnation_ignores_unscored_moves():
+    # Mock Grace always moves down (action 1), which walks straight to a target below the start
+    mission = GridMission(size=5, target=[4, 0])
+    record = _run(mission, {"stagnation": 3})
+    assert record["stop_reason"] == "success"
+    assert record["summary"]["final_pos"] == (4, 0) and record["turns_to_success"] == 4
+
+def test_token_budget_caps_mission():
+    grace = LLMAlienAgent("Grace", "Human", client=ScriptedClient())
+    # 100 tokens for the initial thought, then 100 per turn
+    record = _run(SequenceMission([5] * 10), {"max_tokens": 250}, grace=grace)
+    assert record["stop_reason"] == "token_budget"
+    assert len(record["history"]) == 4
+
+def test_natural_completion_is_recorded():
+    record = _run(SequenceMission([1, 1]), {"stagnation": 3})
+    assert record["stop_reason"] == "success"
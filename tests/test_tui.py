@@ -72,3 +72,44 @@ def test_tui_history_limit(tui):
     assert "R0" not in output
     # R14 should be there
     assert "R14" in output
+
+def test_tui_post_is_applied_on_render(tui):
+    tui.post(rocky_thought="Queued thought.", energy=42.0)
+    tui.post_turn("101", "1")
+    # Nothing changes until the next frame drains the queue
+    assert tui.rocky_thought == "Awaiting signal..."
+    tui.__rich__()
+    assert tui.rocky_thought == "Queued thought."
+    assert tui.energy_remaining == 42.0
+    assert tui.history == [("101", "1")]
+
+def test_tui_rerenders_only_dirty_panels(tui, monkeypatch):
+    tui.__rich__()
+    calls = []
+    for name in ("_get_header", "_get_footer", "_get_rocky_panel", "_get_grace_panel", "_get_signal_history"):
+        original = getattr(tui, name)
+        monkeypatch.setattr(tui, name, lambda original=original, name=name: calls.append(name) or original())
+
+    tui.__rich__()
+    assert calls == []
+    tui.post(grace_action=3)
+    tui.__rich__()
+    assert calls == ["_get_grace_panel"]
+
+def test_tui_playback_delay():
+    assert SimulationTUI("M", "O", playback_speed=4.0).delay(1.0) == 0.25
+    assert SimulationTUI("M", "O", playback_speed=0).delay(1.0) == 0.0
+
+def test_replay_mission_from_log():
+    import asyncio
+    import json
+    from hail_mary.replay import replay_mission
+    with open("logs/campaign_log_20260212_213945.json") as f:
+        mission = json.load(f)[0]
+
+    tui = SimulationTUI(mission["mission"], "replay", playback_speed=0, auto_advance=True)
+    asyncio.run(replay_mission(tui, mission))
+    tui.drain()
+    assert tui.turn_count == (len(mission["history"]) + 1) // 2
+    assert tui.energy_remaining == pytest.approx(mission["energy_remaining"])
+    assert "REPLAY" in tui.status_message
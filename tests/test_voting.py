@@ -0,0 +1,54 @@
+import asyncio
+from hail_mary.agents import LLMAlienAgent, MockEridian, majority_vote
+from hail_mary.campaign import CampaignManager
+from hail_mary.channel import CommChannel
+from hail_mary.fakeserver import FakeLLMServer, ResponseScript
+from hail_mary.llm.base import LLMClient
+from hail_mary.loadtest import make_client
+from hail_mary.mission import TimeMission
+
+REPLIES = [
+    "THOUGHT: a\nSIGNAL: 11\nACTION: 3",
+    "THOUGHT: b\nSIGNAL: 10\nACTION: 5",
+    "THOUGHT: c\nSIGNAL: 11\nACTION: 3",
+]
+
+class RoundRobinClient(LLMClient):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def get_generated_text(self, prompt: str) -> str:
+        self.calls += 1
+        return REPLIES[(self.calls - 1) % len(REPLIES)]
+
+def test_majority_vote_prefers_action_then_signal():
+    candidates = [("x", "1", 2), ("y", "0", None), ("z", "11", 2), ("w", "11", 2)]
+    assert majority_vote(candidates) == (2, 0.75)
+    # No ACTIONs: vote on the SIGNAL
+    assert majority_vote([("x", "1", None), ("y", "0", None), ("z", "0", None)]) == (1, 2 / 3)
+
+def test_agent_votes_over_fanned_out_candidates():
+    grace = LLMAlienAgent("Grace", "Human", client=RoundRobinClient(), samples=3)
+    manager = CampaignManager((MockEridian("Rocky", "Eridian"), grace), CommChannel(),
+                              verbose=False, save_log=False)
+    manager.analyst = None
+    manager.run_campaign([TimeMission(interval=3)])
+
+    grace_ex = manager.results[0]["history"][1]
+    assert grace_ex["action"] == 3
+    assert grace_ex["chords"] == "11"
+    assert grace_ex["agreement"] == 2 / 3
+    assert sorted(c["action"] for c in grace_ex["candidates"]) == [3, 3, 5]
+
+def test_native_n_uses_a_single_request():
+    script = ResponseScript(responses=REPLIES)
+
+    async def scenario():
+        async with FakeLLMServer(script=script) as server:
+            candidates = await make_client("openai", server.base_url).get_generated_candidates("hi", 3)
+            return candidates, server.stats.requests
+
+    candidates, requests = asyncio.run(scenario())
+    assert candidates == REPLIES
+    assert requests == {"openai": 1}